@@ -0,0 +1,271 @@
+"""Partidas automáticas de Arkanoid sin ventana ni sonido
+
+Un bot mueve la pala hacia donde va a caer la pelota y apunta el rebote
+hacia los ladrillos que quedan. Se juegan N partidas con semillas
+consecutivas repartidas en varios procesos y se reporta cuántas veces se
+completa cada nivel, cuántos frames lleva completarlo y cuántos ticks de
+simulación por segundo corre cada núcleo. Con la misma semilla, los mismos
+ajustes y el mismo paquete de niveles los resultados son idénticos.
+
+Uso:
+    python autoplay.py [--partidas N] [--semilla S] [--procesos P]
+                       [--max-frames F] [--paquete archivo.pack]
+                       [--ajuste BALL_SPEED_INCREMENT=0.2 ...] [--json]
+"""
+import argparse
+import ast
+import json
+import os
+import random
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+DIRECTORIO = os.path.dirname(os.path.abspath(__file__))
+sys.path.append(os.path.dirname(DIRECTORIO))  # Para importar rendimiento
+
+from rendimiento import preparar_sin_ventana, base_en_memoria
+preparar_sin_ventana()
+
+import numpy as np
+import main as arkanoid
+from levels import LevelManager
+from settings import *
+
+
+class SilentSounds:
+    """Reemplaza a SoundManager: no abre el mezclador ni genera sonidos"""
+    
+    def play(self, sound_name):
+        pass
+
+
+class NoBrickLayer:
+    """Reemplaza a BrickLayer: sin dibujo no hace falta la capa de ladrillos"""
+    
+    def __init__(self, bricks):
+        pass
+    
+    def refresh(self, brick):
+        pass
+    
+    def draw(self, screen):
+        pass
+
+
+# Juego del proceso trabajador, creado una vez y reutilizado entre partidas
+_juego = None
+
+
+def aplicar_ajustes(ajustes):
+    """Cambia constantes de settings en todos los módulos del juego
+    
+    Cada módulo hizo `from settings import *`, así que el valor se cambia
+    en cada módulo del juego que tenga la constante.
+    """
+    for nombre, valor in ajustes.items():
+        for modulo in list(sys.modules.values()):
+            archivo = getattr(modulo, '__file__', None) or ''
+            if os.path.dirname(os.path.abspath(archivo)) == DIRECTORIO and hasattr(modulo, nombre):
+                setattr(modulo, nombre, valor)
+
+
+def iniciar_trabajador(ajustes, paquete):
+    """Crea el juego del proceso sin sonido, sin capa de ladrillos y con base en memoria"""
+    global _juego
+    sys.stdout = open(os.devnull, 'w')  # Sin el "✓ Puntuación guardada" de cada partida
+    aplicar_ajustes(ajustes)
+    arkanoid.SoundManager = SilentSounds
+    arkanoid.BrickLayer = NoBrickLayer
+    base_en_memoria(arkanoid, juegos=[GAME_NAME])
+    
+    _juego = arkanoid.ArkanoidGame()
+    _juego.use_mouse = False  # La pala se mueve con target_x
+    if paquete:
+        _juego.level_manager = LevelManager(paquete)
+
+
+def caida_prevista(pelota):
+    """Posición x en la que la pelota llegará a la altura de la pala"""
+    if pelota.vy <= 0:
+        return pelota.x
+    
+    frames = (PADDLE_Y - pelota.radius - pelota.y) / pelota.vy
+    x = pelota.x + pelota.vx * max(frames, 0)
+    
+    # Reflejar en las paredes hasta quedar dentro de la pantalla
+    izquierda = pelota.radius
+    ancho = WINDOW_WIDTH - 2 * pelota.radius
+    x = (x - izquierda) % (2 * ancho)
+    if x > ancho:
+        x = 2 * ancho - x
+    return izquierda + x
+
+
+def mover_pala(juego):
+    """Coloca la pala bajo la próxima pelota en caer, apuntando a los ladrillos"""
+    if not juego.balls:
+        return
+    
+    # La pelota que baja más cerca de la pala; si ninguna baja, la más baja
+    bajando = [b for b in juego.balls if b.vy > 0]
+    if bajando:
+        pelota = min(bajando, key=lambda b: (PADDLE_Y - b.y) / b.vy)
+    else:
+        pelota = max(juego.balls, key=lambda b: b.y)
+    caida = caida_prevista(pelota)
+    
+    # Golpear con el lado de la pala que manda la pelota hacia los ladrillos
+    restantes = [b.x + b.width / 2 for b in juego.brick_grid.live
+                 if b.type != BRICK_INDESTRUCTIBLE]
+    objetivo = sum(restantes) / len(restantes) if restantes else WINDOW_WIDTH / 2
+    impacto = max(-0.5, min(0.5, (objetivo - caida) / (WINDOW_WIDTH / 2)))
+    
+    pala = juego.paddle
+    pala.target_x = caida - impacto * pala.width / 2 - pala.width / 2
+
+
+def jugar_partida(semilla, max_frames):
+    """Juega una partida completa y retorna cómo le fue en cada nivel"""
+    random.seed(semilla)
+    np.random.seed(semilla % 2**32)
+    juego = _juego
+    juego.start_game()
+    
+    niveles = []
+    ticks = 0
+    frames = 0
+    inicio = time.process_time()
+    while True:
+        mover_pala(juego)
+        juego.update(1 / FPS)
+        ticks += 1
+        frames += 1
+        
+        if juego.state == "victory":
+            niveles.append({'nivel': juego.current_level, 'completado': True, 'frames': frames})
+            if juego.current_level >= juego.level_manager.get_level_count() - 1:
+                break
+            juego.next_level()
+            frames = 0
+        elif juego.state != "playing":
+            niveles.append({'nivel': juego.current_level, 'completado': False, 'frames': frames})
+            break
+        elif frames >= max_frames:
+            # Pelota atrapada en un ciclo sin ladrillos alcanzables
+            niveles.append({'nivel': juego.current_level, 'completado': False, 'frames': frames})
+            break
+    
+    return {
+        'semilla': semilla,
+        'niveles': niveles,
+        'puntuacion': juego.score,
+        'ganada': all(n['completado'] for n in niveles),
+        'ticks': ticks,
+        'segundos_cpu': time.process_time() - inicio,
+    }
+
+
+def resumir(partidas, procesos, segundos):
+    """Combina los resultados de todas las partidas"""
+    por_nivel = {}
+    for partida in partidas:
+        for nivel in partida['niveles']:
+            datos = por_nivel.setdefault(nivel['nivel'], {'intentos': 0, 'completados': 0, 'frames': 0})
+            datos['intentos'] += 1
+            if nivel['completado']:
+                datos['completados'] += 1
+                datos['frames'] += nivel['frames']
+    
+    niveles = []
+    for indice in sorted(por_nivel):
+        datos = por_nivel[indice]
+        niveles.append({
+            'nivel': indice + 1,
+            'intentos': datos['intentos'],
+            'completados': datos['completados'],
+            'tasa_completado': round(datos['completados'] / datos['intentos'], 3),
+            'frames_promedio': (round(datos['frames'] / datos['completados'], 1)
+                                if datos['completados'] else None),
+        })
+    
+    ticks = sum(p['ticks'] for p in partidas)
+    segundos_cpu = sum(p['segundos_cpu'] for p in partidas)
+    return {
+        'partidas': len(partidas),
+        'procesos': procesos,
+        'partidas_ganadas': sum(p['ganada'] for p in partidas),
+        'puntuacion_promedio': round(sum(p['puntuacion'] for p in partidas) / len(partidas), 1),
+        'niveles': niveles,
+        'ticks': ticks,
+        'ticks_por_segundo_por_nucleo': round(ticks / segundos_cpu, 1) if segundos_cpu else 0.0,
+        'ticks_por_segundo_total': round(ticks / segundos, 1) if segundos else 0.0,
+    }
+
+
+def reportar(resumen, como_json=False):
+    """Imprime el resumen como tabla o como una línea JSON"""
+    if como_json:
+        print(json.dumps(resumen, ensure_ascii=False))
+        return
+    
+    print("=" * 60)
+    print("🤖 ARKANOID AUTOMÁTICO")
+    print("=" * 60)
+    print(f"Partidas:             {resumen['partidas']} en {resumen['procesos']} procesos")
+    print(f"Partidas ganadas:     {resumen['partidas_ganadas']}")
+    print(f"Puntuación promedio:  {resumen['puntuacion_promedio']}")
+    print(f"\n{'Nivel':<8}{'intentos':>10}{'completado':>12}{'frames prom.':>14}")
+    for nivel in resumen['niveles']:
+        frames = nivel['frames_promedio'] if nivel['frames_promedio'] is not None else '-'
+        print(f"{nivel['nivel']:<8}{nivel['intentos']:>10}"
+              f"{nivel['tasa_completado'] * 100:>11.1f}%{frames:>14}")
+    print(f"\nTicks simulados:      {resumen['ticks']}")
+    print(f"Ticks/s por núcleo:   {resumen['ticks_por_segundo_por_nucleo']}")
+    print(f"Ticks/s en total:     {resumen['ticks_por_segundo_total']}")
+    print("=" * 60)
+
+
+def leer_ajuste(texto):
+    """Convierte 'NOMBRE=valor' en (nombre, valor)"""
+    nombre, separador, valor = texto.partition('=')
+    if not separador or not nombre:
+        raise argparse.ArgumentTypeError(f"se esperaba NOMBRE=valor: {texto}")
+    try:
+        return nombre, ast.literal_eval(valor)
+    except (ValueError, SyntaxError):
+        raise argparse.ArgumentTypeError(f"valor inválido para {nombre}: {valor}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Partidas automáticas de Arkanoid sin ventana")
+    parser.add_argument("--partidas", type=int, default=100)
+    parser.add_argument("--semilla", type=int, default=1,
+                        help="semilla de la primera partida; las demás usan las siguientes")
+    parser.add_argument("--procesos", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--max-frames", type=int, default=FPS * 180,
+                        help="frames por nivel antes de darlo por perdido (por defecto 3 minutos)")
+    parser.add_argument("--paquete", help="paquete de niveles a jugar (por defecto el clásico)")
+    parser.add_argument("--ajuste", type=leer_ajuste, action="append", default=[],
+                        help="cambiar una constante de settings, p. ej. POWERUP_PROBABILITY=0.3")
+    parser.add_argument("--json", action="store_true",
+                        help="imprimir el resumen como una línea JSON")
+    args = parser.parse_args()
+    
+    ajustes = dict(args.ajuste)
+    for nombre in ajustes:
+        if not hasattr(sys.modules['settings'], nombre):
+            parser.error(f"settings no tiene la constante {nombre}")
+    
+    semillas = range(args.semilla, args.semilla + args.partidas)
+    inicio = time.perf_counter()
+    with ProcessPoolExecutor(args.procesos, initializer=iniciar_trabajador,
+                             initargs=(ajustes, args.paquete)) as pool:
+        partidas = list(pool.map(jugar_partida, semillas, [args.max_frames] * args.partidas,
+                                 chunksize=max(1, args.partidas // (args.procesos * 4))))
+    segundos = time.perf_counter() - inicio
+    
+    reportar(resumir(partidas, args.procesos, segundos), args.json)
+
+
+if __name__ == "__main__":
+    main()
@@ -3,6 +3,78 @@ import pygame
 import math
 import random
 from settings import *
+from collision import sweep_circle_rect
+
+
+# Paredes como rectángulos fuera de la pantalla (la parte inferior queda abierta)
+LEFT_WALL = pygame.Rect(-100, -100, 100, WINDOW_HEIGHT + 200)
+RIGHT_WALL = pygame.Rect(WINDOW_WIDTH, -100, 100, WINDOW_HEIGHT + 200)
+CEILING = pygame.Rect(-100, -100, WINDOW_WIDTH + 200, 100)
+
+# Tope de rebotes que se resuelven dentro de un mismo paso
+MAX_HITS_PER_STEP = 8
+
+# Posiciones guardadas para la estela
+TRAIL_LENGTH = 5
+
+# Colores de los sprites; el de fondo es transparente
+SPRITE_KEY = (0, 0, 0)
+TRAIL_COLOR = (255, 255, 255)
+TRAIL_COLOR_PIERCING = (255, 100, 100)
+GLOW_COLOR = (255, 150, 150)
+
+# Sprites ya dibujados y disposición de la estela, por tipo y parámetros
+_sprites = {}
+
+
+def _bake(radius, draw):
+    """Crea un sprite cuadrado con centro en (c, c) y lo retorna con c"""
+    center = radius + 1
+    surface = pygame.Surface((center * 2 + 1, center * 2 + 1))
+    surface.fill(SPRITE_KEY)
+    surface.set_colorkey(SPRITE_KEY, pygame.RLEACCEL)
+    draw(surface, center)
+    return surface, center
+
+
+def trail_sprite(radius, piercing):
+    """Círculo de la estela de un radio dado"""
+    key = ('trail', radius, piercing)
+    if key not in _sprites:
+        color = TRAIL_COLOR_PIERCING if piercing else TRAIL_COLOR
+        _sprites[key] = _bake(radius, lambda surface, c: pygame.draw.circle(
+            surface, color, (c, c), radius))
+    return _sprites[key]
+
+
+def trail_layout(radius, count, piercing):
+    """Qué posiciones de la estela se dibujan y con qué sprite, según cuántas hay
+    
+    La estela va de la posición más vieja a la penúltima y cada círculo
+    crece con su antigüedad; retorna (índice, sprite, desplazamiento).
+    """
+    key = ('layout', radius, count, piercing)
+    if key not in _sprites:
+        layout = []
+        for i in range(1, count - 1):
+            size = int(radius * (i / count))
+            if size > 0:
+                layout.append((i,) + trail_sprite(size, piercing))
+        _sprites[key] = layout
+    return _sprites[key]
+
+
+def ball_sprite(piercing):
+    """Pelota con su brillo central y, si es perforante, el halo"""
+    key = ('ball', piercing)
+    if key not in _sprites:
+        def draw(surface, c):
+            if piercing:
+                pygame.draw.circle(surface, GLOW_COLOR, (c, c), BALL_RADIUS + 2)
+            pygame.draw.circle(surface, BALL_COLOR, (c, c), BALL_RADIUS)
+            pygame.draw.circle(surface, (255, 255, 255), (c - 2, c - 2), BALL_RADIUS // 3)
+        _sprites[key] = _bake(BALL_RADIUS + 2, draw)
+    return _sprites[key]
 
 
 class Ball:
@@ -26,37 +98,16 @@ class Ball:
         self.piercing = False
         self.piercing_timer = 0
         
-        # Trail effect
-        self.trail_positions = []
-        self.max_trail_length = 5
-        
+        # Estela: búfer circular de posiciones, sin mover elementos
+        self.trail_positions = [None] * TRAIL_LENGTH
+        self.trail_head = 0  # Próxima posición a escribir
+        self.trail_count = 0
+    
     def update(self, delta_time):
-        """Actualiza la posición de la pelota"""
+        """Actualiza los efectos y el límite de velocidad de la pelota"""
         if not self.active:
             return
         
-        # Mover pelota
-        self.x += self.vx
-        self.y += self.vy
-        
-        # Guardar posición para trail
-        self.trail_positions.append((self.x, self.y))
-        if len(self.trail_positions) > self.max_trail_length:
-            self.trail_positions.pop(0)
-        
-        # Rebotar en paredes laterales
-        if self.x - self.radius <= 0:
-            self.x = self.radius
-            self.vx = abs(self.vx)
-        elif self.x + self.radius >= WINDOW_WIDTH:
-            self.x = WINDOW_WIDTH - self.radius
-            self.vx = -abs(self.vx)
-        
-        # Rebotar en techo
-        if self.y - self.radius <= 0:
-            self.y = self.radius
-            self.vy = abs(self.vy)
-        
         # Actualizar timer de piercing
         if self.piercing_timer > 0:
             self.piercing_timer -= delta_time
@@ -92,12 +143,78 @@ class Ball:
         # Colocar pelota sobre la pala
         self.y = paddle_rect.top - self.radius
     
-    def bounce_brick(self, brick_rect, side='top'):
-        """Rebota en un ladrillo"""
-        if side in ['top', 'bottom']:
-            self.vy = -self.vy
-        else:
-            self.vx = -self.vx
+    def reflect(self, nx, ny):
+        """Refleja la velocidad respecto a la normal de la superficie tocada"""
+        dot = self.vx * nx + self.vy * ny
+        self.vx -= 2 * dot * nx
+        self.vy -= 2 * dot * ny
+    
+    def move(self, bricks_near, paddle_rect):
+        """Avanza la pelota un paso resolviendo en orden cada choque del trayecto
+        
+        En lugar de mover y después buscar superposiciones, se busca el
+        primer contacto del trayecto (paredes, pala o ladrillos cercanos),
+        se avanza hasta él, se rebota y se sigue con el resto del paso.
+        Retorna los choques en el orden en que ocurrieron como pares
+        (tipo, objeto) con tipo 'wall', 'ceiling', 'paddle' o 'brick'.
+        """
+        events = []
+        if not self.active:
+            return events
+        
+        # La pala pudo moverse sobre la pelota antes de este paso
+        if self.vy > 0 and self.get_rect().colliderect(paddle_rect):
+            self.bounce_paddle(paddle_rect)
+            events.append(('paddle', None))
+        
+        remaining = 1.0
+        pierced = set()  # Una pelota perforante golpea cada ladrillo una vez
+        for _ in range(MAX_HITS_PER_STEP):
+            dx = self.vx * remaining
+            dy = self.vy * remaining
+            
+            # Candidatos: paredes, pala y ladrillos en el área barrida
+            swept = pygame.Rect(int(min(self.x, self.x + dx) - self.radius) - 1,
+                                int(min(self.y, self.y + dy) - self.radius) - 1,
+                                int(abs(dx)) + self.radius * 2 + 3,
+                                int(abs(dy)) + self.radius * 2 + 3)
+            candidates = [('wall', LEFT_WALL), ('wall', RIGHT_WALL), ('ceiling', CEILING),
+                          ('paddle', paddle_rect)]
+            candidates += [('brick', brick) for brick in bricks_near(swept)
+                           if brick not in pierced]
+            
+            first = None
+            for kind, target in candidates:
+                rect = target.rect if kind == 'brick' else target
+                hit = sweep_circle_rect(self.x, self.y, dx, dy, self.radius, rect)
+                if hit is not None and (first is None or hit[0] < first[0][0]):
+                    first = (hit, kind, target)
+            
+            if first is None:
+                self.x += dx
+                self.y += dy
+                break
+            
+            (t, nx, ny), kind, target = first
+            self.x += dx * t
+            self.y += dy * t
+            remaining *= 1 - t
+            
+            if kind == 'paddle' and self.vy > 0:
+                self.bounce_paddle(paddle_rect)
+            elif kind == 'brick' and self.piercing:
+                pierced.add(target)
+            else:
+                self.reflect(nx, ny)
+            
+            events.append((kind, target if kind == 'brick' else None))
+        
+        # Guardar posición para trail
+        self.trail_positions[self.trail_head] = (self.x, self.y)
+        self.trail_head = (self.trail_head + 1) % TRAIL_LENGTH
+        self.trail_count = min(self.trail_count + 1, TRAIL_LENGTH)
+        
+        return events
     
     def increase_speed(self):
         """Aumenta la velocidad de la pelota"""
@@ -123,31 +240,27 @@ class Ball:
             self.piercing = True
             self.piercing_timer = POWERUP_DURATION
     
-    def draw(self, screen):
-        """Dibuja la pelota con efectos"""
+    def sprites(self):
+        """Retorna los sprites de la pelota y su estela como pares (superficie, posición)"""
         if not self.active:
-            return
+            return []
         
-        # Dibujar trail
-        for i, (tx, ty) in enumerate(self.trail_positions[:-1]):
-            alpha = int(255 * (i / len(self.trail_positions)))
-            radius = int(self.radius * (i / len(self.trail_positions)))
-            if radius > 0:
-                color = (255, 255, 255, alpha) if not self.piercing else (255, 100, 100, alpha)
-                pygame.draw.circle(screen, color[:3], (int(tx), int(ty)), radius)
-        
-        # Dibujar pelota
-        if self.piercing:
-            # Efecto de brillo para piercing
-            pygame.draw.circle(screen, (255, 150, 150), 
-                             (int(self.x), int(self.y)), self.radius + 2)
-        
-        pygame.draw.circle(screen, BALL_COLOR, 
-                         (int(self.x), int(self.y)), self.radius)
-        
-        # Brillo central
-        pygame.draw.circle(screen, (255, 255, 255), 
-                         (int(self.x - 2), int(self.y - 2)), self.radius // 3)
+        # Trail
+        blits = []
+        start = self.trail_head - self.trail_count
+        positions = self.trail_positions
+        for i, sprite, center in trail_layout(self.radius, self.trail_count, self.piercing):
+            tx, ty = positions[(start + i) % TRAIL_LENGTH]
+            blits.append((sprite, (int(tx) - center, int(ty) - center)))
+        
+        # Pelota (halo si es perforante, cuerpo y brillo central)
+        sprite, center = ball_sprite(self.piercing)
+        blits.append((sprite, (int(self.x) - center, int(self.y) - center)))
+        return blits
+    
+    def draw(self, screen):
+        """Dibuja la pelota con efectos"""
+        screen.blits(self.sprites(), doreturn=False)
     
     def is_below_screen(self):
         """Verifica si la pelota cayó por debajo de la pantalla"""
@@ -156,4 +269,9 @@ class Ball:
     def get_rect(self):
         """Retorna el rectángulo de colisión"""
         return pygame.Rect(int(self.x - self.radius), int(self.y - self.radius),
-                          self.radius * 2, self.radius * 2)
\ No newline at end of file
+                          self.radius * 2, self.radius * 2)
+
+
+def draw_balls(screen, balls):
+    """Dibuja todas las pelotas con un solo blits, en el mismo orden que una por una"""
+    screen.blits([blit for ball in balls for blit in ball.sprites()], doreturn=False)
@@ -0,0 +1,58 @@
+"""Benchmark sin ventana del bucle de Arkanoid
+
+La pala sigue a la pelota más baja; al terminar un nivel se pasa al
+siguiente y al perder se empieza de nuevo.
+
+Con --pelotas N se mantienen N pelotas en juego a la vez (prueba de
+estrés del multi-bola): las que caen se reponen desde la pala.
+
+Uso: python benchmark.py [--ticks N] [--pelotas N] [--json]
+"""
+import os
+import sys
+DIRECTORIO = os.path.dirname(os.path.abspath(__file__))
+sys.path.append(os.path.dirname(DIRECTORIO))  # Para importar rendimiento
+
+from rendimiento import preparar_sin_ventana, base_en_memoria, ejecutar_benchmark, argumentos, reportar
+preparar_sin_ventana()
+
+import random
+import main as arkanoid
+from ball import Ball
+from settings import *
+
+
+def main():
+    args = argumentos("Benchmark sin ventana de Arkanoid", lambda parser: parser.add_argument(
+        "--pelotas", type=int, default=0, help="pelotas simultáneas a mantener (0 = juego normal)"))
+    base_en_memoria(arkanoid, juegos=[GAME_NAME])
+    juego = arkanoid.ArkanoidGame()
+    juego.use_mouse = False  # La pala se mueve desde la entrada programada
+    juego.start_game()
+    
+    def entrada(tick):
+        if juego.state == "victory":
+            juego.next_level()
+        elif juego.state != "playing":
+            juego.start_game()
+        
+        # Prueba de estrés: reponer las pelotas que cayeron
+        if len(juego.balls) < args.pelotas:
+            juego.balls += [Ball(random.uniform(100, WINDOW_WIDTH - 100), PADDLE_Y - 30)
+                            for _ in range(args.pelotas - len(juego.balls))]
+        
+        if juego.balls:
+            pelota = max(juego.balls, key=lambda b: b.y)
+            juego.paddle.target_x = pelota.x - juego.paddle.width / 2
+    
+    def actualizar():
+        juego.update(1 / FPS)
+    
+    resultado = ejecutar_benchmark("Arkanoid", actualizar, juego.draw, entrada,
+                                   args.ticks, args.calentamiento, args.memoria, args.semilla)
+    juego.db.cerrar()
+    reportar(resultado, args.json)
+
+
+if __name__ == "__main__":
+    main()
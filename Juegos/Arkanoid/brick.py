@@ -1,6 +1,7 @@
 """Clase de ladrillos"""
 import pygame
 from settings import *
+from text_cache import get_font
 
 
 class Brick:
@@ -16,6 +17,8 @@ class Brick:
         self.color = color
         self.original_color = color
         self.destroyed = False
+        # Los ladrillos no se mueven: el rectángulo se crea una sola vez
+        self.rect = pygame.Rect(int(x), int(y), self.width, self.height)
         
     def hit(self):
         """Golpea el ladrillo"""
@@ -72,25 +75,10 @@ class Brick:
             
             # Indicador de resistencia
             if self.type > 1:
-                font = pygame.font.Font(FONT_NAME, 12)
-                text = font.render(str(self.type), True, (255, 255, 255))
+                text = get_font(12).render(str(self.type), True, (255, 255, 255))
                 text_rect = text.get_rect(center=rect.center)
                 screen.blit(text, text_rect)
     
     def get_rect(self):
         """Retorna el rectángulo de colisión"""
-        return pygame.Rect(int(self.x), int(self.y), self.width, self.height)
-    
-    def get_collision_side(self, ball_rect, ball_vx, ball_vy):
-        """Determina el lado de colisión con la pelota"""
-        brick_rect = self.get_rect()
-        
-        # Calcular penetración en cada dirección
-        dx = ball_rect.centerx - brick_rect.centerx
-        dy = ball_rect.centery - brick_rect.centery
-        
-        # Determinar lado basado en dirección de movimiento y penetración
-        if abs(dx) > abs(dy):
-            return 'left' if dx < 0 else 'right'
-        else:
-            return 'top' if dy < 0 else 'bottom'
\ No newline at end of file
+        return self.rect
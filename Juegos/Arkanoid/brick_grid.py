@@ -0,0 +1,76 @@
+"""Índice de ladrillos por celda de la cuadrícula"""
+from settings import *
+
+
+CELL_WIDTH = BRICK_WIDTH + BRICK_PADDING
+CELL_HEIGHT = BRICK_HEIGHT + BRICK_PADDING
+
+
+class BrickGrid:
+    """Ladrillos vivos ordenados por fila y columna
+    
+    Los niveles colocan cada ladrillo en una celda fija de la cuadrícula,
+    así que las celdas que toca una pelota se calculan directamente y la
+    consulta revisa como mucho cuatro celdas sin importar cuántos
+    ladrillos tenga el nivel. También lleva la cuenta de los ladrillos
+    destruibles que quedan, así que saber si el nivel terminó no requiere
+    recorrerlos.
+    """
+    
+    def __init__(self, bricks):
+        self.rows = 0
+        self.cols = 0
+        for brick in bricks:
+            row, col = self.cell_of(brick)
+            self.rows = max(self.rows, row + 1)
+            self.cols = max(self.cols, col + 1)
+        
+        self.cells = [[None] * self.cols for _ in range(self.rows)]
+        self.live = {}  # Ladrillos vivos en orden de carga (dict: quitar uno es O(1))
+        self.destructible_left = 0
+        for brick in bricks:
+            if not brick.destroyed:
+                row, col = self.cell_of(brick)
+                self.cells[row][col] = brick
+                self.live[brick] = None
+                if brick.original_type != BRICK_INDESTRUCTIBLE:
+                    self.destructible_left += 1
+    
+    @staticmethod
+    def cell_of(brick):
+        """Retorna la fila y columna de un ladrillo"""
+        return (int(brick.y - BRICK_OFFSET_TOP) // CELL_HEIGHT,
+                int(brick.x - BRICK_OFFSET_LEFT) // CELL_WIDTH)
+    
+    def remove(self, brick):
+        """Quita un ladrillo destruido del índice y de la cuenta"""
+        if brick not in self.live:
+            return
+        del self.live[brick]
+        
+        row, col = self.cell_of(brick)
+        if self.cells[row][col] is brick:
+            self.cells[row][col] = None
+        if brick.original_type != BRICK_INDESTRUCTIBLE:
+            self.destructible_left -= 1
+    
+    @property
+    def cleared(self):
+        """True cuando no queda ningún ladrillo destruible"""
+        return self.destructible_left == 0
+    
+    def query(self, rect):
+        """Retorna los ladrillos vivos que se superponen con el rectángulo"""
+        col_start = max(0, (rect.left - BRICK_OFFSET_LEFT) // CELL_WIDTH)
+        col_end = min(self.cols - 1, (rect.right - 1 - BRICK_OFFSET_LEFT) // CELL_WIDTH)
+        row_start = max(0, (rect.top - BRICK_OFFSET_TOP) // CELL_HEIGHT)
+        row_end = min(self.rows - 1, (rect.bottom - 1 - BRICK_OFFSET_TOP) // CELL_HEIGHT)
+        
+        hits = []
+        for row in range(row_start, row_end + 1):
+            cells = self.cells[row]
+            for col in range(col_start, col_end + 1):
+                brick = cells[col]
+                if brick is not None and brick.rect.colliderect(rect):
+                    hits.append(brick)
+        return hits
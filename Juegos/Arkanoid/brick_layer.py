@@ -0,0 +1,39 @@
+"""Capa pre-renderizada de ladrillos"""
+import pygame
+from settings import *
+
+
+# Color transparente de la capa (ningún ladrillo lo usa)
+TRANSPARENT_KEY = (255, 0, 255)
+
+
+class BrickLayer:
+    """Superficie con todos los ladrillos del nivel ya dibujados
+    
+    Se dibuja completa al iniciar el nivel y, cuando un golpe cambia un
+    ladrillo, solo se vuelve a dibujar ese rectángulo. Cada frame queda
+    reducido a un único blit del área que ocupan los ladrillos.
+    """
+    
+    def __init__(self, bricks):
+        self.surface = pygame.Surface((WINDOW_WIDTH, WINDOW_HEIGHT))
+        self.surface.fill(TRANSPARENT_KEY)
+        self.surface.set_colorkey(TRANSPARENT_KEY)
+        
+        # Solo se copia a pantalla la zona que cubren los ladrillos
+        self.area = pygame.Rect(0, 0, 0, 0)
+        if bricks:
+            # Las rayas de los indestructibles llegan un píxel más abajo
+            self.area = bricks[0].rect.unionall([b.rect for b in bricks]).inflate(2, 2)
+        
+        for brick in bricks:
+            brick.draw(self.surface)
+    
+    def refresh(self, brick):
+        """Vuelve a dibujar un ladrillo que cambió de estado"""
+        self.surface.fill(TRANSPARENT_KEY, brick.rect.inflate(2, 2))
+        brick.draw(self.surface)
+    
+    def draw(self, screen):
+        """Dibuja la capa de ladrillos"""
+        screen.blit(self.surface, self.area.topleft, self.area)
@@ -0,0 +1,75 @@
+"""Colisión continua entre la pelota y rectángulos"""
+import math
+
+
+def sweep_circle_rect(x, y, dx, dy, radius, rect):
+    """Primer contacto de un círculo que va de (x, y) a (x + dx, y + dy) con un rectángulo
+    
+    Equivale a lanzar un rayo contra el rectángulo agrandado en `radius`
+    con las esquinas redondeadas. Retorna (t, nx, ny) con t entre 0 y 1 y
+    la normal exacta de la cara o esquina tocada, o None si no hay choque.
+    Si el círculo ya estaba dentro o se aleja del rectángulo no hay choque.
+    """
+    t_enter = -math.inf
+    t_exit = math.inf
+    nx = ny = 0
+    
+    # Rayo contra el rectángulo agrandado, eje por eje
+    for axis, p, d, low, high in ((0, x, dx, rect.left - radius, rect.right + radius),
+                                  (1, y, dy, rect.top - radius, rect.bottom + radius)):
+        if d == 0:
+            if p <= low or p >= high:
+                return None
+            continue
+        
+        t_low = (low - p) / d
+        t_high = (high - p) / d
+        if d > 0:
+            t_near, t_far, normal = t_low, t_high, -1
+        else:
+            t_near, t_far, normal = t_high, t_low, 1
+        
+        if t_near > t_enter:
+            t_enter = t_near
+            nx, ny = (normal, 0) if axis == 0 else (0, normal)
+        t_exit = min(t_exit, t_far)
+    
+    if t_enter > t_exit or t_exit < 0:
+        return None
+    
+    # Si el contacto cae fuera de ambas caras, en realidad toca la esquina
+    # redondeada. Lo mismo si el círculo parte dentro del rectángulo agrandado
+    # pero en el hueco de una esquina, que no es parte de la forma.
+    t_check = max(t_enter, 0)
+    hit_x = x + dx * t_check
+    hit_y = y + dy * t_check
+    corner_x = rect.left if hit_x < rect.left else rect.right if hit_x > rect.right else None
+    corner_y = rect.top if hit_y < rect.top else rect.bottom if hit_y > rect.bottom else None
+    if corner_x is not None and corner_y is not None:
+        return sweep_circle_point(x, y, dx, dy, radius, corner_x, corner_y)
+    
+    if t_enter < 0 or t_enter > 1 or nx * dx + ny * dy >= 0:
+        return None
+    
+    return t_enter, nx, ny
+
+
+def sweep_circle_point(x, y, dx, dy, radius, px, py):
+    """Primer contacto de un círculo en movimiento con un punto (una esquina)"""
+    fx = x - px
+    fy = y - py
+    a = dx * dx + dy * dy
+    b = 2 * (fx * dx + fy * dy)
+    c = fx * fx + fy * fy - radius * radius
+    if a == 0 or c < 0 or b >= 0:
+        return None
+    
+    discriminant = b * b - 4 * a * c
+    if discriminant < 0:
+        return None
+    
+    t = (-b - math.sqrt(discriminant)) / (2 * a)
+    if t < 0 or t > 1:
+        return None
+    
+    return t, (fx + dx * t) / radius, (fy + dy * t) / radius
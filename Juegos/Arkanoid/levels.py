@@ -1,93 +1,145 @@
-"""Sistema de niveles del juego"""
+"""Sistema de niveles del juego
+
+Los niveles viven en paquetes de niveles (archivos .pack): una primera línea
+JSON con el índice de niveles (nombre, dificultad y posición en el archivo)
+y luego una línea por nivel con su distribución, p. ej.
+["1111111111", "0220000220"]. Cada carácter es un ladrillo:
+0 = vacío, 1 = normal, 2 = resistente, 3 = fuerte, 9 = indestructible.
+"""
 import json
+import os
 from settings import *
 from brick import Brick
 
 
+PACK_FORMAT = "arkanoid-levels"
+PACK_VERSION = 1
+DEFAULT_PACK = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                            'level_packs', 'classic.pack')
+
+# Tipos válidos y tamaño máximo que cabe en pantalla sobre la pala
+BRICK_TYPES = {'0': 0, '1': BRICK_NORMAL, '2': BRICK_RESISTANT,
+               '3': BRICK_STRONG, '9': BRICK_INDESTRUCTIBLE}
+MAX_COLUMNS = (WINDOW_WIDTH - BRICK_OFFSET_LEFT + BRICK_PADDING) // (BRICK_WIDTH + BRICK_PADDING)
+MAX_ROWS = (PADDLE_Y - 50 - BRICK_OFFSET_TOP + BRICK_PADDING) // (BRICK_HEIGHT + BRICK_PADDING)
+
+
+class LevelPackError(ValueError):
+    """El paquete de niveles no tiene el formato esperado"""
+
+
+def validate_layout(layout):
+    """Valida una distribución y la retorna como filas de tipos de ladrillo"""
+    if not isinstance(layout, list) or not layout:
+        raise LevelPackError("la distribución debe ser una lista de filas")
+    if len(layout) > MAX_ROWS:
+        raise LevelPackError(f"la distribución tiene más de {MAX_ROWS} filas")
+    
+    rows = []
+    for row in layout:
+        if not isinstance(row, str) or not row:
+            raise LevelPackError("cada fila debe ser un texto con un carácter por ladrillo")
+        if len(row) > MAX_COLUMNS:
+            raise LevelPackError(f"la fila {row!r} tiene más de {MAX_COLUMNS} columnas")
+        if any(c not in BRICK_TYPES for c in row):
+            raise LevelPackError(f"la fila {row!r} tiene tipos de ladrillo desconocidos")
+        rows.append([BRICK_TYPES[c] for c in row])
+    return rows
+
+
+def write_level_pack(path, levels):
+    """Escribe un paquete a partir de dicts con 'name', 'difficulty' y 'layout'
+    
+    'layout' es una lista de filas, como texto ("1102") o como listas de
+    enteros ([1, 1, 0, 2]).
+    """
+    index = []
+    body = b''
+    for level in levels:
+        layout = [row if isinstance(row, str) else ''.join(str(c) for c in row)
+                  for row in level['layout']]
+        validate_layout(layout)
+        line = (json.dumps(layout) + '\n').encode('utf-8')
+        index.append({'name': level['name'], 'difficulty': level['difficulty'],
+                      'offset': len(body), 'length': len(line)})
+        body += line
+    
+    header = {'format': PACK_FORMAT, 'version': PACK_VERSION, 'levels': index}
+    with open(path, 'wb') as f:
+        f.write((json.dumps(header, ensure_ascii=False) + '\n').encode('utf-8'))
+        f.write(body)
+
+
 class LevelManager:
-    """Gestiona la carga y creación de niveles"""
+    """Gestiona la carga y creación de niveles
     
-    # Definición de niveles predefinidos
-    # 0 = vacío, 1 = normal, 2 = resistente, 3 = fuerte, 9 = indestructible
-    LEVELS = [
-        # Nivel 1: Introducción
-        {
-            'name': 'Inicio',
-            'difficulty': 'Fácil',
-            'layout': [
-                [1, 1, 1, 1, 1, 1, 1, 1, 1, 1],
-                [1, 1, 1, 1, 1, 1, 1, 1, 1, 1],
-                [1, 1, 1, 1, 1, 1, 1, 1, 1, 1],
-                [0, 0, 0, 0, 0, 0, 0, 0, 0, 0],
-            ]
-        },
-        # Nivel 2: Pirámide
-        {
-            'name': 'Pirámide',
-            'difficulty': 'Fácil',
-            'layout': [
-                [0, 0, 0, 0, 1, 1, 0, 0, 0, 0],
-                [0, 0, 0, 1, 1, 1, 1, 0, 0, 0],
-                [0, 0, 1, 1, 2, 2, 1, 1, 0, 0],
-                [0, 1, 1, 2, 2, 2, 2, 1, 1, 0],
-                [1, 1, 2, 2, 3, 3, 2, 2, 1, 1],
-            ]
-        },
-        # Nivel 3: Fortaleza
-        {
-            'name': 'Fortaleza',
-            'difficulty': 'Media',
-            'layout': [
-                [9, 0, 1, 1, 1, 1, 1, 1, 0, 9],
-                [9, 0, 2, 2, 2, 2, 2, 2, 0, 9],
-                [9, 0, 1, 1, 3, 3, 1, 1, 0, 9],
-                [9, 0, 2, 2, 2, 2, 2, 2, 0, 9],
-                [9, 0, 1, 1, 1, 1, 1, 1, 0, 9],
-            ]
-        },
-        # Nivel 4: Laberinto
-        {
-            'name': 'Laberinto',
-            'difficulty': 'Media',
-            'layout': [
-                [2, 2, 0, 2, 2, 2, 2, 0, 2, 2],
-                [2, 0, 0, 0, 2, 2, 0, 0, 0, 2],
-                [0, 0, 3, 0, 0, 0, 0, 3, 0, 0],
-                [2, 0, 0, 0, 2, 2, 0, 0, 0, 2],
-                [2, 2, 0, 2, 2, 2, 2, 0, 2, 2],
-                [0, 0, 0, 0, 1, 1, 0, 0, 0, 0],
-            ]
-        },
-        # Nivel 5: Desafío
-        {
-            'name': 'Desafío',
-            'difficulty': 'Difícil',
-            'layout': [
-                [9, 9, 9, 9, 9, 9, 9, 9, 9, 9],
-                [9, 3, 3, 3, 3, 3, 3, 3, 3, 9],
-                [9, 3, 2, 2, 2, 2, 2, 2, 3, 9],
-                [9, 3, 2, 1, 1, 1, 1, 2, 3, 9],
-                [9, 3, 2, 1, 0, 0, 1, 2, 3, 9],
-                [9, 3, 2, 1, 1, 1, 1, 2, 3, 9],
-                [9, 3, 2, 2, 2, 2, 2, 2, 3, 9],
-                [9, 3, 3, 3, 3, 3, 3, 3, 3, 9],
-                [9, 9, 9, 9, 9, 9, 9, 9, 9, 9],
-            ]
-        },
-    ]
+    Al crearse solo lee el índice del paquete; cada distribución se lee,
+    valida y guarda en memoria la primera vez que se carga el nivel.
+    """
     
-    def __init__(self):
+    def __init__(self, pack_path=DEFAULT_PACK):
         self.current_level = 0
+        self.pack_path = pack_path
+        self.levels = []
+        self._layouts = {}
+        self._read_index()
+    
+    def _read_index(self):
+        """Lee y valida el índice del paquete de niveles"""
+        with open(self.pack_path, 'rb') as f:
+            try:
+                header = json.loads(f.readline().decode('utf-8'))
+            except ValueError as e:
+                raise LevelPackError(f"{self.pack_path}: índice ilegible ({e})")
+            self._body_start = f.tell()
+            body_size = os.fstat(f.fileno()).st_size - self._body_start
+        
+        if not isinstance(header, dict) or header.get('format') != PACK_FORMAT:
+            raise LevelPackError(f"{self.pack_path}: no es un paquete de niveles")
+        if header.get('version') != PACK_VERSION:
+            raise LevelPackError(f"{self.pack_path}: versión {header.get('version')} no soportada")
+        
+        for i, entry in enumerate(header.get('levels', [])):
+            try:
+                name, difficulty = str(entry['name']), str(entry['difficulty'])
+                offset, length = int(entry['offset']), int(entry['length'])
+            except (KeyError, TypeError, ValueError):
+                raise LevelPackError(f"{self.pack_path}: entrada {i} del índice incompleta")
+            if offset < 0 or length <= 0 or offset + length > body_size:
+                raise LevelPackError(f"{self.pack_path}: el nivel {i} queda fuera del archivo")
+            self.levels.append({'name': name, 'difficulty': difficulty,
+                                'offset': offset, 'length': length})
+    
+    def get_layout(self, level_index):
+        """Retorna la distribución de un nivel, leyéndola del paquete una sola vez"""
+        layout = self._layouts.get(level_index)
+        if layout is not None:
+            return layout
+        
+        entry = self.levels[level_index]
+        with open(self.pack_path, 'rb') as f:
+            f.seek(self._body_start + entry['offset'])
+            data = f.read(entry['length'])
+        try:
+            layout = validate_layout(json.loads(data.decode('utf-8')))
+        except ValueError as e:
+            raise LevelPackError(f"{self.pack_path}: nivel {level_index} ({entry['name']}): {e}")
+        
+        self._layouts[level_index] = layout
+        return layout
     
     def load_level(self, level_index):
         """Carga un nivel y retorna lista de ladrillos"""
-        if level_index < 0 or level_index >= len(self.LEVELS):
+        if level_index < 0 or level_index >= len(self.levels):
             return None
         
-        self.current_level = level_index
-        level_data = self.LEVELS[level_index]
-        layout = level_data['layout']
+        try:
+            layout = self.get_layout(level_index)
+        except LevelPackError as e:
+            print(f"✗ Nivel inválido: {e}")
+            return None
         
+        self.current_level = level_index
         bricks = []
         
         for row_idx, row in enumerate(layout):
@@ -124,13 +176,13 @@ class LevelManager:
     
     def get_level_count(self):
         """Retorna el número total de niveles"""
-        return len(self.LEVELS)
+        return len(self.levels)
     
     def get_level_info(self, level_index):
-        """Obtiene información de un nivel"""
-        if level_index < 0 or level_index >= len(self.LEVELS):
+        """Obtiene información de un nivel (nombre y dificultad)"""
+        if level_index < 0 or level_index >= len(self.levels):
             return None
-        return self.LEVELS[level_index]
+        return self.levels[level_index]
     
     def get_current_level_info(self):
         """Obtiene información del nivel actual"""
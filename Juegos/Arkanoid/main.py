@@ -1,10 +1,13 @@
 """Juego Arkanoid - Archivo principal"""
 import pygame
+import os
 import sys
 from settings import *
 from paddle import Paddle
-from ball import Ball
+from ball import Ball, draw_balls
 from brick import Brick
+from brick_grid import BrickGrid
+from brick_layer import BrickLayer
 from powerup import PowerUpManager
 from particles import ParticleSystem
 from levels import LevelManager
@@ -12,6 +15,9 @@ from ui import UI
 from sounds import SoundManager
 from db import DatabaseManager
 
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))  # Para importar motor
+from motor import BucleFijo, Interpolador
+
 
 class ArkanoidGame:
     """Clase principal del juego Arkanoid"""
@@ -22,10 +28,15 @@ class ArkanoidGame:
         pygame.display.set_caption("Arkanoid")
         self.clock = pygame.time.Clock()
         
+        # Simulación a paso fijo y dibujo interpolado entre pasos
+        self.bucle = BucleFijo(FPS, RENDER_FPS, reloj=self.clock)
+        self.interpolador = Interpolador('x', 'y')
+        
         # Componentes
         self.paddle = Paddle()
         self.balls = []
-        self.bricks = []
+        self.brick_grid = BrickGrid([])  # Ladrillos vivos del nivel
+        self.brick_layer = BrickLayer([])
         self.powerup_manager = PowerUpManager()
         self.particle_system = ParticleSystem()
         self.level_manager = LevelManager()
@@ -41,8 +52,11 @@ class ArkanoidGame:
         self.score = 0
         self.lives = INITIAL_LIVES
         self.current_level = 0
-        self.best_score = self.db.obtener_mejor_puntuacion(self.username, GAME_NAME)
+        self.best_score = 0
+        self.best_score_known = False
+        self.load_best_score()
         self.is_record = False
+        self.records = []
         self.lives_lost_in_level = 0
         
         # Power-ups activos
@@ -56,13 +70,16 @@ class ArkanoidGame:
         self.current_level = level_index
         
         # Cargar ladrillos del nivel
-        self.bricks = self.level_manager.load_level(level_index)
+        bricks = self.level_manager.load_level(level_index)
         
-        if self.bricks is None:
+        if bricks is None:
             print(f"Error: No se pudo cargar el nivel {level_index}")
             self.state = "menu"
             return
         
+        self.brick_grid = BrickGrid(bricks)
+        self.brick_layer = BrickLayer(bricks)
+        
         # Reiniciar componentes
         self.paddle.reset()
         self.balls = [Ball(WINDOW_WIDTH // 2, PADDLE_Y - 30)]
@@ -73,8 +90,20 @@ class ArkanoidGame:
         
         self.state = "playing"
     
+    def load_best_score(self):
+        """Lee la mejor puntuación del jugador
+        
+        Si la base no responde se reintenta al empezar la próxima partida.
+        """
+        best = self.db.obtener_mejor_puntuacion(self.username, GAME_NAME, por_defecto=None)
+        self.best_score_known = best is not None
+        if self.best_score_known:
+            self.best_score = best
+    
     def start_game(self):
         """Inicia el juego desde el nivel 1"""
+        if not self.best_score_known:
+            self.load_best_score()
         self.score = 0
         self.lives = INITIAL_LIVES
         self.start_level(0)
@@ -108,16 +137,13 @@ class ArkanoidGame:
     
     def end_game(self):
         """Finaliza el juego"""
-        # Guardar puntuación
-        self.db.guardar_puntuacion(self.username, GAME_NAME, self.score)
-        
-        # Verificar récord
-        self.is_record = self.db.verificar_nuevo_record(self.username, GAME_NAME, self.score)
+        # Verificar récord contra la mejor puntuación ya conocida
+        self.is_record = self.best_score_known and self.score > self.best_score
+        if self.score > self.best_score:
+            self.best_score = self.score
         
-        # Actualizar mejor puntuación
-        new_best = self.db.obtener_mejor_puntuacion(self.username, GAME_NAME)
-        if new_best > self.best_score:
-            self.best_score = new_best
+        # Guardar puntuación (se escribe en segundo plano)
+        self.db.guardar_puntuacion(self.username, GAME_NAME, self.score)
         
         if self.lives <= 0:
             self.sounds.play('game_over')
@@ -159,6 +185,9 @@ class ArkanoidGame:
         elif powerup_type == POWERUP_LIFE:
             self.lives += 1
             self.active_powerups.append("Vida Extra")
+        
+        # La UI solo muestra los últimos tres
+        del self.active_powerups[:-3]
     
     def handle_events(self):
         """Maneja todos los eventos"""
@@ -193,7 +222,7 @@ class ArkanoidGame:
                     self.state = "level_select"
                 elif self.ui.menu_buttons['records'].is_clicked(mouse_pos, mouse_pressed):
                     self.sounds.play('paddle')
-                    self.state = "records"
+                    self.show_records()
                 elif self.ui.menu_buttons['exit'].is_clicked(mouse_pos, mouse_pressed):
                     self.quit_game()
             
@@ -255,6 +284,42 @@ class ArkanoidGame:
                     self.sounds.play('paddle')
                     self.state = "menu"
     
+    def hit_brick(self, brick):
+        """Golpea un ladrillo y aplica sus efectos, puntos y power-ups"""
+        destroyed = brick.hit()
+        self.brick_layer.refresh(brick)
+        
+        if destroyed:
+            self.brick_grid.remove(brick)
+            
+            # Efectos
+            self.sounds.play('brick')
+            self.particle_system.create_explosion(
+                brick.x + brick.width // 2,
+                brick.y + brick.height // 2,
+                brick.color
+            )
+            
+            # Puntos
+            self.score += BRICK_POINTS.get(brick.original_type, 10)
+            
+            # Power-up
+            self.powerup_manager.spawn_powerup(
+                brick.x + brick.width // 2,
+                brick.y + brick.height // 2
+            )
+            
+            # Aumentar velocidad de pelotas
+            for b in self.balls:
+                b.increase_speed()
+        else:
+            self.sounds.play('resistant')
+            self.particle_system.create_spark(
+                brick.x + brick.width // 2,
+                brick.y + brick.height // 2,
+                brick.color
+            )
+    
     def update(self, delta_time):
         """Actualiza el estado del juego"""
         if self.state != "playing":
@@ -266,75 +331,28 @@ class ArkanoidGame:
         self.paddle.update(delta_time, mouse_x, keys)
         
         # Actualizar pelotas
-        for ball in self.balls[:]:
+        fallen = False
+        for ball in self.balls:
             ball.update(delta_time)
             
-            # Colisión con pala
-            if ball.get_rect().colliderect(self.paddle.get_rect()):
-                if ball.vy > 0:  # Solo si va hacia abajo
-                    ball.bounce_paddle(self.paddle.get_rect())
+            # Mover con colisión continua: los choques llegan en orden
+            events = ball.move(self.brick_grid.query, self.paddle.get_rect())
+            for kind, brick in events:
+                if kind == 'paddle':
                     self.sounds.play('paddle')
-            
-            # Colisión con paredes
-            prev_x = ball.x - ball.vx
-            if (ball.x - ball.radius <= 0 and prev_x > ball.radius) or \
-               (ball.x + ball.radius >= WINDOW_WIDTH and prev_x < WINDOW_WIDTH - ball.radius):
-                self.sounds.play('wall')
-            
-            # Colisión con ladrillos
-            for brick in self.bricks[:]:
-                if brick.destroyed:
-                    continue
-                
-                if ball.get_rect().colliderect(brick.get_rect()):
-                    # Determinar lado de colisión
-                    side = brick.get_collision_side(ball.get_rect(), ball.vx, ball.vy)
-                    
-                    # Rebotar
-                    if not ball.piercing:
-                        ball.bounce_brick(brick.get_rect(), side)
-                    
-                    # Golpear ladrillo
-                    destroyed = brick.hit()
-                    
-                    if destroyed:
-                        # Efectos
-                        self.sounds.play('brick')
-                        self.particle_system.create_explosion(
-                            brick.x + brick.width // 2,
-                            brick.y + brick.height // 2,
-                            brick.color
-                        )
-                        
-                        # Puntos
-                        self.score += BRICK_POINTS.get(brick.original_type, 10)
-                        
-                        # Power-up
-                        self.powerup_manager.spawn_powerup(
-                            brick.x + brick.width // 2,
-                            brick.y + brick.height // 2
-                        )
-                        
-                        # Aumentar velocidad de pelotas
-                        for b in self.balls:
-                            b.increase_speed()
-                    else:
-                        self.sounds.play('resistant')
-                        self.particle_system.create_spark(
-                            brick.x + brick.width // 2,
-                            brick.y + brick.height // 2,
-                            brick.color
-                        )
-                    
-                    if not ball.piercing:
-                        break
+                elif kind == 'wall':
+                    self.sounds.play('wall')
+                elif kind == 'brick':
+                    self.hit_brick(brick)
             
             # Verificar si cayó
             if ball.is_below_screen():
                 ball.active = False
+                fallen = True
         
-        # Eliminar pelotas inactivas
-        self.balls = [b for b in self.balls if b.active]
+        # Eliminar pelotas inactivas (solo si alguna cayó)
+        if fallen:
+            self.balls = [b for b in self.balls if b.active]
         
         # Perder vida si no quedan pelotas
         if len(self.balls) == 0:
@@ -350,13 +368,8 @@ class ArkanoidGame:
         self.particle_system.update(delta_time)
         
         # Verificar victoria (todos los ladrillos destruibles destruidos)
-        destructible_bricks = [b for b in self.bricks 
-                              if not b.destroyed and b.type != BRICK_INDESTRUCTIBLE]
-        if len(destructible_bricks) == 0:
+        if self.brick_grid.cleared:
             self.end_game()
-        
-        # Limpiar lista de power-ups activos (solo para UI)
-        self.active_powerups = [p for p in self.active_powerups[-3:]]
     
     def draw(self):
         """Dibuja todo el juego"""
@@ -370,8 +383,7 @@ class ArkanoidGame:
             self.screen.fill(COLOR_BG)
             
             # Ladrillos
-            for brick in self.bricks:
-                brick.draw(self.screen)
+            self.brick_layer.draw(self.screen)
             
             # Partículas
             self.particle_system.draw(self.screen)
@@ -380,8 +392,7 @@ class ArkanoidGame:
             self.paddle.draw(self.screen)
             
             # Pelotas
-            for ball in self.balls:
-                ball.draw(self.screen)
+            draw_balls(self.screen, self.balls)
             
             # Power-ups
             self.powerup_manager.draw(self.screen)
@@ -397,11 +408,9 @@ class ArkanoidGame:
         elif self.state == "game_over":
             # Dibujar juego de fondo
             self.screen.fill(COLOR_BG)
-            for brick in self.bricks:
-                brick.draw(self.screen)
+            self.brick_layer.draw(self.screen)
             self.paddle.draw(self.screen)
-            for ball in self.balls:
-                ball.draw(self.screen)
+            draw_balls(self.screen, self.balls)
             
             # Overlay
             self.ui.draw_game_over(self.screen, self.score, self.best_score,
@@ -410,8 +419,7 @@ class ArkanoidGame:
         elif self.state == "victory":
             # Dibujar juego de fondo
             self.screen.fill(COLOR_BG)
-            for brick in self.bricks:
-                brick.draw(self.screen)
+            self.brick_layer.draw(self.screen)
             self.paddle.draw(self.screen)
             
             # Overlay
@@ -424,11 +432,16 @@ class ArkanoidGame:
             self.ui.draw_level_select(self.screen, self.level_manager, mouse_pos)
         
         elif self.state == "records":
-            records = self.db.obtener_top_puntuaciones(GAME_NAME, 10)
-            self.ui.draw_records(self.screen, records, mouse_pos)
+            self.ui.draw_records(self.screen, self.records, mouse_pos)
         
         pygame.display.flip()
     
+    def show_records(self):
+        """Carga la tabla de récords una vez y muestra la pantalla"""
+        self.db.esperar_escrituras()
+        self.records = self.db.obtener_top_puntuaciones(GAME_NAME, 10)
+        self.state = "records"
+    
     def quit_game(self):
         """Cierra el juego"""
         self.db.cerrar()
@@ -456,11 +469,16 @@ class ArkanoidGame:
         print("=" * 60)
         
         while True:
-            delta_time = self.clock.tick(FPS) / 1000.0
+            pasos = self.bucle.frame()
             
             self.handle_events()
-            self.update(delta_time)
-            self.draw()
+            for _ in range(pasos):
+                self.interpolador.guardar(
+                    self.balls + [self.paddle] + self.powerup_manager.powerups)
+                self.update(self.bucle.paso)
+            
+            with self.interpolador.aplicar(self.bucle.alpha):
+                self.draw()
 
 
 if __name__ == "__main__":
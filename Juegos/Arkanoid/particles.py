@@ -1,106 +1,187 @@
 """Sistema de partículas para efectos visuales"""
 import pygame
-import random
-import math
+import numpy as np
 from settings import *
 
 
-class Particle:
-    """Representa una partícula individual"""
-    
-    def __init__(self, x, y, color, velocity_x=None, velocity_y=None):
-        self.x = x
-        self.y = y
-        self.color = color
-        self.lifetime = PARTICLE_LIFETIME
-        self.max_lifetime = PARTICLE_LIFETIME
-        
-        # Velocidad aleatoria si no se especifica
-        if velocity_x is None:
-            angle = random.uniform(0, 2 * math.pi)
-            speed = random.uniform(1, 4)
-            self.vx = math.cos(angle) * speed
-            self.vy = math.sin(angle) * speed
-        else:
-            self.vx = velocity_x
-            self.vy = velocity_y
-        
-        # Tamaño
-        self.size = random.randint(2, 5)
-    
-    def update(self, delta_time):
-        """Actualiza la partícula"""
-        self.x += self.vx
-        self.y += self.vy
-        
-        # Aplicar gravedad suave
-        self.vy += 0.2
-        
-        # Reducir velocidad
-        self.vx *= 0.98
-        self.vy *= 0.98
-        
-        # Reducir lifetime
-        self.lifetime -= delta_time
-    
-    def draw(self, screen):
-        """Dibuja la partícula"""
-        if self.lifetime <= 0:
-            return
-        
-        # Calcular alpha basado en lifetime
-        alpha = int(255 * (self.lifetime / self.max_lifetime))
-        color = (*self.color[:3], alpha)
-        
-        # Dibujar partícula
-        pygame.draw.circle(screen, color[:3], (int(self.x), int(self.y)), self.size)
+# Física por paso de las partículas
+PARTICLE_GRAVITY = 0.2
+PARTICLE_DRAG = 0.98
+PARTICLE_MIN_SIZE = 2
+PARTICLE_MAX_SIZE = 5
+
+
+# Margen del lienzo: una partícula parcialmente fuera de pantalla cabe entera
+CANVAS_PAD = PARTICLE_MAX_SIZE * 2
+
+
+def _circle_offsets(radius):
+    """Píxeles que pinta pygame.draw.circle para un radio, relativos al centro"""
+    side = radius * 2 + 3
+    stamp = pygame.Surface((side, side))
+    pygame.draw.circle(stamp, (255, 255, 255), (radius + 1, radius + 1), radius)
+    xs, ys = np.nonzero(pygame.surfarray.array2d(stamp))
+    return xs - (radius + 1), ys - (radius + 1)
+
+
+def _footprints():
+    """Píxeles del círculo más grande y, por radio, cuáles de ellos se pintan
     
-    def is_alive(self):
-        """Verifica si la partícula sigue activa"""
-        return self.lifetime > 0
+    Los círculos más chicos están contenidos en el más grande, así que todas
+    las partículas usan los mismos desplazamientos y una máscara por radio.
+    """
+    dx, dy = _circle_offsets(PARTICLE_MAX_SIZE)
+    members = np.zeros((PARTICLE_MAX_SIZE + 1, len(dx)), dtype=bool)
+    for radius in range(1, PARTICLE_MAX_SIZE + 1):
+        inside = set(zip(*_circle_offsets(radius)))
+        members[radius] = [(x, y) in inside for x, y in zip(dx, dy)]
+    return dx, dy, members
+
+
+def _pack_color(color):
+    """Color RGB como entero BGRA opaco, el formato del lienzo"""
+    r, g, b = color[:3]
+    return 0xFF000000 | (int(r) << 16) | (int(g) << 8) | int(b)
 
 
 class ParticleSystem:
-    """Gestiona todas las partículas"""
+    """Gestiona todas las partículas como arreglos de NumPy
+    
+    Cada propiedad (posición, velocidad, vida, tamaño, color) vive en un
+    arreglo preasignado y las partículas activas ocupan las primeras
+    `count` posiciones. La física se aplica a todas a la vez, las muertas
+    se compactan con una máscara y el dibujo escribe los píxeles de todas
+    en un lienzo de NumPy que se copia a pantalla con un solo blit.
+    """
+    
+    def __init__(self, capacity=1024):
+        self.count = 0
+        self._allocate(capacity)
+        self._footprint = None
+        self._canvas = None
     
-    def __init__(self):
-        self.particles = []
+    def _allocate(self, capacity):
+        """Crea (o agranda) los arreglos conservando las partículas activas"""
+        n = self.count
+        old = getattr(self, 'x', None)
+        arrays = {
+            'x': np.zeros(capacity), 'y': np.zeros(capacity),
+            'vx': np.zeros(capacity), 'vy': np.zeros(capacity),
+            'life': np.zeros(capacity),
+            'size': np.zeros(capacity, dtype=np.int32),
+            'color': np.zeros(capacity, dtype='<u4'),  # BGRA empaquetado
+        }
+        for name, array in arrays.items():
+            if old is not None:
+                array[:n] = getattr(self, name)[:n]
+            setattr(self, name, array)
+        self.capacity = capacity
+    
+    def emit(self, x, y, vx, vy, color, life, size):
+        """Agrega un lote de partículas (vx, vy y size son arreglos del mismo largo)"""
+        amount = len(vx)
+        if self.count + amount > self.capacity:
+            self._allocate(max(self.capacity * 2, self.count + amount))
+        
+        start, end = self.count, self.count + amount
+        self.x[start:end] = x
+        self.y[start:end] = y
+        self.vx[start:end] = vx
+        self.vy[start:end] = vy
+        self.life[start:end] = life
+        self.size[start:end] = size
+        self.color[start:end] = _pack_color(color)
+        self.count = end
     
     def create_explosion(self, x, y, color, count=None):
         """Crea una explosión de partículas"""
         if count is None:
             count = PARTICLE_COUNT
         
-        for _ in range(count):
-            # Crear partículas en todas direcciones
-            angle = random.uniform(0, 2 * math.pi)
-            speed = random.uniform(2, 6)
-            vx = math.cos(angle) * speed
-            vy = math.sin(angle) * speed
-            
-            particle = Particle(x, y, color, vx, vy)
-            self.particles.append(particle)
+        # Partículas en todas direcciones
+        angle = np.random.uniform(0, 2 * np.pi, count)
+        speed = np.random.uniform(2, 6, count)
+        size = np.random.randint(PARTICLE_MIN_SIZE, PARTICLE_MAX_SIZE + 1, count)
+        self.emit(x, y, np.cos(angle) * speed, np.sin(angle) * speed,
+                  color, PARTICLE_LIFETIME, size)
     
     def create_spark(self, x, y, color):
         """Crea una chispa (partícula única brillante)"""
-        particle = Particle(x, y, (255, 255, 255))
-        particle.size = 3
-        particle.lifetime = 0.2
-        self.particles.append(particle)
+        angle = np.random.uniform(0, 2 * np.pi, 1)
+        speed = np.random.uniform(1, 4, 1)
+        self.emit(x, y, np.cos(angle) * speed, np.sin(angle) * speed,
+                  (255, 255, 255), 0.2, 3)
     
     def update(self, delta_time):
         """Actualiza todas las partículas"""
-        for particle in self.particles:
-            particle.update(delta_time)
+        n = self.count
+        if n == 0:
+            return
+        
+        x, y, vx, vy, life = self.x[:n], self.y[:n], self.vx[:n], self.vy[:n], self.life[:n]
+        x += vx
+        y += vy
         
-        # Eliminar partículas muertas
-        self.particles = [p for p in self.particles if p.is_alive()]
+        # Gravedad suave y rozamiento
+        vy += PARTICLE_GRAVITY
+        vx *= PARTICLE_DRAG
+        vy *= PARTICLE_DRAG
+        life -= delta_time
+        
+        # Compactar: las vivas pasan al inicio de los arreglos
+        alive = life > 0
+        if not alive.all():
+            keep = np.flatnonzero(alive)
+            for name in ('x', 'y', 'vx', 'vy', 'life', 'size', 'color'):
+                array = getattr(self, name)
+                array[:len(keep)] = array[keep]
+            self.count = len(keep)
     
     def draw(self, screen):
-        """Dibuja todas las partículas"""
-        for particle in self.particles:
-            particle.draw(screen)
+        """Dibuja todas las partículas pintando sus píxeles en bloque"""
+        n = self.count
+        if n == 0:
+            return
+        
+        width, height = screen.get_size()
+        if self._canvas is None or self._canvas[1] != (width, height):
+            self._create_canvas(width, height)
+        canvas, _, surface = self._canvas
+        dx, dy, members = self._footprint
+        stride = width + 2 * CANVAS_PAD
+        
+        # Solo las partículas que alcanzan a verse
+        px = self.x[:n].astype(np.int32)
+        py = self.y[:n].astype(np.int32)
+        visible = np.flatnonzero((px >= -PARTICLE_MAX_SIZE) & (px < width + PARTICLE_MAX_SIZE) &
+                                 (py >= -PARTICLE_MAX_SIZE) & (py < height + PARTICLE_MAX_SIZE))
+        if len(visible) == 0:
+            return
+        px = px[visible] + CANVAS_PAD
+        py = py[visible] + CANVAS_PAD
+        
+        # Limpiar y copiar solo la zona que cubren las partículas
+        area = pygame.Rect(px.min() - PARTICLE_MAX_SIZE, py.min() - PARTICLE_MAX_SIZE,
+                           px.max() - px.min() + PARTICLE_MAX_SIZE * 2 + 1,
+                           py.max() - py.min() + PARTICLE_MAX_SIZE * 2 + 1)
+        canvas.reshape(-1, stride)[area.top:area.bottom, area.left:area.right] = 0
+        
+        # Fila por partícula: se escriben en orden y las últimas quedan encima
+        pixels = (py * stride + px)[:, None] + (dy * stride + dx)[None, :]
+        painted = members[self.size[:n][visible]]
+        colors = np.broadcast_to(self.color[:n][visible][:, None], painted.shape)
+        canvas[pixels[painted]] = colors[painted]
+        
+        screen.blit(surface, (area.x - CANVAS_PAD, area.y - CANVAS_PAD), area)
+    
+    def _create_canvas(self, width, height):
+        """Lienzo transparente con margen, compartido con una superficie de pygame"""
+        if self._footprint is None:
+            self._footprint = _footprints()
+        size = (width + 2 * CANVAS_PAD, height + 2 * CANVAS_PAD)
+        canvas = np.zeros(size[0] * size[1], dtype='<u4')
+        self._canvas = (canvas, (width, height), pygame.image.frombuffer(canvas, size, 'BGRA'))
     
     def clear(self):
         """Limpia todas las partículas"""
-        self.particles = []
\ No newline at end of file
+        self.count = 0
@@ -2,6 +2,7 @@
 import pygame
 import random
 from settings import *
+from text_cache import get_font
 
 
 class PowerUp:
@@ -87,8 +88,7 @@ class PowerUp:
         pygame.draw.rect(screen, (255, 255, 255), rect, 2, border_radius=5)
         
         # Símbolo
-        font = pygame.font.Font(FONT_NAME, 18)
-        text = font.render(self.symbol, True, (255, 255, 255))
+        text = get_font(18).render(self.symbol, True, (255, 255, 255))
         text_rect = text.get_rect(center=rect.center)
         screen.blit(text, text_rect)
     
@@ -134,11 +134,15 @@ class PowerUpManager:
     
     def update(self, delta_time):
         """Actualiza todos los power-ups"""
+        inactive = False
         for powerup in self.powerups:
             powerup.update(delta_time)
+            if not powerup.active:
+                inactive = True
         
-        # Eliminar power-ups inactivos
-        self.powerups = [p for p in self.powerups if p.active]
+        # Eliminar power-ups inactivos (solo si alguno dejó de estarlo)
+        if inactive:
+            self.powerups = [p for p in self.powerups if p.active]
     
     def draw(self, screen):
         """Dibuja todos los power-ups"""
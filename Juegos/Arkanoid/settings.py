@@ -3,7 +3,8 @@
 # Configuración de ventana
 WINDOW_WIDTH = 800
 WINDOW_HEIGHT = 600
-FPS = 60
+FPS = 60  # Pasos de simulación por segundo
+RENDER_FPS = 60  # Límite de frames dibujados (p. ej. 144 en monitores rápidos; 0 = sin límite)
 
 # Colores
 COLOR_BG = (20, 20, 30)
@@ -1,8 +1,29 @@
 """Sistema de sonidos para Arkanoid"""
+import os
+import sys
 import pygame
 import numpy as np
 from settings import *
 
+DIRECTORIO = os.path.dirname(os.path.abspath(__file__))
+sys.path.append(os.path.dirname(DIRECTORIO))  # Para importar banco_sonidos
+from banco_sonidos import cargar_sonidos
+
+# Sonidos ya generados; se rehacen si cambian las recetas o este archivo
+SOUND_BANK = os.path.join(DIRECTORIO, 'sonidos.bank')
+
+# Generador y parámetros de cada sonido
+SOUND_RECIPES = {
+    'paddle': ['tone', 440, 0.08, 0.3],             # Rebote en pala (tono medio)
+    'wall': ['tone', 220, 0.06, 0.25],              # Rebote en pared (tono bajo)
+    'brick': ['chord', [523, 659], 0.12, 0.3],      # Ladrillo roto (acorde)
+    'resistant': ['sweep', 400, 600, 0.1, 0.3],     # Ladrillo resistente (dos tonos)
+    'powerup': ['sweep', 440, 880, 0.15, 0.3],      # Power-up recogido (ascendente)
+    'life_lost': ['sweep', 440, 220, 0.3, 0.35],    # Vida perdida (descendente triste)
+    'level_complete': ['victory'],                  # Nivel completado (triunfal)
+    'game_over': ['gameover'],                      # Game over (descendente largo)
+}
+
 
 class SoundManager:
     """Gestiona todos los sonidos del juego"""
@@ -36,35 +57,16 @@ class SoundManager:
         wave = np.int16(wave * 32767)
         stereo_wave = np.column_stack((wave, wave))
         
-        return pygame.sndarray.make_sound(stereo_wave)
+        return stereo_wave
     
     def _generate_sounds(self):
-        """Genera todos los sonidos del juego"""
+        """Carga los sonidos del banco en disco, generándolos si hace falta"""
         try:
-            # Rebote en pala (tono medio)
-            self.sounds['paddle'] = self._generate_tone(440, 0.08, 0.3)
-            
-            # Rebote en pared (tono bajo)
-            self.sounds['wall'] = self._generate_tone(220, 0.06, 0.25)
-            
-            # Ladrillo roto (acorde)
-            self.sounds['brick'] = self._generate_chord([523, 659], 0.12, 0.3)
-            
-            # Ladrillo resistente (dos tonos)
-            self.sounds['resistant'] = self._generate_sweep(400, 600, 0.1, 0.3)
-            
-            # Power-up recogido (ascendente)
-            self.sounds['powerup'] = self._generate_sweep(440, 880, 0.15, 0.3)
-            
-            # Vida perdida (descendente triste)
-            self.sounds['life_lost'] = self._generate_sweep(440, 220, 0.3, 0.35)
-            
-            # Nivel completado (triunfal)
-            self.sounds['level_complete'] = self._generate_victory()
-            
-            # Game over (descendente largo)
-            self.sounds['game_over'] = self._generate_gameover()
-            
+            buffers = cargar_sonidos(SOUND_BANK, SOUND_RECIPES, self._synthesize,
+                                     origen=os.path.abspath(__file__))
+            for name, buffer in buffers.items():
+                self.sounds[name] = pygame.sndarray.make_sound(buffer)
+        
         except Exception as e:
             print(f"⚠ Error generando sonidos: {e}")
             silent = pygame.mixer.Sound(buffer=np.zeros((100, 2), dtype=np.int16))
@@ -72,6 +74,11 @@ class SoundManager:
                        'life_lost', 'level_complete', 'game_over']:
                 self.sounds[key] = silent
     
+    def _synthesize(self, name, recipe):
+        """Genera las muestras de un sonido a partir de su receta"""
+        kind, *params = recipe
+        return getattr(self, f'_generate_{kind}')(*params)
+    
     def _generate_chord(self, frequencies, duration=0.15, volume=0.3):
         """Genera un acorde con múltiples frecuencias"""
         sample_rate = 22050
@@ -95,7 +102,7 @@ class SoundManager:
         wave = np.int16(wave * 32767)
         stereo_wave = np.column_stack((wave, wave))
         
-        return pygame.sndarray.make_sound(stereo_wave)
+        return stereo_wave
     
     def _generate_sweep(self, freq_start, freq_end, duration, volume):
         """Genera un barrido de frecuencia"""
@@ -120,7 +127,7 @@ class SoundManager:
         wave = np.int16(wave * 32767)
         stereo_wave = np.column_stack((wave, wave))
         
-        return pygame.sndarray.make_sound(stereo_wave)
+        return stereo_wave
     
     def _generate_victory(self):
         """Genera sonido de victoria"""
@@ -151,7 +158,7 @@ class SoundManager:
         wave = np.int16(wave * 32767)
         stereo_wave = np.column_stack((wave, wave))
         
-        return pygame.sndarray.make_sound(stereo_wave)
+        return stereo_wave
     
     def _generate_gameover(self):
         """Genera sonido de game over"""
@@ -182,7 +189,7 @@ class SoundManager:
         wave = np.int16(wave * 32767)
         stereo_wave = np.column_stack((wave, wave))
         
-        return pygame.sndarray.make_sound(stereo_wave)
+        return stereo_wave
     
     def play(self, sound_name):
         """Reproduce un sonido"""
@@ -0,0 +1,51 @@
+"""Caché de fuentes y textos renderizados"""
+from collections import OrderedDict
+import pygame
+from settings import *
+
+
+# Cantidad máxima de textos renderizados que se conservan
+MAX_TEXT_SURFACES = 512
+
+_fonts = {}
+_surfaces = OrderedDict()
+
+
+class CachedFont:
+    """Fuente cuyo render pasa por la caché LRU compartida
+    
+    Se usa igual que pygame.font.Font. Las superficies retornadas son
+    compartidas, así que no deben modificarse.
+    """
+    
+    def __init__(self, name, size):
+        self.name = name
+        self.font_size = size
+        self.font = pygame.font.Font(name, size)
+    
+    def render(self, text, antialias, color, background=None):
+        """Retorna el texto renderizado, rasterizándolo solo la primera vez"""
+        key = (self.name, self.font_size, text, tuple(color), antialias,
+               tuple(background) if background is not None else None)
+        surface = _surfaces.get(key)
+        if surface is not None:
+            _surfaces.move_to_end(key)
+            return surface
+        
+        surface = self.font.render(text, antialias, color, background)
+        _surfaces[key] = surface
+        if len(_surfaces) > MAX_TEXT_SURFACES:
+            _surfaces.popitem(last=False)
+        return surface
+    
+    def __getattr__(self, name):
+        # size, get_height, etc. se delegan a la fuente de pygame
+        return getattr(self.font, name)
+
+
+def get_font(size, name=FONT_NAME):
+    """Retorna la fuente compartida para un tamaño (se carga una sola vez)"""
+    font = _fonts.get((name, size))
+    if font is None:
+        font = _fonts[(name, size)] = CachedFont(name, size)
+    return font
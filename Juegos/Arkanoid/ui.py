@@ -1,6 +1,7 @@
 """Interfaz de usuario para Arkanoid"""
 import pygame
 from settings import *
+from text_cache import get_font
 
 
 class Button:
@@ -46,10 +47,10 @@ class UI:
     
     def __init__(self):
         # Fuentes
-        self.font = pygame.font.Font(FONT_NAME, FONT_SIZE)
-        self.font_small = pygame.font.Font(FONT_NAME, 18)
-        self.title_font = pygame.font.Font(FONT_NAME, FONT_TITLE)
-        self.button_font = pygame.font.Font(FONT_NAME, 28)
+        self.font = get_font(FONT_SIZE)
+        self.font_small = get_font(18)
+        self.title_font = get_font(FONT_TITLE)
+        self.button_font = get_font(28)
         
         # Botones del menú principal
         button_width = 250
@@ -0,0 +1,67 @@
+"""Benchmark sin ventana del bucle de Snake
+
+Una serpiente automática va hacia la manzana evitando chocar; al morir
+empieza otra partida del mismo modo.
+
+Uso: python benchmark.py [--ticks N] [--json]
+"""
+import os
+import sys
+DIRECTORIO = os.path.dirname(os.path.abspath(__file__))
+sys.path.append(os.path.dirname(DIRECTORIO))  # Para importar rendimiento
+
+from rendimiento import preparar_sin_ventana, base_en_memoria, ejecutar_benchmark, argumentos, reportar
+preparar_sin_ventana()
+
+import snake
+from config import *
+
+MODO = 'clasico'
+DIRECCIONES = [(TAM, 0), (-TAM, 0), (0, TAM), (0, -TAM)]
+
+
+def elegir_direccion(juego):
+    """Dirección libre que más acerca la cabeza a la manzana"""
+    cabeza_x, cabeza_y = juego.serpiente.get_cabeza()
+    manzana = juego.manzana.get_posicion()
+    actual_dx, actual_dy = juego.serpiente.direccion
+    
+    mejor, mejor_distancia = None, None
+    for dx, dy in DIRECCIONES:
+        if (dx, dy) == (-actual_dx, -actual_dy) and (dx, dy) != (0, 0):
+            continue  # Reversa
+        destino = (cabeza_x + dx, cabeza_y + dy)
+        if juego.modo_actual == 'portal':
+            destino = (destino[0] % ANCHO, destino[1] % ALTO)
+        if destino != manzana and destino not in juego.celdas:
+            continue  # Cuerpo, obstáculo, manzana venenosa o fuera del tablero
+        
+        distancia = abs(destino[0] - manzana[0]) + abs(destino[1] - manzana[1])
+        if mejor is None or distancia < mejor_distancia:
+            mejor, mejor_distancia = (dx, dy), distancia
+    return mejor
+
+
+def main():
+    args = argumentos("Benchmark sin ventana de Snake")
+    base_en_memoria(snake, juegos=["Snake"])
+    juego = snake.Juego()
+    juego.nueva_partida(MODO)
+    
+    def entrada(tick):
+        direccion = elegir_direccion(juego)
+        if direccion is not None:
+            juego.serpiente.cambiar_direccion(*direccion)
+    
+    def actualizar():
+        if not juego.actualizar_logica():
+            juego.nueva_partida(MODO)
+    
+    resultado = ejecutar_benchmark(f"Snake ({MODO})", actualizar, juego.renderizar, entrada,
+                                   args.ticks, args.calentamiento, args.memoria, args.semilla)
+    juego.db.cerrar()
+    reportar(resultado, args.json)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+"""Benchmark: colocar la manzana en un tablero casi lleno
+
+Compara el muestreo por rechazo anterior (randrange hasta acertar una
+celda que no esté en la lista de ocupadas) con el índice CeldasLibres.
+
+Uso: python benchmark_celdas.py
+"""
+import random
+import time
+from config import TAM, ANCHO, ALTO
+from celdas import CeldasLibres
+
+
+def muestreo_por_rechazo(ocupadas, ancho, alto):
+    """Algoritmo anterior de Manzana.generar_nueva_posicion"""
+    while True:
+        x = random.randrange(0, ancho, TAM)
+        y = random.randrange(0, alto, TAM)
+        if (x, y) not in ocupadas:
+            return (x, y)
+
+
+def medir(funcion, repeticiones):
+    """Retorna el tiempo medio por llamada en microsegundos"""
+    inicio = time.perf_counter()
+    for _ in range(repeticiones):
+        funcion()
+    return (time.perf_counter() - inicio) / repeticiones * 1e6
+
+
+def comparar(ancho, alto, libres, repeticiones):
+    """Mide ambos métodos con `libres` celdas sin ocupar"""
+    celdas = CeldasLibres(ancho, alto)
+    total = len(celdas)
+    random.seed(1)
+    todas = list(celdas.libres)
+    random.shuffle(todas)
+    ocupadas = todas[:total - libres]
+
+    # Antes: lista con el cuerpo + obstáculos, como en actualizar_logica
+    lista = list(ocupadas)
+    anterior = medir(lambda: muestreo_por_rechazo(lista, ancho, alto), repeticiones)
+
+    # Ahora: tomar una celda libre y devolverla para mantener el llenado
+    for celda in ocupadas:
+        celdas.ocupar(celda)
+
+    def tomar_y_liberar():
+        celdas.liberar(celdas.tomar_aleatoria())
+
+    actual = medir(tomar_y_liberar, repeticiones)
+
+    lleno = 100 * (total - libres) / total
+    print(f"{ancho // TAM}x{alto // TAM} celdas, {lleno:5.1f}% lleno ({libres} libres): "
+          f"rechazo {anterior:10.1f} µs  |  CeldasLibres {actual:5.2f} µs  "
+          f"(x{anterior / actual:,.0f})")
+
+
+if __name__ == "__main__":
+    print("=" * 60)
+    print("🐍 BENCHMARK: COLOCAR MANZANA")
+    print("=" * 60)
+    comparar(ANCHO, ALTO, 600, 200)
+    comparar(ANCHO, ALTO, 60, 200)
+    comparar(ANCHO, ALTO, 5, 50)
+    comparar(ANCHO, ALTO, 1, 20)
+    comparar(ANCHO * 3, ALTO * 3, 10, 5)
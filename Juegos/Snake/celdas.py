@@ -0,0 +1,53 @@
+"""Índice de celdas libres del tablero"""
+import random
+from config import TAM, ANCHO, ALTO
+
+class CeldasLibres:
+    """Conjunto de celdas libres con elección aleatoria en O(1)
+    
+    Las celdas libres se guardan en una lista y un diccionario indica la
+    posición de cada una en la lista. Para ocupar una celda se mueve la
+    última de la lista a su hueco, así que ocupar, liberar y elegir una
+    celda al azar no dependen de cuán lleno esté el tablero.
+    """
+    
+    def __init__(self, ancho=ANCHO, alto=ALTO, tam=TAM):
+        self.ancho = ancho
+        self.alto = alto
+        self.libres = [(x, y) for y in range(0, alto, tam) for x in range(0, ancho, tam)]
+        self.indice = {celda: i for i, celda in enumerate(self.libres)}
+    
+    def __len__(self):
+        return len(self.libres)
+    
+    def __contains__(self, celda):
+        return celda in self.indice
+    
+    def ocupar(self, celda):
+        """Quita una celda de las libres (no hace nada si ya estaba ocupada)"""
+        i = self.indice.pop(celda, None)
+        if i is None:
+            return
+        
+        ultima = self.libres.pop()
+        if i < len(self.libres):
+            self.libres[i] = ultima
+            self.indice[ultima] = i
+    
+    def liberar(self, celda):
+        """Devuelve una celda del tablero a las libres"""
+        x, y = celda
+        if celda in self.indice or not (0 <= x < self.ancho and 0 <= y < self.alto):
+            return
+        
+        self.indice[celda] = len(self.libres)
+        self.libres.append(celda)
+    
+    def tomar_aleatoria(self):
+        """Ocupa y retorna una celda libre al azar (None si el tablero está lleno)"""
+        if not self.libres:
+            return None
+        
+        celda = self.libres[random.randrange(len(self.libres))]
+        self.ocupar(celda)
+        return celda
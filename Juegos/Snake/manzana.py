@@ -1,24 +1,25 @@
 """Clase que maneja la lógica de la manzana"""
-import random
-from config import TAM, ANCHO, ALTO
 
 class Manzana:
-    def __init__(self):
+    def __init__(self, celdas):
+        self.celdas = celdas  # Índice de celdas libres del tablero
         self.x = 0
         self.y = 0
         self.generar_nueva_posicion()
     
-    def generar_nueva_posicion(self, posiciones_ocupadas=None):
-        """Genera una nueva posición aleatoria evitando posiciones ocupadas"""
-        if posiciones_ocupadas is None:
-            posiciones_ocupadas = []
+    def generar_nueva_posicion(self):
+        """Mueve la manzana a una celda libre al azar y la marca como ocupada
         
-        while True:
-            self.x = random.randrange(0, ANCHO - TAM, TAM)
-            self.y = random.randrange(0, ALTO - TAM, TAM)
-            if (self.x, self.y) not in posiciones_ocupadas:
-                break
+        La celda anterior no se libera: al comerla, la cabeza de la
+        serpiente ya está en ella. Retorna False si el tablero está lleno.
+        """
+        celda = self.celdas.tomar_aleatoria()
+        if celda is None:
+            return False
+        
+        self.x, self.y = celda
+        return True
     
     def get_posicion(self):
         """Retorna la posición de la manzana"""
-        return (self.x, self.y)
\ No newline at end of file
+        return (self.x, self.y)
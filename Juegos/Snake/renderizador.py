@@ -213,12 +213,6 @@ class Renderizador:
         self.mostrar_texto("(A-Z para escribir, ENTER para confirmar)", 
                           ANCHO//2 - 220, ALTO//2 + 100, self.fuente_pequeña, AZUL)
     
-    def dibujar_pantalla_guardando(self):
-        """Muestra mensaje de guardando"""
-        self.limpiar_pantalla()
-        self.mostrar_texto("Guardando puntuación...", ANCHO//2 - 150, ALTO//2, 
-                          self.fuente_mediana, AMARILLO)
-    
     def actualizar(self):
         """Actualiza la pantalla"""
         pygame.display.update()
\ No newline at end of file
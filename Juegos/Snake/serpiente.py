@@ -1,13 +1,23 @@
 """Clase que maneja la lógica de la serpiente"""
-import random
+from collections import deque
 from config import TAM, ANCHO, ALTO
 
 class Serpiente:
-    def __init__(self, x, y):
-        self.cuerpo = [(x, y)]
+    def __init__(self, x, y, envolver=False, celdas=None):
+        # La cola está al inicio y la cabeza al final
+        self.cuerpo = deque([(x, y)])
+        # Celdas ocupadas por el cuerpo, para consultas O(1)
+        self.ocupadas = {(x, y)}
         self.direccion = (0, 0)  # (dx, dy)
         self.longitud = 1
         self.creciendo = False
+        self.envolver = envolver  # Modo portal: atravesar los bordes
+        self.choco_consigo_misma = False
+        
+        # Índice de celdas libres del tablero que se mantiene al moverse
+        self.celdas = celdas
+        if celdas is not None:
+            celdas.ocupar((x, y))
     
     def cambiar_direccion(self, dx, dy):
         """Cambia la dirección si es válida (no reversa)"""
@@ -27,13 +37,24 @@ class Serpiente:
         dx, dy = self.direccion
         cabeza_x, cabeza_y = self.cuerpo[-1]
         nueva_cabeza = (cabeza_x + dx, cabeza_y + dy)
+        if self.envolver:
+            nueva_cabeza = (nueva_cabeza[0] % ANCHO, nueva_cabeza[1] % ALTO)
         
-        self.cuerpo.append(nueva_cabeza)
-        
+        # La cola se libera antes de comprobar el choque: la cabeza puede
+        # entrar en la celda que la cola acaba de dejar
         if not self.creciendo:
-            self.cuerpo.pop(0)
+            cola = self.cuerpo.popleft()
+            self.ocupadas.discard(cola)
+            if self.celdas is not None:
+                self.celdas.liberar(cola)
         else:
             self.creciendo = False
+        
+        self.choco_consigo_misma = nueva_cabeza in self.ocupadas
+        self.cuerpo.append(nueva_cabeza)
+        self.ocupadas.add(nueva_cabeza)
+        if self.celdas is not None:
+            self.celdas.ocupar(nueva_cabeza)
     
     def crecer(self):
         """Marca que la serpiente debe crecer en el próximo movimiento"""
@@ -41,19 +62,22 @@ class Serpiente:
         self.creciendo = True
     
     def colisiona_consigo_misma(self):
-        """Verifica si la cabeza colisiona con el cuerpo"""
-        cabeza = self.cuerpo[-1]
-        return cabeza in self.cuerpo[:-1]
+        """Verifica si la cabeza colisionó con el cuerpo en el último movimiento"""
+        return self.choco_consigo_misma
     
     def colisiona_con_borde(self):
         """Verifica si la cabeza está fuera de los límites"""
         cabeza_x, cabeza_y = self.cuerpo[-1]
         return cabeza_x < 0 or cabeza_x >= ANCHO or cabeza_y < 0 or cabeza_y >= ALTO
     
+    def ocupa(self, posicion):
+        """Verifica si alguna parte del cuerpo está en la posición"""
+        return posicion in self.ocupadas
+    
     def get_cabeza(self):
         """Retorna la posición de la cabeza"""
         return self.cuerpo[-1]
     
     def get_cuerpo(self):
         """Retorna todo el cuerpo"""
-        return self.cuerpo
\ No newline at end of file
+        return self.cuerpo
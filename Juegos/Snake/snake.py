@@ -4,6 +4,7 @@ import time
 from config import *
 from serpiente import Serpiente
 from manzana import Manzana
+from celdas import CeldasLibres
 from renderizador import Renderizador
 from db import DatabaseManager
 
@@ -24,16 +25,11 @@ class Juego:
         self.mejores_puntajes = {}  # Guardará el mejor puntaje de cada modo
     
     def cargar_mejores_puntajes(self):
-        """Carga los mejores puntajes de cada modo"""
+        """Carga los mejores puntajes de cada modo con una sola consulta"""
+        self.db.esperar_escrituras()  # Incluir la partida recién guardada
+        mejores = self.db.obtener_mejores_por_variante("Snake")
         for key, modo in MODOS_JUEGO.items():
-            # Obtenemos todos los puntajes de Snake y filtramos por modo
-            top = self.db.obtener_top_puntuaciones("Snake", 100)
-            # Filtrar solo los que corresponden a este modo
-            puntajes_modo = [p for p in top if p[0].endswith(f"-{modo['nombre']}")]
-            if puntajes_modo:
-                self.mejores_puntajes[key] = puntajes_modo[0][1]
-            else:
-                self.mejores_puntajes[key] = 0
+            self.mejores_puntajes[key] = mejores.get(modo['nombre'], 0)
     
     def menu_modos(self):
         """Muestra el menú de selección de modos"""
@@ -71,23 +67,21 @@ class Juego:
         self.modo_actual = modo
         x = ANCHO // 2
         y = ALTO // 2
-        self.serpiente = Serpiente(x, y)
-        self.manzana = Manzana()
+        self.celdas = CeldasLibres()
+        self.serpiente = Serpiente(x, y, envolver=(modo == 'portal'), celdas=self.celdas)
+        self.manzana = Manzana(self.celdas)
         self.puntaje = 0
         self.fps_actual = FPS
         
         # Variables específicas del modo
         self.manzana_veneno = None
-        self.obstaculos = []
+        self.obstaculos = set()
         self.tiempo_inicio = None
         self.tiempo_restante = 60
         
         # Configurar según el modo
         if modo == 'veneno':
-            self.manzana_veneno = Manzana()
-            self.manzana_veneno.generar_nueva_posicion(
-                self.serpiente.get_cuerpo() + [self.manzana.get_posicion()]
-            )
+            self.manzana_veneno = Manzana(self.celdas)
         
         elif modo == 'laberinto':
             self.generar_obstaculos()
@@ -97,22 +91,15 @@ class Juego:
     
     def generar_obstaculos(self):
         """Genera obstáculos aleatorios para el modo laberinto"""
-        import random
-        self.obstaculos = []
+        self.obstaculos = set()
         num_obstaculos = 15
         
         for _ in range(num_obstaculos):
-            while True:
-                x = random.randrange(0, ANCHO, TAM)
-                y = random.randrange(0, ALTO, TAM)
-                pos = (x, y)
-                
-                # Verificar que no esté en la serpiente o manzana
-                if (pos not in self.serpiente.get_cuerpo() and 
-                    pos != self.manzana.get_posicion() and
-                    pos not in self.obstaculos):
-                    self.obstaculos.append(pos)
-                    break
+            # Solo celdas libres: ni serpiente, ni manzana, ni otro obstáculo
+            pos = self.celdas.tomar_aleatoria()
+            if pos is None:
+                break
+            self.obstaculos.add(pos)
     
     def manejar_eventos(self):
         """Maneja los eventos del teclado"""
@@ -141,18 +128,8 @@ class Juego:
         self.mostrando_puntajes = True
         
         nombre_modo = MODOS_JUEGO[self.modo_actual]['nombre']
-        # Obtener todos los puntajes de Snake y filtrar por modo
-        todos_puntajes = self.db.obtener_top_puntuaciones("Snake", 100)
-        # Filtrar solo los del modo actual y limpiar el nombre
-        top_puntajes = []
-        for username, score, fecha in todos_puntajes:
-            if username.endswith(f"-{nombre_modo}"):
-                # Remover el sufijo del modo para mostrar solo iniciales
-                username_limpio = username.replace(f"-{nombre_modo}", "")
-                top_puntajes.append((username_limpio, score, fecha))
-        
-        # Limitar a top 10
-        top_puntajes = top_puntajes[:10]
+        self.db.esperar_escrituras()
+        top_puntajes = self.db.obtener_top_puntuaciones("Snake", 10, nombre_modo)
         
         while self.mostrando_puntajes:
             for evento in pygame.event.get():
@@ -180,22 +157,9 @@ class Juego:
             if self.tiempo_restante <= 0:
                 return False
         
-        # Verificar colisiones según el modo
-        if self.modo_actual == 'portal':
-            # En modo portal, teletransportar en los bordes
-            cabeza = list(self.serpiente.get_cabeza())
-            if cabeza[0] < 0:
-                cabeza[0] = ANCHO - TAM
-            elif cabeza[0] >= ANCHO:
-                cabeza[0] = 0
-            if cabeza[1] < 0:
-                cabeza[1] = ALTO - TAM
-            elif cabeza[1] >= ALTO:
-                cabeza[1] = 0
-            
-            self.serpiente.cuerpo[-1] = tuple(cabeza)
-        else:
-            # En otros modos, colisión con borde = game over
+        # En modo portal la serpiente atraviesa los bordes al moverse;
+        # en los demás modos, colisión con borde = game over
+        if self.modo_actual != 'portal':
             if self.serpiente.colisiona_con_borde():
                 return False
         
@@ -217,14 +181,9 @@ class Juego:
             if self.modo_actual == 'velocidad':
                 self.fps_actual = min(FPS + self.puntaje * 2, 30)
             
-            # Generar nueva manzana
-            posiciones_ocupadas = self.serpiente.get_cuerpo().copy()
-            if self.modo_actual == 'veneno' and self.manzana_veneno:
-                posiciones_ocupadas.append(self.manzana_veneno.get_posicion())
-            if self.modo_actual == 'laberinto':
-                posiciones_ocupadas.extend(self.obstaculos)
-            
-            self.manzana.generar_nueva_posicion(posiciones_ocupadas)
+            # Generar nueva manzana en una celda libre
+            if not self.manzana.generar_nueva_posicion():
+                return False  # Tablero lleno
         
         # Modo veneno: verificar colisión con manzana venenosa
         if self.modo_actual == 'veneno' and self.manzana_veneno:
@@ -305,13 +264,8 @@ class Juego:
             nombre = self.pedir_nombre()
             
             if nombre:
-                self.renderizador.dibujar_pantalla_guardando()
-                self.renderizador.actualizar()
-                pygame.time.delay(500)
-                
-                # Guardar con el nombre del modo como sufijo para diferenciarlo
-                username_con_modo = f"{nombre}-{nombre_modo}"
-                self.db.guardar_puntuacion(username_con_modo, "Snake", self.puntaje)
+                # El modo se guarda como variante de la puntuación
+                self.db.guardar_puntuacion(nombre, "Snake", self.puntaje, nombre_modo)
         
         # Mostrar pantalla de game over
         self.renderizador.dibujar_pantalla_game_over_modo(
@@ -0,0 +1,8 @@
+"""Banco de sonidos en disco compartido por los juegos
+
+Los juegos sintetizan sus sonidos con NumPy. cargar_sonidos guarda las
+muestras en un archivo junto al juego y en los siguientes arranques las
+abre con np.memmap, volviendo a sintetizar solo si cambian las recetas
+o el código del generador.
+"""
+from .banco import cargar_sonidos, firma_recetas, leer_banco, escribir_banco
@@ -0,0 +1,100 @@
+"""Archivo con los sonidos ya generados de un juego
+
+Formato: una primera línea JSON con la firma y, por sonido, su posición
+y forma dentro del cuerpo; después las muestras int16 de todos los
+sonidos, una tras otra. El cuerpo se abre con np.memmap, así que cargar
+el banco no copia ni recalcula nada.
+"""
+import hashlib
+import json
+import os
+
+import numpy as np
+
+FORMATO = "banco-sonidos"
+VERSION = 1
+
+
+def firma_recetas(recetas, origen=None):
+    """Hash de las recetas y del código que las sintetiza
+
+    `origen` es el archivo del generador (normalmente el __file__ de
+    sounds.py): si cambia el código, cambia la firma aunque las recetas
+    sean las mismas.
+    """
+    h = hashlib.sha256(json.dumps(recetas, sort_keys=True).encode('utf-8'))
+    if origen:
+        with open(origen, 'rb') as f:
+            h.update(f.read())
+    return h.hexdigest()
+
+
+def leer_banco(ruta, firma):
+    """Retorna {nombre: muestras} del banco, o None si no existe o no coincide la firma"""
+    try:
+        with open(ruta, 'rb') as f:
+            cabecera = json.loads(f.readline().decode('utf-8'))
+            inicio = f.tell()
+            tamano = os.fstat(f.fileno()).st_size - inicio
+    except (OSError, ValueError):
+        return None
+
+    if (not isinstance(cabecera, dict) or cabecera.get('formato') != FORMATO or
+            cabecera.get('version') != VERSION or cabecera.get('firma') != firma):
+        return None
+
+    sonidos = {}
+    try:
+        cuerpo = np.memmap(ruta, dtype=np.int16, mode='r', offset=inicio) if tamano else None
+        for nombre, (desde, forma) in cabecera['sonidos'].items():
+            cantidad = int(np.prod(forma))
+            if cuerpo is None or desde < 0 or desde + cantidad > len(cuerpo):
+                return None
+            sonidos[nombre] = cuerpo[desde:desde + cantidad].reshape(forma)
+    except (KeyError, TypeError, ValueError, OSError):
+        return None
+    return sonidos
+
+
+def escribir_banco(ruta, firma, sonidos):
+    """Guarda los sonidos en el banco (escribe a un temporal y lo reemplaza)"""
+    indice = {}
+    desde = 0
+    for nombre, muestras in sonidos.items():
+        indice[nombre] = [desde, list(muestras.shape)]
+        desde += muestras.size
+
+    cabecera = {'formato': FORMATO, 'version': VERSION, 'firma': firma, 'sonidos': indice}
+    temporal = f"{ruta}.{os.getpid()}.tmp"
+    try:
+        with open(temporal, 'wb') as f:
+            f.write((json.dumps(cabecera) + '\n').encode('utf-8'))
+            for muestras in sonidos.values():
+                f.write(np.ascontiguousarray(muestras, dtype='<i2').tobytes())
+        os.replace(temporal, ruta)
+    finally:
+        if os.path.exists(temporal):
+            os.remove(temporal)
+
+
+def cargar_sonidos(ruta, recetas, sintetizar, origen=None):
+    """Retorna {nombre: muestras int16} desde el banco, generándolo si hace falta
+
+    `recetas` es un dict nombre -> parámetros (serializables a JSON) y
+    sintetizar(nombre, parametros) retorna las muestras de un sonido. Si el
+    banco no existe, está dañado o se generó con otras recetas u otro
+    código, se sintetizan todos los sonidos y se vuelve a escribir.
+    """
+    firma = firma_recetas(recetas, origen)
+    sonidos = leer_banco(ruta, firma)
+    if sonidos is not None and set(sonidos) == set(recetas):
+        return sonidos
+
+    sonidos = {nombre: np.asarray(sintetizar(nombre, parametros), dtype=np.int16)
+               for nombre, parametros in recetas.items()}
+    try:
+        escribir_banco(ruta, firma, sonidos)
+    except OSError as e:
+        # Sin permiso de escritura se juega igual, solo que sin caché
+        print(f"⚠ No se pudo guardar el banco de sonidos: {e}")
+    return sonidos
@@ -0,0 +1,109 @@
+"""Ejecuta el benchmark sin ventana de todos los juegos
+
+Cada juego corre en su propio proceso desde su carpeta (los módulos
+config, db, main... se llaman igual en varios juegos).
+
+Uso:
+    python benchmark.py [--ticks N] [--juegos Snake Arkanoid ...]
+                        [--salida resultados.json] [--comparar anterior.json]
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+
+DIRECTORIO = os.path.dirname(os.path.abspath(__file__))
+
+JUEGOS = [
+    'Snake', 'Arkanoid', 'dino_chrome', 'flappy_bird',
+    'memory_game', 'racing_game', 'sonic', 'space_invaders',
+]
+
+COLUMNAS = [
+    ('ticks_por_segundo', 'ticks/s'),
+    ('actualizar_p50_ms', 'upd p50'),
+    ('actualizar_p99_ms', 'upd p99'),
+    ('renderizar_p50_ms', 'ren p50'),
+    ('renderizar_p99_ms', 'ren p99'),
+    ('kb_por_frame', 'KB/frame'),
+]
+
+
+def ejecutar_juego(carpeta, opciones):
+    """Ejecuta el benchmark.py de un juego y retorna su resultado (o None)"""
+    comando = [sys.executable, 'benchmark.py', '--json'] + opciones
+    proceso = subprocess.run(comando, cwd=os.path.join(DIRECTORIO, carpeta),
+                             capture_output=True, text=True)
+    lineas = proceso.stdout.strip().splitlines()
+    if proceso.returncode != 0 or not lineas:
+        print(f"✗ {carpeta}: el benchmark falló (código {proceso.returncode})")
+        print(proceso.stderr.strip()[-2000:])
+        return None
+
+    resultado = json.loads(lineas[-1])
+    resultado['carpeta'] = carpeta
+    return resultado
+
+
+def imprimir_tabla(resultados, anteriores):
+    """Imprime los resultados y, si hay, el cambio respecto a otra ejecución"""
+    print(f"{'Juego':<26}" + "".join(f"{titulo:>10}" for _, titulo in COLUMNAS))
+    for resultado in resultados:
+        print(f"{resultado['juego']:<26}" +
+              "".join(f"{resultado[clave] if resultado[clave] is not None else '-':>10}"
+                      for clave, _ in COLUMNAS))
+
+        anterior = anteriores.get(resultado['carpeta'])
+        if anterior:
+            cambios = []
+            for clave, _ in COLUMNAS:
+                antes, ahora = anterior.get(clave), resultado[clave]
+                if antes and ahora is not None:
+                    cambios.append(f"{(ahora - antes) / antes * 100:+.0f}%")
+                else:
+                    cambios.append("-")
+            print(f"{'  vs anterior':<26}" + "".join(f"{c:>10}" for c in cambios))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark sin ventana de todos los juegos")
+    parser.add_argument("--ticks", type=int, default=600)
+    parser.add_argument("--calentamiento", type=int, default=60)
+    parser.add_argument("--memoria", type=int, default=200)
+    parser.add_argument("--semilla", type=int, default=1)
+    parser.add_argument("--juegos", nargs="+", choices=JUEGOS, default=JUEGOS)
+    parser.add_argument("--salida", help="guardar los resultados en este archivo JSON")
+    parser.add_argument("--comparar", help="archivo JSON de una ejecución anterior")
+    args = parser.parse_args()
+
+    opciones = ['--ticks', str(args.ticks), '--calentamiento', str(args.calentamiento),
+                '--memoria', str(args.memoria), '--semilla', str(args.semilla)]
+
+    resultados = []
+    for carpeta in args.juegos:
+        print(f"⏱️  {carpeta}...")
+        resultado = ejecutar_juego(carpeta, opciones)
+        if resultado:
+            resultados.append(resultado)
+
+    anteriores = {}
+    if args.comparar:
+        with open(args.comparar, encoding="utf-8") as archivo:
+            anteriores = {r['carpeta']: r for r in json.load(archivo)}
+
+    print("=" * 86)
+    imprimir_tabla(resultados, anteriores)
+    print("=" * 86)
+
+    if args.salida:
+        with open(args.salida, "w", encoding="utf-8") as archivo:
+            json.dump(resultados, archivo, ensure_ascii=False, indent=2)
+        print(f"✓ Resultados guardados en {args.salida}")
+
+    if len(resultados) < len(args.juegos):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
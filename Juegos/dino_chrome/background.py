@@ -1,12 +1,16 @@
 """Elementos del fondo: piso, nubes y estrellas"""
-import pygame
+import math
 import random
 from settings import *
-from sprites import SpriteGenerator
+from sprites import get_sprite
 
 
 class Ground:
-    """Representa el piso que se desplaza"""
+    """Representa el piso que se desplaza
+    
+    El piso es una tira pre-dibujada (día y noche) de dos pantallas de
+    ancho; dibujarlo son dos blits en la posición de desplazamiento.
+    """
     
     def __init__(self):
         self.x1 = 0
@@ -14,20 +18,8 @@ class Ground:
         self.y = GROUND_Y
         self.speed = INITIAL_OBSTACLE_SPEED
         
-        # Crear patrón del piso
-        self.tile_width = 20
-        self.create_ground_pattern()
-    
-    def create_ground_pattern(self):
-        """Crea el patrón visual del piso"""
-        self.pattern = pygame.Surface((self.tile_width, GROUND_HEIGHT))
-        self.pattern.fill(COLOR_DAY_GROUND)
-        
-        # Agregar algunos píxeles aleatorios para textura
-        for _ in range(5):
-            x = random.randint(0, self.tile_width - 1)
-            y = random.randint(0, GROUND_HEIGHT - 1)
-            pygame.draw.rect(self.pattern, (100, 100, 100), (x, y, 1, 1))
+        # Tiras del piso por modo (False = día, True = noche)
+        self.strips = {night: get_sprite('ground_strip', night) for night in (False, True)}
     
     def update(self, speed):
         """Actualiza la posición del piso"""
@@ -43,20 +35,12 @@ class Ground:
     
     def draw(self, screen, night_mode=False):
         """Dibuja el piso"""
-        color = COLOR_NIGHT_GROUND if night_mode else COLOR_DAY_GROUND
+        strip = self.strips[night_mode]
         
-        # Dibujar línea del piso
-        pygame.draw.line(screen, color, (0, self.y), (WINDOW_WIDTH, self.y), 2)
-        
-        # Dibujar patrón de tiles
-        x_offset = int(self.x1) % self.tile_width
-        for x in range(-self.tile_width, WINDOW_WIDTH + self.tile_width, self.tile_width):
-            # Dibujar pequeños segmentos en el piso
-            if random.random() > 0.7:
-                segment_x = x + x_offset
-                pygame.draw.line(screen, color, 
-                               (segment_x, self.y + 2), 
-                               (segment_x + 3, self.y + 2), 2)
+        # x1 avanza de a una tira al reiniciarse, así que el módulo no salta
+        x = math.floor(self.x1) % GROUND_STRIP_WIDTH - GROUND_STRIP_WIDTH
+        screen.blit(strip, (x, self.y - 1))
+        screen.blit(strip, (x + GROUND_STRIP_WIDTH, self.y - 1))
     
     def reset(self):
         """Reinicia el piso"""
@@ -72,13 +56,15 @@ class Cloud:
         self.is_star = is_star
         
         if is_star:
-            self.sprite = SpriteGenerator.create_star()
+            sprite_name = 'star'
             self.width = 4
             self.height = 4
         else:
-            self.sprite = SpriteGenerator.create_cloud()
+            sprite_name = 'cloud'
             self.width = CLOUD_WIDTH
             self.height = CLOUD_HEIGHT
+        self.sprite = get_sprite(sprite_name)
+        self.night_sprite = get_sprite(sprite_name, night=True)
         
         self.x = x if x is not None else WINDOW_WIDTH + random.randint(0, 300)
         self.y = random.randint(CLOUD_MIN_Y, CLOUD_MAX_Y)
@@ -88,9 +74,10 @@ class Cloud:
         """Actualiza la posición de la nube/estrella"""
         self.x -= self.speed
     
-    def draw(self, screen):
+    def draw(self, screen, night_mode=False):
         """Dibuja la nube/estrella"""
-        screen.blit(self.sprite, (int(self.x), int(self.y)))
+        sprite = self.night_sprite if night_mode else self.sprite
+        screen.blit(sprite, (int(self.x), int(self.y)))
     
     def is_off_screen(self):
         """Verifica si está fuera de la pantalla"""
@@ -127,10 +114,10 @@ class CloudManager:
             self.spawn_timer = 0
             self.spawn_interval = random.uniform(2, 4)
     
-    def draw(self, screen):
+    def draw(self, screen, night_mode=False):
         """Dibuja todas las nubes/estrellas"""
         for cloud in self.clouds:
-            cloud.draw(screen)
+            cloud.draw(screen, night_mode)
     
     def switch_mode(self, night_mode):
         """Cambia entre nubes y estrellas"""
@@ -0,0 +1,49 @@
+"""Benchmark sin ventana del bucle de Dino Chrome
+
+El dinosaurio salta cuando el siguiente cactus está cerca; al chocar
+empieza otra partida.
+
+Uso: python benchmark.py [--ticks N] [--json]
+"""
+import os
+import sys
+DIRECTORIO = os.path.dirname(os.path.abspath(__file__))
+sys.path.append(os.path.dirname(DIRECTORIO))  # Para importar rendimiento
+
+from rendimiento import preparar_sin_ventana, base_en_memoria, ejecutar_benchmark, argumentos, reportar
+preparar_sin_ventana()
+
+import main as dino
+from settings import *
+
+
+def main():
+    args = argumentos("Benchmark sin ventana de Dino Chrome")
+    base_en_memoria(dino, juegos=[GAME_NAME])
+    juego = dino.DinoGame()
+    
+    def entrada(tick):
+        if juego.state != "playing":
+            juego.start_game()
+        juego.game_started = True
+        
+        # Saltar unos frames antes de llegar al cactus
+        jugador = juego.player
+        manager = juego.obstacle_manager
+        for obstaculo in manager.obstacles:
+            distancia = obstaculo.x - (jugador.x + DINO_WIDTH)
+            if 0 <= distancia < manager.speed * 12:
+                jugador.jump()
+                break
+    
+    def actualizar():
+        juego.update(1 / FPS)
+    
+    resultado = ejecutar_benchmark("Dino Chrome", actualizar, juego.draw, entrada,
+                                   args.ticks, args.calentamiento, args.memoria, args.semilla)
+    juego.db.cerrar()
+    reportar(resultado, args.json)
+
+
+if __name__ == "__main__":
+    main()
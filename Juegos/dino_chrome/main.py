@@ -1,5 +1,6 @@
 """Juego Dino Chrome - Archivo principal"""
 import pygame
+import os
 import sys
 from settings import *
 from player import Player
@@ -9,6 +10,9 @@ from ui import UI
 from sounds import SoundManager
 from db import DatabaseManager
 
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))  # Para importar motor
+from motor import BucleFijo, Interpolador
+
 
 class DinoGame:
     """Clase principal del juego Dino Chrome"""
@@ -19,6 +23,10 @@ class DinoGame:
         pygame.display.set_caption("Dino Chrome")
         self.clock = pygame.time.Clock()
         
+        # Simulación a paso fijo y dibujo interpolado entre pasos
+        self.bucle = BucleFijo(FPS, RENDER_FPS, reloj=self.clock)
+        self.interpolador = Interpolador('x', 'y', 'x1', 'x2')
+        
         # Componentes del juego
         self.player = Player()
         self.obstacle_manager = ObstacleManager()
@@ -34,8 +42,11 @@ class DinoGame:
         
         # Puntuación
         self.score = 0
-        self.best_score = self.db.obtener_mejor_puntuacion(self.username, GAME_NAME)
+        self.best_score = 0
+        self.best_score_known = False
+        self.load_best_score()
         self.is_record = False
+        self.records = []
         self.last_checkpoint = 0
         
         # Modo noche
@@ -65,7 +76,7 @@ class DinoGame:
                     self.start_game()
                 elif self.ui.menu_buttons['records'].is_clicked(mouse_pos, mouse_pressed):
                     self.sounds.play('jump')
-                    self.state = "records"
+                    self.show_records()
                 elif self.ui.menu_buttons['exit'].is_clicked(mouse_pos, mouse_pressed):
                     self.quit_game()
             
@@ -94,8 +105,20 @@ class DinoGame:
                             self.player.jump()
                             self.sounds.play('jump')
     
+    def load_best_score(self):
+        """Lee la mejor puntuación del jugador
+        
+        Si la base no responde se reintenta al empezar la próxima partida.
+        """
+        best = self.db.obtener_mejor_puntuacion(self.username, GAME_NAME, por_defecto=None)
+        self.best_score_known = best is not None
+        if self.best_score_known:
+            self.best_score = best
+    
     def start_game(self):
         """Inicia una nueva partida"""
+        if not self.best_score_known:
+            self.load_best_score()
         self.player.reset()
         self.obstacle_manager.reset()
         self.ground.reset()
@@ -115,16 +138,13 @@ class DinoGame:
         """Finaliza la partida"""
         self.sounds.play('crash')
         
-        # Guardar puntuación
-        self.db.guardar_puntuacion(self.username, GAME_NAME, int(self.score))
+        # Verificar récord contra la mejor puntuación ya conocida
+        self.is_record = self.best_score_known and int(self.score) > self.best_score
+        if int(self.score) > self.best_score:
+            self.best_score = int(self.score)
         
-        # Verificar récord
-        self.is_record = self.db.verificar_nuevo_record(self.username, GAME_NAME, int(self.score))
-        
-        # Actualizar mejor puntuación
-        new_best = self.db.obtener_mejor_puntuacion(self.username, GAME_NAME)
-        if new_best > self.best_score:
-            self.best_score = new_best
+        # Guardar puntuación (se escribe en segundo plano)
+        self.db.guardar_puntuacion(self.username, GAME_NAME, int(self.score))
         
         self.state = "game_over"
     
@@ -163,7 +183,8 @@ class DinoGame:
                     self.cloud_manager.switch_mode(False)
             
             # Verificar colisiones
-            if self.obstacle_manager.check_collision(self.player.get_collision_rect()):
+            if self.obstacle_manager.check_collision(self.player.get_collision_rect(),
+                                                   self.player.get_mask()):
                 self.player.die()
                 self.end_game()
     
@@ -180,7 +201,7 @@ class DinoGame:
             self.screen.fill(bg_color)
             
             # Nubes/estrellas
-            self.cloud_manager.draw(self.screen)
+            self.cloud_manager.draw(self.screen, self.night_mode)
             
             # Piso
             self.ground.draw(self.screen, self.night_mode)
@@ -203,7 +224,7 @@ class DinoGame:
             bg_color = COLOR_NIGHT_BG if self.night_mode else COLOR_DAY_BG
             self.screen.fill(bg_color)
             
-            self.cloud_manager.draw(self.screen)
+            self.cloud_manager.draw(self.screen, self.night_mode)
             self.ground.draw(self.screen, self.night_mode)
             self.obstacle_manager.draw(self.screen, self.night_mode)
             self.player.draw(self.screen, self.night_mode)
@@ -215,11 +236,16 @@ class DinoGame:
                                   self.clock.get_time() / 1000.0, self.night_mode)
         
         elif self.state == "records":
-            records = self.db.obtener_top_puntuaciones(GAME_NAME, 10)
-            self.ui.draw_records(self.screen, records, mouse_pos)
+            self.ui.draw_records(self.screen, self.records, mouse_pos)
         
         pygame.display.flip()
     
+    def show_records(self):
+        """Carga la tabla de récords una vez y muestra la pantalla"""
+        self.db.esperar_escrituras()
+        self.records = self.db.obtener_top_puntuaciones(GAME_NAME, 10)
+        self.state = "records"
+    
     def quit_game(self):
         """Cierra el juego"""
         self.db.cerrar()
@@ -242,11 +268,17 @@ class DinoGame:
         print("=" * 60)
         
         while True:
-            delta_time = self.clock.tick(FPS) / 1000.0
+            pasos = self.bucle.frame()
             
             self.handle_events()
-            self.update(delta_time)
-            self.draw()
+            for _ in range(pasos):
+                self.interpolador.guardar(
+                    [self.player, self.ground] + self.obstacle_manager.obstacles
+                    + self.cloud_manager.clouds)
+                self.update(self.bucle.paso)
+            
+            with self.interpolador.aplicar(self.bucle.alpha):
+                self.draw()
 
 
 if __name__ == "__main__":
@@ -2,7 +2,7 @@
 import pygame
 import random
 from settings import *
-from sprites import SpriteGenerator
+from sprites import get_sprite, get_mask
 
 
 class Obstacle:
@@ -12,13 +12,16 @@ class Obstacle:
         self.type = obstacle_type
         
         if obstacle_type == 'small':
-            self.sprite = SpriteGenerator.create_cactus_small()
+            sprite_name = 'cactus_small'
             self.width = CACTUS_SMALL_WIDTH
             self.height = CACTUS_SMALL_HEIGHT
         else:
-            self.sprite = SpriteGenerator.create_cactus_large()
+            sprite_name = 'cactus_large'
             self.width = CACTUS_LARGE_WIDTH
             self.height = CACTUS_LARGE_HEIGHT
+        self.sprite = get_sprite(sprite_name)
+        self.night_sprite = get_sprite(sprite_name, night=True)
+        self.mask = get_mask(sprite_name)
         
         self.x = x
         self.y = GROUND_Y - self.height
@@ -33,16 +36,8 @@ class Obstacle:
     
     def draw(self, screen, night_mode=False):
         """Dibuja el obstáculo"""
-        if night_mode:
-            # Recolorear para modo noche
-            colored_sprite = self.sprite.copy()
-            pixels = pygame.surfarray.pixels3d(colored_sprite)
-            mask = (pixels[:, :, 0] == 83) & (pixels[:, :, 1] == 83) & (pixels[:, :, 2] == 83)
-            pixels[mask] = [150, 150, 150]
-            del pixels
-            screen.blit(colored_sprite, (int(self.x), int(self.y)))
-        else:
-            screen.blit(self.sprite, (int(self.x), int(self.y)))
+        sprite = self.night_sprite if night_mode else self.sprite
+        screen.blit(sprite, (int(self.x), int(self.y)))
     
     def is_off_screen(self):
         """Verifica si el obstáculo está fuera de la pantalla"""
@@ -94,11 +89,17 @@ class ObstacleManager:
         for obstacle in self.obstacles:
             obstacle.draw(screen, night_mode)
     
-    def check_collision(self, player_rect):
-        """Verifica colisión con el jugador"""
+    def check_collision(self, player_rect, player_mask):
+        """Verifica colisión con el jugador píxel a píxel
+        
+        Las máscaras solo se comparan si los rectángulos se superponen.
+        """
         for obstacle in self.obstacles:
-            if player_rect.colliderect(obstacle.get_collision_rect()):
-                return True
+            rect = obstacle.get_collision_rect()
+            if player_rect.colliderect(rect):
+                offset = (rect.x - player_rect.x, rect.y - player_rect.y)
+                if player_mask.overlap(obstacle.mask, offset):
+                    return True
         return False
     
     def reset(self):
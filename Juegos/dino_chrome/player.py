@@ -1,7 +1,7 @@
 """Clase del jugador (Dinosaurio)"""
 import pygame
 from settings import *
-from sprites import SpriteGenerator
+from sprites import get_sprite, get_mask
 
 
 class Player:
@@ -9,11 +9,12 @@ class Player:
     
     def __init__(self):
         # Sprites
-        self.run_sprites = [
-            SpriteGenerator.create_dino_run1(),
-            SpriteGenerator.create_dino_run2()
-        ]
-        self.dead_sprite = SpriteGenerator.create_dino_dead()
+        # Sprites por modo (False = día, True = noche)
+        self.run_sprites = {night: [get_sprite('dino_run1', night), get_sprite('dino_run2', night)]
+                            for night in (False, True)}
+        self.dead_sprites = {night: get_sprite('dino_dead', night) for night in (False, True)}
+        self.run_masks = [get_mask('dino_run1'), get_mask('dino_run2')]
+        self.dead_mask = get_mask('dino_dead')
         
         # Posición y física
         self.x = DINO_X
@@ -27,8 +28,9 @@ class Player:
         self.animation_timer = 0
         self.animation_speed = 0.1  # segundos por frame
         
-        # Rectángulo de colisión (más pequeño que el sprite para mejor jugabilidad)
-        self.rect = pygame.Rect(self.x + 5, self.y + 5, DINO_WIDTH - 10, DINO_HEIGHT - 10)
+        # Rectángulo del sprite: descarta rápido los obstáculos lejanos antes de
+        # comparar las máscaras píxel a píxel
+        self.rect = pygame.Rect(self.x, self.y, DINO_WIDTH, DINO_HEIGHT)
     
     def jump(self):
         """Hace que el dinosaurio salte"""
@@ -57,29 +59,20 @@ class Player:
             self.animation_timer += delta_time
             if self.animation_timer >= self.animation_speed:
                 self.animation_timer = 0
-                self.animation_index = (self.animation_index + 1) % len(self.run_sprites)
+                self.animation_index = (self.animation_index + 1) % len(self.run_sprites[False])
         
         # Actualizar rectángulo de colisión
-        self.rect.y = int(self.y) + 5
+        self.rect.y = int(self.y)
     
     def draw(self, screen, night_mode=False):
         """Dibuja el dinosaurio"""
+        # El modo noche solo elige la variante ya recoloreada
         if self.is_dead:
-            sprite = self.dead_sprite
+            sprite = self.dead_sprites[night_mode]
         else:
-            sprite = self.run_sprites[self.animation_index]
+            sprite = self.run_sprites[night_mode][self.animation_index]
         
-        # Recolorear para modo noche
-        if night_mode:
-            colored_sprite = sprite.copy()
-            pixels = pygame.surfarray.pixels3d(colored_sprite)
-            # Cambiar color gris oscuro a gris claro para modo noche
-            mask = (pixels[:, :, 0] == 83) & (pixels[:, :, 1] == 83) & (pixels[:, :, 2] == 83)
-            pixels[mask] = [150, 150, 150]
-            del pixels
-            screen.blit(colored_sprite, (int(self.x), int(self.y)))
-        else:
-            screen.blit(sprite, (int(self.x), int(self.y)))
+        screen.blit(sprite, (int(self.x), int(self.y)))
     
     def die(self):
         """Marca al dinosaurio como muerto"""
@@ -96,4 +89,10 @@ class Player:
     
     def get_collision_rect(self):
         """Retorna el rectángulo de colisión"""
-        return self.rect
\ No newline at end of file
+        return self.rect
+    
+    def get_mask(self):
+        """Retorna la máscara de colisión del cuadro actual"""
+        if self.is_dead:
+            return self.dead_mask
+        return self.run_masks[self.animation_index]
\ No newline at end of file
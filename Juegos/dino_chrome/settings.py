@@ -3,7 +3,8 @@
 # Configuración de ventana
 WINDOW_WIDTH = 1000
 WINDOW_HEIGHT = 500
-FPS = 60
+FPS = 60  # Pasos de simulación por segundo
+RENDER_FPS = 60  # Límite de frames dibujados (p. ej. 144 en monitores rápidos; 0 = sin límite)
 
 # Colores
 COLOR_DAY_BG = (247, 247, 247)
@@ -27,6 +28,8 @@ GRAVITY = 0.8
 # Configuración del piso
 GROUND_HEIGHT = 12
 GROUND_Y = 350
+GROUND_STRIP_WIDTH = WINDOW_WIDTH * 2  # Tira pre-dibujada que se desplaza
+GROUND_SEED = 7  # Semilla de las marcas del piso (siempre las mismas)
 
 # Configuración de obstáculos
 CACTUS_SMALL_WIDTH = 17
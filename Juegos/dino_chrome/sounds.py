@@ -1,7 +1,23 @@
 """Sistema de sonidos para el juego Dino"""
+import os
+import sys
 import pygame
 import numpy as np
 
+DIRECTORIO = os.path.dirname(os.path.abspath(__file__))
+sys.path.append(os.path.dirname(DIRECTORIO))  # Para importar banco_sonidos
+from banco_sonidos import cargar_sonidos
+
+# Sonidos ya generados; se rehacen si cambian las recetas o este archivo
+SOUND_BANK = os.path.join(DIRECTORIO, 'sonidos.bank')
+
+# Generador y parámetros de cada sonido
+SOUND_RECIPES = {
+    'jump': ['sweep', 300, 500, 0.1, 0.25],  # Salto (tono ascendente corto)
+    'crash': ['crash'],                      # Choque (ruido descendente)
+    'checkpoint': ['checkpoint'],            # Checkpoint (ding agradable)
+}
+
 
 class SoundManager:
     """Maneja todos los sonidos del juego"""
@@ -36,24 +52,16 @@ class SoundManager:
         wave = np.int16(wave * 32767)
         stereo_wave = np.column_stack((wave, wave))
         
-        sound = pygame.sndarray.make_sound(stereo_wave)
-        return sound
+        return stereo_wave
     
     def _generate_sounds(self):
-        """Genera todos los sonidos del juego"""
+        """Carga los sonidos del banco en disco, generándolos si hace falta"""
         try:
-            # Sonido de salto (tono ascendente corto)
-            jump_sound = self._generate_sweep(300, 500, 0.1, 0.25)
-            self.sounds['jump'] = jump_sound
-            
-            # Sonido de choque (ruido descendente)
-            crash_sound = self._generate_crash()
-            self.sounds['crash'] = crash_sound
-            
-            # Sonido de checkpoint (ding agradable)
-            checkpoint_sound = self._generate_checkpoint()
-            self.sounds['checkpoint'] = checkpoint_sound
-            
+            buffers = cargar_sonidos(SOUND_BANK, SOUND_RECIPES, self._synthesize,
+                                     origen=os.path.abspath(__file__))
+            for name, buffer in buffers.items():
+                self.sounds[name] = pygame.sndarray.make_sound(buffer)
+        
         except Exception as e:
             print(f"⚠ Error generando sonidos: {e}")
             # Crear sonidos silenciosos si falla
@@ -61,6 +69,11 @@ class SoundManager:
             for key in ['jump', 'crash', 'checkpoint']:
                 self.sounds[key] = silent
     
+    def _synthesize(self, name, recipe):
+        """Genera las muestras de un sonido a partir de su receta"""
+        kind, *params = recipe
+        return getattr(self, f'_generate_{kind}')(*params)
+    
     def _generate_sweep(self, freq_start, freq_end, duration, volume):
         """Genera un barrido de frecuencia"""
         sample_rate = 22050
@@ -85,7 +98,7 @@ class SoundManager:
         wave = np.int16(wave * 32767)
         stereo_wave = np.column_stack((wave, wave))
         
-        return pygame.sndarray.make_sound(stereo_wave)
+        return stereo_wave
     
     def _generate_crash(self):
         """Genera sonido de choque"""
@@ -109,7 +122,7 @@ class SoundManager:
         wave = np.int16(wave * 32767)
         stereo_wave = np.column_stack((wave, wave))
         
-        return pygame.sndarray.make_sound(stereo_wave)
+        return stereo_wave
     
     def _generate_checkpoint(self):
         """Genera sonido de checkpoint"""
@@ -139,7 +152,7 @@ class SoundManager:
         wave = np.int16(wave * 32767)
         stereo_wave = np.column_stack((wave, wave))
         
-        return pygame.sndarray.make_sound(stereo_wave)
+        return stereo_wave
     
     def play(self, sound_name):
         """Reproduce un sonido"""
@@ -1,165 +1,170 @@
 """Sprites y gráficos del juego Dino"""
 import pygame
+import random
+import numpy as np
 from settings import *
 
 
+# Mapas de píxeles del dinosaurio: cada '█' es un píxel de ancho y dos de alto
+DINO_RUN1 = [
+    "          ████████████████          ",
+    "          ██████████████████        ",
+    "          ████████████████████      ",
+    "          ██████████████████████    ",
+    "          ████████████████████████  ",
+    "          ██████████                ",
+    "          ████████████████████████  ",
+    "          ████████████████████████  ",
+    "          ████████████████████████  ",
+    "          ████████████████████      ",
+    "          ████████████████          ",
+    "          ██████████████            ",
+    "          ████████████              ",
+    "      ██  ██████████                ",
+    "    ████  ████████                  ",
+    "  ████████████████                  ",
+    "  ██████████████                    ",
+    "    ██████████                      ",
+    "    ████████                        ",
+    "      ████                          ",
+    "      ████                          ",
+    "      ████                          ",
+    "      ████                          ",
+    "      ██                            ",
+]
+
+DINO_RUN2 = [
+    "          ████████████████          ",
+    "          ██████████████████        ",
+    "          ████████████████████      ",
+    "          ██████████████████████    ",
+    "          ████████████████████████  ",
+    "          ██████████                ",
+    "          ████████████████████████  ",
+    "          ████████████████████████  ",
+    "          ████████████████████████  ",
+    "          ████████████████████      ",
+    "          ████████████████          ",
+    "          ██████████████            ",
+    "          ████████████              ",
+    "      ██  ██████████                ",
+    "    ████  ████████                  ",
+    "  ████████████████                  ",
+    "  ██████████████                    ",
+    "    ██████████                      ",
+    "    ████████                        ",
+    "      ████                          ",
+    "        ████                        ",
+    "        ████                        ",
+    "          ████                      ",
+    "          ██                        ",
+]
+
+DINO_DEAD = [
+    "          ████████████████          ",
+    "          ██████████████████        ",
+    "          ████████████████████      ",
+    "          ██████████████████████    ",
+    "    ██    ████████████████████████  ",
+    "  ████    ██████████                ",
+    "  ████    ████████████████████████  ",
+    "    ██    ████████████████████████  ",
+    "          ████████████████████████  ",
+    "          ████████████████████      ",
+    "          ████████████████          ",
+    "          ██████████████            ",
+    "          ████████████              ",
+    "      ██  ██████████                ",
+    "    ████  ████████                  ",
+    "  ████████████████                  ",
+    "  ██████████████                    ",
+    "    ██████████                      ",
+    "    ████████                        ",
+    "      ████                          ",
+    "      ████                          ",
+    "      ████                          ",
+    "      ████                          ",
+    "      ██                            ",
+]
+
+
+
+def pixel_map_mask(rows, width, height, row_height=2):
+    """Máscara (ancho, alto) de los '█' de un mapa, recortada al tamaño del sprite"""
+    grid = np.array([[char == '█' for char in row] for row in rows])
+    grid = np.repeat(grid, row_height, axis=0)[:height, :width]
+    
+    mask = np.zeros((width, height), dtype=bool)
+    mask[:grid.shape[1], :grid.shape[0]] = grid.T
+    return mask
+
+
+def surface_from_mask(mask, color):
+    """Superficie transparente con los píxeles de la máscara pintados de un color"""
+    surface = pygame.Surface(mask.shape, pygame.SRCALPHA)
+    pygame.surfarray.pixels3d(surface)[mask] = color
+    pygame.surfarray.pixels_alpha(surface)[mask] = 255
+    return surface
+
+
 class SpriteGenerator:
-    """Genera todos los sprites del juego usando píxeles"""
+    """Genera todos los sprites del juego usando píxeles
+    
+    Cada llamada crea una superficie nueva; el juego usa get_sprite, que
+    crea cada sprite una sola vez.
+    """
     
     @staticmethod
     def create_dino_run1():
         """Crea el primer cuadro del dinosaurio corriendo"""
-        surface = pygame.Surface((DINO_WIDTH, DINO_HEIGHT), pygame.SRCALPHA)
-        pixels = [
-            "          ████████████████          ",
-            "          ██████████████████        ",
-            "          ████████████████████      ",
-            "          ██████████████████████    ",
-            "          ████████████████████████  ",
-            "          ██████████                ",
-            "          ████████████████████████  ",
-            "          ████████████████████████  ",
-            "          ████████████████████████  ",
-            "          ████████████████████      ",
-            "          ████████████████          ",
-            "          ██████████████            ",
-            "          ████████████              ",
-            "      ██  ██████████                ",
-            "    ████  ████████                  ",
-            "  ████████████████                  ",
-            "  ██████████████                    ",
-            "    ██████████                      ",
-            "    ████████                        ",
-            "      ████                          ",
-            "      ████                          ",
-            "      ████                          ",
-            "      ████                          ",
-            "      ██                            ",
-        ]
-        
-        for y, row in enumerate(pixels):
-            for x, char in enumerate(row):
-                if char == '█':
-                    surface.set_at((x, y * 2), (83, 83, 83))
-                    surface.set_at((x, y * 2 + 1), (83, 83, 83))
-        
-        return surface
+        return surface_from_mask(pixel_map_mask(DINO_RUN1, DINO_WIDTH, DINO_HEIGHT), (83, 83, 83))
     
     @staticmethod
     def create_dino_run2():
         """Crea el segundo cuadro del dinosaurio corriendo"""
-        surface = pygame.Surface((DINO_WIDTH, DINO_HEIGHT), pygame.SRCALPHA)
-        pixels = [
-            "          ████████████████          ",
-            "          ██████████████████        ",
-            "          ████████████████████      ",
-            "          ██████████████████████    ",
-            "          ████████████████████████  ",
-            "          ██████████                ",
-            "          ████████████████████████  ",
-            "          ████████████████████████  ",
-            "          ████████████████████████  ",
-            "          ████████████████████      ",
-            "          ████████████████          ",
-            "          ██████████████            ",
-            "          ████████████              ",
-            "      ██  ██████████                ",
-            "    ████  ████████                  ",
-            "  ████████████████                  ",
-            "  ██████████████                    ",
-            "    ██████████                      ",
-            "    ████████                        ",
-            "      ████                          ",
-            "        ████                        ",
-            "        ████                        ",
-            "          ████                      ",
-            "          ██                        ",
-        ]
-        
-        for y, row in enumerate(pixels):
-            for x, char in enumerate(row):
-                if char == '█':
-                    surface.set_at((x, y * 2), (83, 83, 83))
-                    surface.set_at((x, y * 2 + 1), (83, 83, 83))
-        
-        return surface
+        return surface_from_mask(pixel_map_mask(DINO_RUN2, DINO_WIDTH, DINO_HEIGHT), (83, 83, 83))
     
     @staticmethod
     def create_dino_dead():
         """Crea el sprite del dinosaurio muerto"""
-        surface = pygame.Surface((DINO_WIDTH, DINO_HEIGHT), pygame.SRCALPHA)
-        pixels = [
-            "          ████████████████          ",
-            "          ██████████████████        ",
-            "          ████████████████████      ",
-            "          ██████████████████████    ",
-            "    ██    ████████████████████████  ",
-            "  ████    ██████████                ",
-            "  ████    ████████████████████████  ",
-            "    ██    ████████████████████████  ",
-            "          ████████████████████████  ",
-            "          ████████████████████      ",
-            "          ████████████████          ",
-            "          ██████████████            ",
-            "          ████████████              ",
-            "      ██  ██████████                ",
-            "    ████  ████████                  ",
-            "  ████████████████                  ",
-            "  ██████████████                    ",
-            "    ██████████                      ",
-            "    ████████                        ",
-            "      ████                          ",
-            "      ████                          ",
-            "      ████                          ",
-            "      ████                          ",
-            "      ██                            ",
-        ]
-        
-        for y, row in enumerate(pixels):
-            for x, char in enumerate(row):
-                if char == '█':
-                    surface.set_at((x, y * 2), (83, 83, 83))
-                    surface.set_at((x, y * 2 + 1), (83, 83, 83))
-        
-        return surface
+        return surface_from_mask(pixel_map_mask(DINO_DEAD, DINO_WIDTH, DINO_HEIGHT), (83, 83, 83))
     
     @staticmethod
     def create_cactus_small():
         """Crea un cactus pequeño"""
-        surface = pygame.Surface((CACTUS_SMALL_WIDTH, CACTUS_SMALL_HEIGHT), pygame.SRCALPHA)
+        x = np.arange(CACTUS_SMALL_WIDTH)[:, None]
+        y = np.arange(CACTUS_SMALL_HEIGHT)[None, :]
         
-        # Patrón del cactus pequeño
-        for y in range(CACTUS_SMALL_HEIGHT):
-            for x in range(CACTUS_SMALL_WIDTH):
-                # Cuerpo principal
-                if 6 <= x <= 10:
-                    pygame.draw.rect(surface, (83, 83, 83), (x, y, 1, 1))
-                # Brazos
-                if y > 10 and y < 20:
-                    if x == 4 or x == 5:
-                        pygame.draw.rect(surface, (83, 83, 83), (x, y, 1, 1))
-                    if x == 11 or x == 12:
-                        pygame.draw.rect(surface, (83, 83, 83), (x, y, 1, 1))
-        
-        return surface
+        # Cuerpo principal y brazos
+        body = (6 <= x) & (x <= 10) & (y >= 0)
+        arms = (10 < y) & (y < 20) & ((x == 4) | (x == 5) | (x == 11) | (x == 12))
+        return surface_from_mask(body | arms, (83, 83, 83))
     
     @staticmethod
     def create_cactus_large():
         """Crea un cactus grande"""
-        surface = pygame.Surface((CACTUS_LARGE_WIDTH, CACTUS_LARGE_HEIGHT), pygame.SRCALPHA)
+        x = np.arange(CACTUS_LARGE_WIDTH)[:, None]
+        y = np.arange(CACTUS_LARGE_HEIGHT)[None, :]
+        
+        # Cuerpo principal y brazos
+        body = (9 <= x) & (x <= 15) & (y >= 0)
+        arms = (15 < y) & (y < 30) & (((5 <= x) & (x <= 8)) | ((16 <= x) & (x <= 19)))
+        return surface_from_mask(body | arms, (83, 83, 83))
+    
+    @staticmethod
+    def create_ground_strip():
+        """Crea la tira del piso: la línea y sus marcas, de GROUND_STRIP_WIDTH de ancho
         
-        # Patrón del cactus grande
-        for y in range(CACTUS_LARGE_HEIGHT):
-            for x in range(CACTUS_LARGE_WIDTH):
-                # Cuerpo principal
-                if 9 <= x <= 15:
-                    pygame.draw.rect(surface, (83, 83, 83), (x, y, 1, 1))
-                # Brazos
-                if 15 < y < 30:
-                    if 5 <= x <= 8:
-                        pygame.draw.rect(surface, (83, 83, 83), (x, y, 1, 1))
-                    if 16 <= x <= 19:
-                        pygame.draw.rect(surface, (83, 83, 83), (x, y, 1, 1))
+        La línea queda en y = 1. Las marcas siguen una semilla fija y
+        ninguna cruza el borde derecho, así que la tira se repite sin cortes.
+        """
+        surface = pygame.Surface((GROUND_STRIP_WIDTH, 6), pygame.SRCALPHA)
+        pygame.draw.line(surface, COLOR_DAY_GROUND, (0, 1), (GROUND_STRIP_WIDTH, 1), 2)
+        
+        rng = random.Random(GROUND_SEED)
+        for x in range(0, GROUND_STRIP_WIDTH - 4, 20):
+            if rng.random() > 0.7:
+                pygame.draw.line(surface, COLOR_DAY_GROUND, (x, 3), (x + 3, 3), 2)
         
         return surface
     
@@ -185,4 +190,72 @@ class SpriteGenerator:
         pygame.draw.rect(surface, (255, 255, 255), (1, 0, 2, 4))
         pygame.draw.rect(surface, (255, 255, 255), (0, 1, 4, 2))
         
-        return surface
\ No newline at end of file
+        return surface
+
+
+# Constructores de cada sprite, por nombre
+SPRITE_BUILDERS = {
+    'dino_run1': SpriteGenerator.create_dino_run1,
+    'dino_run2': SpriteGenerator.create_dino_run2,
+    'dino_dead': SpriteGenerator.create_dino_dead,
+    'cactus_small': SpriteGenerator.create_cactus_small,
+    'cactus_large': SpriteGenerator.create_cactus_large,
+    'ground_strip': SpriteGenerator.create_ground_strip,
+    'cloud': SpriteGenerator.create_cloud,
+    'star': SpriteGenerator.create_star,
+}
+
+# Colores que cambian en modo noche
+NIGHT_PALETTE = {
+    COLOR_DAY_OBSTACLE: COLOR_NIGHT_OBSTACLE,
+    COLOR_DAY_GROUND: COLOR_NIGHT_GROUND,
+}
+
+# Sprites ya creados por (nombre, modo noche), compartidos por todo el proceso
+_sprites = {}
+
+# Máscaras de colisión por nombre (la variante de noche tiene la misma forma)
+_masks = {}
+
+
+def recolor(sprite, palette):
+    """Retorna el sprite con los colores de la paleta reemplazados
+    
+    Si no tiene ninguno de esos colores retorna el mismo sprite.
+    """
+    colored = sprite.copy()
+    pixels = pygame.surfarray.pixels3d(colored)
+    changed = False
+    for old, new in palette.items():
+        mask = (pixels[:, :, 0] == old[0]) & (pixels[:, :, 1] == old[1]) & (pixels[:, :, 2] == old[2])
+        if mask.any():
+            pixels[mask] = new
+            changed = True
+    del pixels
+    return colored if changed else sprite
+
+
+def get_sprite(name, night=False):
+    """Retorna el sprite con ese nombre, creándolo solo la primera vez
+    
+    Con night=True retorna la variante de modo noche, que también se crea
+    una sola vez. La superficie es compartida por todos los que la piden:
+    se puede dibujar, pero no modificar.
+    """
+    key = (name, night)
+    sprite = _sprites.get(key)
+    if sprite is None:
+        if night:
+            sprite = recolor(get_sprite(name), NIGHT_PALETTE)
+        else:
+            sprite = SPRITE_BUILDERS[name]()
+        _sprites[key] = sprite
+    return sprite
+
+
+def get_mask(name):
+    """Retorna la máscara de colisión del sprite, creándola solo la primera vez"""
+    mask = _masks.get(name)
+    if mask is None:
+        mask = _masks[name] = pygame.mask.from_surface(get_sprite(name))
+    return mask
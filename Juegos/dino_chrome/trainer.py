@@ -0,0 +1,289 @@
+"""Entrenamiento sin ventana de bots para Dino por neuroevolución
+
+Cada generación es una población de dinosaurios que corren a la vez
+contra la misma secuencia de obstáculos (un ObstacleManager con una
+semilla). Su física, sus decisiones y sus choques se calculan con NumPy
+para toda la población de una vez: cada bot es una red neuronal chica
+cuyos pesos se evalúan con operaciones de matrices. La población se
+reparte entre varios procesos y, entre generaciones, los mejores bots
+pasan tal cual y el resto son copias mutadas de ellos.
+
+Con la misma semilla los resultados no dependen de cuántos procesos se
+usen. El mejor bot se guarda con --guardar y DinoBot.load lo carga para
+mostrarlo jugando (p. ej. en el modo demostración del menú).
+
+Uso:
+    python trainer.py [--poblacion N] [--generaciones G] [--procesos P]
+                      [--max-ticks T] [--semilla S] [--guardar bot.npz] [--json]
+"""
+import argparse
+import json
+import os
+import random
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+DIRECTORIO = os.path.dirname(os.path.abspath(__file__))
+sys.path.append(os.path.dirname(DIRECTORIO))  # Para importar rendimiento
+
+from rendimiento import preparar_sin_ventana
+preparar_sin_ventana()
+
+import numpy as np
+from settings import *
+from obstacles import ObstacleManager
+from sprites import get_mask
+
+
+# Red de cada bot: entradas -> capa oculta (tanh) -> salto si la salida es positiva
+INPUTS = 7
+HIDDEN = 8
+GENOME_SIZE = INPUTS * HIDDEN + HIDDEN + HIDDEN + 1
+
+# Evolución
+ELITE_FRACTION = 0.1    # Los mejores pasan sin cambios
+PARENT_FRACTION = 0.2   # De entre estos se eligen los padres del resto
+MUTATION_SCALE = 0.2
+
+# Mismo ritmo de animación que Player
+ANIMATION_SPEED = 0.1
+
+
+def caracteristicas(y, velocity_y, obstacle_manager):
+    """Entradas de la red para cada dinosaurio, como matriz (dinosaurios, INPUTS)
+    
+    Los datos del obstáculo son los mismos para todos: distancia, ancho y
+    alto del próximo cactus y la velocidad; luego la altura y la
+    velocidad vertical de cada dinosaurio, y un término constante.
+    """
+    ahead = [o for o in obstacle_manager.obstacles if o.rect.right > DINO_X]
+    if ahead:
+        nearest = min(ahead, key=lambda o: o.x)
+        obstacle = [(nearest.x - (DINO_X + DINO_WIDTH)) / WINDOW_WIDTH,
+                    nearest.width / CACTUS_LARGE_WIDTH, nearest.height / CACTUS_LARGE_HEIGHT]
+    else:
+        obstacle = [1.0, 0.0, 0.0]
+    
+    x = np.empty((len(y), INPUTS))
+    x[:, 0:3] = obstacle
+    x[:, 3] = obstacle_manager.speed / INITIAL_OBSTACLE_SPEED
+    x[:, 4] = (DINO_GROUND_Y - y) / 100
+    x[:, 5] = velocity_y / -DINO_JUMP_VELOCITY
+    x[:, 6] = 1.0
+    return x
+
+
+def decidir(genomes, x):
+    """Decide qué dinosaurios saltan: una fila de genoma y de entradas por dinosaurio"""
+    n = len(genomes)
+    w1 = genomes[:, :INPUTS * HIDDEN].reshape(n, INPUTS, HIDDEN)
+    b1 = genomes[:, INPUTS * HIDDEN:INPUTS * HIDDEN + HIDDEN]
+    w2 = genomes[:, INPUTS * HIDDEN + HIDDEN:-1]
+    b2 = genomes[:, -1]
+    
+    hidden = np.tanh(np.einsum('ni,nih->nh', x, w1) + b1)
+    return np.einsum('nh,nh->n', hidden, w2) + b2 > 0
+
+
+def correr_poblacion(genomes, seed, max_ticks):
+    """Corre una población contra la secuencia de obstáculos de la semilla
+    
+    Repite en orden lo que hace DinoGame.update por tick: decidir el
+    salto, mover al jugador, mover los obstáculos y verificar choques con
+    las mismas máscaras que el juego. Retorna los ticks que sobrevivió
+    cada dinosaurio, cuántos ticks de dinosaurio vivo se simularon y los
+    segundos de CPU usados.
+    """
+    inicio = time.process_time()
+    random.seed(seed)
+    manager = ObstacleManager()
+    masks = [get_mask('dino_run1'), get_mask('dino_run2')]
+    delta_time = 1 / FPS
+    
+    n = len(genomes)
+    y = np.full(n, float(DINO_GROUND_Y))
+    velocity_y = np.zeros(n)
+    jumping = np.zeros(n, dtype=bool)
+    alive = np.ones(n, dtype=bool)
+    animation_index = np.zeros(n, dtype=np.int64)
+    animation_timer = np.zeros(n)
+    survived = np.zeros(n, dtype=np.int64)
+    dino_ticks = 0
+    
+    for tick in range(max_ticks):
+        live = np.flatnonzero(alive)
+        if len(live) == 0:
+            break
+        dino_ticks += len(live)
+        
+        # Saltar (solo los que están en el piso)
+        grounded = live[~jumping[live]]
+        if len(grounded):
+            jump = grounded[decidir(genomes[grounded],
+                                   caracteristicas(y[grounded], velocity_y[grounded], manager))]
+            jumping[jump] = True
+            velocity_y[jump] = DINO_JUMP_VELOCITY
+        
+        # Física del salto, como Player.update
+        air = live[jumping[live]]
+        velocity_y[air] += GRAVITY
+        y[air] += velocity_y[air]
+        landed = air[y[air] >= DINO_GROUND_Y]
+        y[landed] = DINO_GROUND_Y
+        velocity_y[landed] = 0
+        jumping[landed] = False
+        
+        # Animación de correr
+        running = live[~jumping[live]]
+        animation_timer[running] += delta_time
+        step = running[animation_timer[running] >= ANIMATION_SPEED]
+        animation_timer[step] = 0
+        animation_index[step] = (animation_index[step] + 1) % len(masks)
+        
+        manager.update(delta_time)
+        
+        # Choques: los dinosaurios comparten x, así que solo importan los
+        # obstáculos que la cruzan; se compara una vez por altura y cuadro
+        near = [o for o in manager.obstacles
+                if o.rect.x < DINO_X + DINO_WIDTH and o.rect.right > DINO_X]
+        if near:
+            keys = y[live].astype(np.int64) * len(masks) + animation_index[live]
+            unique, inverse = np.unique(keys, return_inverse=True)
+            hit = np.zeros(len(unique), dtype=bool)
+            for i, key in enumerate(unique):
+                top, frame = divmod(int(key), len(masks))
+                for obstacle in near:
+                    rect = obstacle.rect
+                    if (rect.bottom > top and rect.y < top + DINO_HEIGHT and
+                            masks[frame].overlap(obstacle.mask, (rect.x - DINO_X, rect.y - top))):
+                        hit[i] = True
+                        break
+            alive[live[hit[inverse]]] = False
+        
+        survived[alive] += 1
+    
+    return survived, dino_ticks, time.process_time() - inicio
+
+
+def evaluar_parte(args):
+    """Evalúa una parte de la población (se ejecuta en un proceso del pool)"""
+    return correr_poblacion(*args)
+
+
+def siguiente_generacion(genomes, fitness, rng):
+    """Conserva los mejores y completa la población con copias mutadas de ellos"""
+    n = len(genomes)
+    order = np.argsort(-fitness, kind='stable')
+    elite = genomes[order[:max(1, int(n * ELITE_FRACTION))]]
+    parents = genomes[order[:max(1, int(n * PARENT_FRACTION))]]
+    
+    children = parents[rng.integers(0, len(parents), n - len(elite))]
+    children = children + rng.normal(0, MUTATION_SCALE, children.shape)
+    return np.concatenate([elite, children])
+
+
+class DinoBot:
+    """Bot entrenado que decide cuándo saltar en una partida normal"""
+    
+    def __init__(self, genome):
+        self.genome = np.asarray(genome, dtype=float).reshape(1, GENOME_SIZE)
+    
+    @classmethod
+    def load(cls, path):
+        """Carga un bot guardado con trainer.py --guardar"""
+        with np.load(path) as data:
+            return cls(data['genome'])
+    
+    def should_jump(self, player, obstacle_manager):
+        """True si el bot saltaría en este tick"""
+        x = caracteristicas(np.array([float(player.y)]), np.array([float(player.velocity_y)]),
+                     obstacle_manager)
+        return bool(decidir(self.genome, x)[0])
+
+
+def entrenar(population, generations, processes, max_ticks, seed, report=print):
+    """Entrena y retorna el mejor genoma y las estadísticas de cada generación"""
+    rng = np.random.default_rng(seed)
+    genomes = rng.normal(0, 1, (population, GENOME_SIZE))
+    history = []
+    
+    with ProcessPoolExecutor(processes) as pool:
+        for generation in range(generations):
+            # La secuencia de obstáculos cambia en cada generación
+            generation_seed = seed * 1000 + generation
+            chunks = np.array_split(genomes, processes)
+            start = time.perf_counter()
+            results = list(pool.map(evaluar_parte,
+                                    [(chunk, generation_seed, max_ticks) for chunk in chunks]))
+            seconds = time.perf_counter() - start
+            
+            fitness = np.concatenate([r[0] for r in results])
+            dino_ticks = sum(r[1] for r in results)
+            cpu_seconds = sum(r[2] for r in results)
+            best = int(np.argmax(fitness))
+            stats = {
+                'generacion': generation + 1,
+                'mejor_ticks': int(fitness[best]),
+                'promedio_ticks': round(float(fitness.mean()), 1),
+                'completaron': int((fitness == max_ticks).sum()),
+                'dino_ticks': dino_ticks,
+                'dino_ticks_por_segundo_por_nucleo': round(dino_ticks / cpu_seconds) if cpu_seconds else 0,
+                'dino_ticks_por_segundo_total': round(dino_ticks / seconds) if seconds else 0,
+            }
+            history.append(stats)
+            report(stats)
+            
+            best_genome = genomes[best].copy()
+            if generation < generations - 1:
+                genomes = siguiente_generacion(genomes, fitness, rng)
+    
+    return best_genome, history
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Entrenamiento sin ventana de bots para Dino")
+    parser.add_argument("--poblacion", type=int, default=1000)
+    parser.add_argument("--generaciones", type=int, default=10)
+    parser.add_argument("--procesos", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--max-ticks", type=int, default=FPS * 60,
+                        help="ticks por generación (por defecto un minuto de juego)")
+    parser.add_argument("--semilla", type=int, default=1)
+    parser.add_argument("--guardar", help="guardar el mejor bot en este archivo .npz")
+    parser.add_argument("--json", action="store_true",
+                        help="imprimir el resumen como una línea JSON")
+    args = parser.parse_args()
+    
+    for opcion in ('poblacion', 'generaciones', 'procesos', 'max_ticks'):
+        if getattr(args, opcion) < 1:
+            parser.error(f"--{opcion.replace('_', '-')} debe ser al menos 1")
+    
+    def report(stats):
+        if not args.json:
+            print(f"Generación {stats['generacion']:>3}: mejor {stats['mejor_ticks']:>5} ticks, "
+                  f"promedio {stats['promedio_ticks']:>7}, completaron {stats['completaron']:>4}, "
+                  f"{stats['dino_ticks_por_segundo_por_nucleo']:>9} dino·ticks/s por núcleo")
+    
+    best_genome, history = entrenar(args.poblacion, args.generaciones, args.procesos,
+                                 args.max_ticks, args.semilla, report)
+    
+    if args.guardar:
+        np.savez(args.guardar, genome=best_genome)
+        if not args.json:
+            print(f"✓ Mejor bot guardado en {args.guardar}")
+    
+    dino_ticks = sum(s['dino_ticks'] for s in history)
+    cpu = sum(s['dino_ticks'] / s['dino_ticks_por_segundo_por_nucleo']
+              for s in history if s['dino_ticks_por_segundo_por_nucleo'])
+    summary = {
+        'poblacion': args.poblacion,
+        'generaciones': history,
+        'dino_ticks_por_segundo_por_nucleo': round(dino_ticks / cpu) if cpu else 0,
+    }
+    if args.json:
+        print(json.dumps(summary, ensure_ascii=False))
+    else:
+        print(f"Total: {summary['dino_ticks_por_segundo_por_nucleo']} dino·ticks/s por núcleo")
+
+
+if __name__ == "__main__":
+    main()
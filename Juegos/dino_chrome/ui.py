@@ -1,6 +1,7 @@
 """Interfaz de usuario para el juego Dino"""
 import pygame
 from settings import *
+from sprites import get_sprite
 
 
 class Button:
@@ -95,8 +96,7 @@ class UI:
         screen.blit(title, title_rect)
         
         # Dibujar un pequeño dino decorativo
-        from sprites import SpriteGenerator
-        dino = SpriteGenerator.create_dino_run1()
+        dino = get_sprite('dino_run1')
         dino_rect = dino.get_rect(center=(WINDOW_WIDTH // 2, 150))
         screen.blit(dino, dino_rect)
         
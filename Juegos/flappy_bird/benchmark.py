@@ -0,0 +1,44 @@
+"""Benchmark sin ventana del bucle de Flappy Bird
+
+El pájaro aletea cuando cae por debajo del centro del siguiente hueco;
+al chocar empieza otra partida.
+
+Uso: python benchmark.py [--ticks N] [--json]
+"""
+import os
+import sys
+DIRECTORIO = os.path.dirname(os.path.abspath(__file__))
+sys.path.append(os.path.dirname(DIRECTORIO))  # Para importar rendimiento
+
+from rendimiento import preparar_sin_ventana, base_en_memoria, ejecutar_benchmark, argumentos, reportar
+preparar_sin_ventana()
+
+import flappy_bird
+
+
+def main():
+    args = argumentos("Benchmark sin ventana de Flappy Bird")
+    base_en_memoria(flappy_bird, juegos=["Flappy Bird"])
+    juego = flappy_bird.Juego()
+    juego.nueva_partida()
+    
+    def entrada(tick):
+        pajaro = juego.pajaro
+        siguiente = next((t for t in juego.tubos if t.x + t.ancho >= pajaro.x), None)
+        objetivo = (siguiente.y_hueco + siguiente.altura_hueco * 0.6
+                    if siguiente else flappy_bird.ALTO // 2)
+        if pajaro.y > objetivo and pajaro.velocidad_y >= 0:
+            pajaro.saltar()
+    
+    def actualizar():
+        if not juego.actualizar_logica():
+            juego.nueva_partida()
+    
+    resultado = ejecutar_benchmark("Flappy Bird", actualizar, juego.renderizar, entrada,
+                                   args.ticks, args.calentamiento, args.memoria, args.semilla)
+    juego.db.cerrar()
+    reportar(resultado, args.json)
+
+
+if __name__ == "__main__":
+    main()
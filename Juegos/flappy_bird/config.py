@@ -16,7 +16,8 @@ ROJO = (255, 0, 0)
 AZUL = (0, 100, 255)
 
 # Configuración del juego
-FPS = 60
+FPS = 60  # Pasos de simulación por segundo
+FPS_DIBUJO = 60  # Límite de frames dibujados (p. ej. 144 en monitores rápidos; 0 = sin límite)
 GRAVEDAD = 0.5
 FUERZA_SALTO = -10
 VELOCIDAD_TUBOS = 3
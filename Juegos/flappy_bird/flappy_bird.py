@@ -1,5 +1,6 @@
 """Juego Flappy Bird - Archivo principal con lógica de juego y ejecución"""
 import pygame
+import os
 import sys
 sys.path.append("../../")  # Para importar db.py desde raíz
 
@@ -7,23 +8,10 @@ from config import *
 from pajaro import Pajaro
 from tubo import Tubo
 from renderizador import Renderizador
+from db import DatabaseManager
 
-# Intentar importar DatabaseManager, si no existe, usar una versión mock
-try:
-    from db import DatabaseManager
-    DB_DISPONIBLE = True
-except ImportError:
-    DB_DISPONIBLE = False
-    print("⚠ Base de datos no disponible. El juego funcionará sin guardar puntuaciones.")
-    
-    class DatabaseManager:
-        """Mock de DatabaseManager cuando no está disponible"""
-        def __init__(self):
-            pass
-        def guardar_puntuacion(self, *args):
-            return False
-        def cerrar(self):
-            pass
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))  # Para importar motor
+from motor import BucleFijo, Interpolador
 
 
 class Juego:
@@ -34,8 +22,11 @@ class Juego:
         self.ventana = pygame.display.set_mode((ANCHO, ALTO))
         pygame.display.set_caption("Flappy Bird")
         self.clock = pygame.time.Clock()
+        # Simulación a paso fijo y dibujo interpolado entre pasos
+        self.bucle = BucleFijo(FPS, FPS_DIBUJO, reloj=self.clock)
+        self.interpolador = Interpolador('x', 'y')
         self.renderizador = Renderizador(self.ventana)
-        self.db = DatabaseManager() if DB_DISPONIBLE else None
+        self.db = DatabaseManager()
         self.mejor_puntuacion = 0
         self.jugando = True
     
@@ -156,15 +147,11 @@ class Juego:
         if self.puntuacion > self.mejor_puntuacion:
             self.mejor_puntuacion = self.puntuacion
         
-        # Si hay puntuación y DB disponible, pedir nombre y guardar
-        if self.puntuacion > 0 and DB_DISPONIBLE and self.db:
+        # Si hay puntuación, pedir nombre y guardar (sin conexión queda en el diario local)
+        if self.puntuacion > 0:
             nombre = self.pedir_nombre()
             
             if nombre:
-                self.renderizador.dibujar_pantalla_guardando()
-                self.renderizador.actualizar()
-                pygame.time.delay(500)
-                
                 self.db.guardar_puntuacion(nombre, "Flappy Bird", self.puntuacion)
         
         # Mostrar pantalla de game over
@@ -198,23 +185,29 @@ class Juego:
             self.nueva_partida()
             
             partida_activa = True
+            self.bucle.reiniciar()
+            self.interpolador.olvidar()
             while partida_activa:
+                pasos = self.bucle.frame()
+                
                 if not self.manejar_eventos():
                     self.jugando = False
                     break
                 
-                if not self.actualizar_logica():
-                    partida_activa = False
+                for _ in range(pasos):
+                    self.interpolador.guardar([self.pajaro] + self.tubos)
+                    if not self.actualizar_logica():
+                        partida_activa = False
+                        break
                 
-                self.renderizar()
-                self.clock.tick(FPS)
+                with self.interpolador.aplicar(self.bucle.alpha):
+                    self.renderizar()
             
             if self.jugando:
                 self.jugando = self.game_over()
         
         # Cerrar conexión a la base de datos
-        if self.db:
-            self.db.cerrar()
+        self.db.cerrar()
         pygame.quit()
 
 
@@ -123,13 +123,6 @@ class Renderizador:
         self.mostrar_texto("A-Z para escribir, ENTER confirmar", ANCHO // 2, ALTO // 2 + 100, 
                           self.fuente_pequeña, AZUL)
     
-    def dibujar_pantalla_guardando(self):
-        """Muestra mensaje de guardando"""
-        self.limpiar_pantalla()
-        self.dibujar_suelo()
-        self.mostrar_texto("Guardando...", ANCHO // 2, ALTO // 2, 
-                          self.fuente_mediana, AMARILLO)
-    
     def get_altura_suelo(self):
         """Retorna la altura del suelo"""
         return ALTO - self.altura_suelo
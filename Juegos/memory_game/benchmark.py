@@ -0,0 +1,53 @@
+"""Benchmark sin ventana del bucle de Memory Game
+
+Cada pocos ticks se voltea una carta boca abajo al azar; al completar
+el tablero empieza otra partida del mismo nivel.
+
+Uso: python benchmark.py [--ticks N] [--json]
+"""
+import os
+import random
+import sys
+DIRECTORIO = os.path.dirname(os.path.abspath(__file__))
+sys.path.append(os.path.dirname(DIRECTORIO))  # Para importar rendimiento
+
+from rendimiento import preparar_sin_ventana, base_en_memoria, ejecutar_benchmark, argumentos, reportar
+preparar_sin_ventana()
+
+import main as memory
+from config import *
+
+NIVEL = 3
+
+
+def main():
+    args = argumentos("Benchmark sin ventana de Memory Game")
+    base_en_memoria(memory, juegos=[GAME_NAME])
+    juego = memory.MemoryGame()
+    juego.selected_level = NIVEL
+    juego.start_game()
+    dt = 1000 / FPS  # El juego mide dt en milisegundos
+    
+    def entrada(tick):
+        estado = juego.game_state
+        if estado.is_won:
+            juego.start_game()
+            return
+        
+        if tick % 5 == 0 and estado.can_flip:
+            ocultas = [c for c in estado.cards if not c.is_flipped and not c.is_matched]
+            if ocultas:
+                carta = random.choice(ocultas)
+                estado.handle_click(carta.rect.center)
+    
+    def actualizar():
+        juego.update(dt)
+    
+    resultado = ejecutar_benchmark(f"Memory Game (nivel {NIVEL})", actualizar, juego.draw, entrada,
+                                   args.ticks, args.calentamiento, args.memoria, args.semilla)
+    juego.db_manager.cerrar()
+    reportar(resultado, args.json)
+
+
+if __name__ == "__main__":
+    main()
@@ -34,6 +34,9 @@ class MemoryGame:
         self.game_state = None
         self.selected_level = 1
         self.username = ""
+        self.is_record = False
+        self.best_scores = {}  # (jugador, nivel) -> mejor puntuación, leída al empezar el nivel
+        self.records = {}
         
         # Decoración
         self.bg_stars = BackgroundStars(SCREEN_WIDTH, SCREEN_HEIGHT, 40)
@@ -167,7 +170,7 @@ class MemoryGame:
                 elif btn.text == "Seleccionar Nivel":
                     self.state = "level_select"
                 elif btn.text == "Ver Récords":
-                    self.state = "records"
+                    self._show_records()
                 elif btn.text == "Salir":
                     pygame.quit()
                     sys.exit()
@@ -195,9 +198,16 @@ class MemoryGame:
         # Verificar victoria
         if self.game_state.is_won and self.state == "game":
             self.state = "victory"
-            # Guardar puntuación
+            # Verificar récord contra la mejor puntuación ya conocida y guardar (en segundo plano)
             score = self.game_state.get_score()
+            self.is_record = False
             if self.username:
+                key = (self.username, self.selected_level)
+                # Sin el récord del nivel (la base no respondió) no se sabe si es nuevo
+                best = self.best_scores.get(key)
+                self.is_record = best is not None and (best == 0 or score < best)
+                if self.is_record:
+                    self.best_scores[key] = score
                 self.db_manager.guardar_puntuacion(self.username, score, self.selected_level)
                 
     def _handle_pause(self, mouse_pos, mouse_pressed):
@@ -231,7 +241,7 @@ class MemoryGame:
                 elif btn.text == "Repetir":
                     self.start_game()
                 elif btn.text == "Ver Récords":
-                    self.state = "records"
+                    self._show_records()
                 elif btn.text == "Menú":
                     self.state = "menu"
                     
@@ -242,8 +252,23 @@ class MemoryGame:
             self.sound_manager.play('button')
             self.state = "menu"
             
+    def _show_records(self):
+        """Carga los récords de cada nivel una vez y muestra la pantalla"""
+        self.db_manager.esperar_escrituras()
+        self.records = {
+            level: self.db_manager.obtener_top_puntuaciones(level, 5)
+            for level in range(1, len(LEVELS) + 1)
+        }
+        self.state = "records"
+            
     def start_game(self):
         """Inicia un nuevo juego"""
+        # El récord del nivel se consulta una sola vez; después se actualiza al guardar
+        key = (self.username, self.selected_level)
+        if self.username and key not in self.best_scores:
+            best = self.db_manager.obtener_mejor_puntuacion(*key)
+            if best is not None:  # Si la base no respondió se reintenta en la próxima partida
+                self.best_scores[key] = best
         self.game_state = GameState(self.selected_level, self.sound_manager)
         self.state = "game"
         
@@ -415,17 +440,12 @@ class MemoryGame:
             self.screen.blit(text, text_rect)
             y += 40
             
-        # Verificar récord
-        if self.username:
-            is_record = self.db_manager.verificar_nuevo_record(
-                self.username, self.selected_level, self.game_state.get_score()
-            )
-            
-            if is_record:
-                record_text = "¡NUEVO RÉCORD PERSONAL!"
-                record_surf = self.font_medium.render(record_text, True, COLORS['warning'])
-                record_rect = record_surf.get_rect(center=(cx, y + 10))
-                self.screen.blit(record_surf, record_rect)
+        # Récord (calculado al ganar la partida)
+        if self.is_record:
+            record_text = "¡NUEVO RÉCORD PERSONAL!"
+            record_surf = self.font_medium.render(record_text, True, COLORS['warning'])
+            record_rect = record_surf.get_rect(center=(cx, y + 10))
+            self.screen.blit(record_surf, record_rect)
                 
         # Botones
         for btn in self.victory_buttons:
@@ -448,14 +468,11 @@ class MemoryGame:
             self.screen.blit(level_title, (100, y))
             y += 40
             
-            # Obtener récords
-            records = self.db_manager.obtener_top_puntuaciones(level, 5)
+            records = self.records.get(level)
             
             if records:
                 for i, (username, score, _) in enumerate(records):
-                    # Limpiar sufijo de nivel del username
-                    display_name = username.split('-Nivel')[0]
-                    text = f"{i+1}. {display_name}: {score} puntos"
+                    text = f"{i+1}. {username}: {score} puntos"
                     text_surf = self.font_small.render(text, True, COLORS['text'])
                     self.screen.blit(text_surf, (120, y))
                     y += 30
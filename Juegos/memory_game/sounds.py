@@ -1,7 +1,26 @@
 """Sistema de sonidos para Memory Game"""
+import os
+import sys
 import pygame
 import numpy as np
 
+DIRECTORIO = os.path.dirname(os.path.abspath(__file__))
+sys.path.append(os.path.dirname(DIRECTORIO))  # Para importar banco_sonidos
+from banco_sonidos import cargar_sonidos
+
+# Sonidos ya generados; se rehacen si cambian las recetas o este archivo
+SOUND_BANK = os.path.join(DIRECTORIO, 'sonidos.bank')
+
+# Generador y parámetros de cada sonido
+SOUND_RECIPES = {
+    'flip': ['tone', 600, 0.1, 0.2],  # Flip de carta - tono corto ascendente
+    'match': ['tone', 800, 0.3, 0.25],  # Pareja encontrada - acorde alegre
+    'victory': ['sequence', [523, 659, 784, 1047], 0.2, 0.2],  # Victoria - secuencia de tonos
+    'button': ['tone', 400, 0.05, 0.15],  # Botón - click corto
+    'hover': ['tone', 500, 0.05, 0.1],  # Hover - tono suave
+    'music': ['tone', 220, 2.0, 0.08],  # Música de fondo (tono ambiental)
+}
+
 
 class SoundManager:
     """Maneja todos los sonidos del juego"""
@@ -10,6 +29,7 @@ class SoundManager:
         pygame.mixer.init(frequency=22050, size=-16, channels=2, buffer=512)
         self.sounds = {}
         self.music_playing = False
+        self.music_buffer = None
         self._generate_sounds()
         
     def _generate_tone(self, frequency, duration, volume=0.3):
@@ -36,39 +56,31 @@ class SoundManager:
         wave = np.int16(wave * 32767)
         stereo_wave = np.column_stack((wave, wave))
         
-        sound = pygame.sndarray.make_sound(stereo_wave)
-        return sound
+        return stereo_wave
     
     def _generate_sounds(self):
-        """Genera todos los efectos de sonido"""
+        """Carga los efectos de sonido del banco en disco, generándolos si hace falta"""
         try:
-            # Flip de carta - tono corto ascendente
-            self.sounds['flip'] = self._generate_tone(600, 0.1, 0.2)
-            
-            # Pareja encontrada - acorde alegre
-            match_sound = self._generate_tone(800, 0.3, 0.25)
-            self.sounds['match'] = match_sound
-            
-            # Victoria - secuencia de tonos
-            victory_samples = []
-            for freq in [523, 659, 784, 1047]:
-                tone = self._generate_tone(freq, 0.2, 0.2)
-                samples = pygame.sndarray.samples(tone)
-                victory_samples.append(np.array(samples, copy=True))
-            
-            combined = np.concatenate(victory_samples)
-            self.sounds['victory'] = pygame.sndarray.make_sound(combined)
-            
-            # Botón - click corto
-            self.sounds['button'] = self._generate_tone(400, 0.05, 0.15)
-            
-            # Hover - tono suave
-            self.sounds['hover'] = self._generate_tone(500, 0.05, 0.1)
+            buffers = cargar_sonidos(SOUND_BANK, SOUND_RECIPES, self._synthesize,
+                                     origen=os.path.abspath(__file__))
+            self.music_buffer = buffers.pop('music')
+            for name, buffer in buffers.items():
+                self.sounds[name] = pygame.sndarray.make_sound(buffer)
             
             print("✓ Sonidos generados exitosamente")
         except Exception as e:
             print(f"⚠ Error al generar sonidos: {e}")
             
+    def _generate_sequence(self, frequencies, duration, volume):
+        """Genera una secuencia de tonos, uno tras otro"""
+        return np.concatenate([self._generate_tone(freq, duration, volume)
+                               for freq in frequencies])
+    
+    def _synthesize(self, name, recipe):
+        """Genera las muestras de un sonido a partir de su receta"""
+        kind, *params = recipe
+        return getattr(self, f'_generate_{kind}')(*params)
+    
     def play(self, sound_name):
         """Reproduce un sonido"""
         if sound_name in self.sounds:
@@ -81,8 +93,8 @@ class SoundManager:
         """Inicia música de fondo (tono ambiental)"""
         if not self.music_playing:
             try:
-                # Crear música ambiental simple
-                music = self._generate_tone(220, 2.0, 0.08)
+                # Música ambiental simple, ya generada en el banco
+                music = pygame.sndarray.make_sound(self.music_buffer)
                 music.play(loops=-1)
                 self.music_playing = True
             except:
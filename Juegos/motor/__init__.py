@@ -0,0 +1,6 @@
+"""Piezas del bucle principal compartidas por los juegos
+
+Los juegos simulan a paso fijo con BucleFijo y dibujan con Interpolador,
+de modo que la velocidad del juego no depende de cuántos frames se dibujan.
+"""
+from .bucle import BucleFijo, Interpolador
@@ -0,0 +1,98 @@
+"""Bucle de paso fijo con interpolación al dibujar"""
+import time
+from contextlib import contextmanager
+
+import pygame
+
+
+class BucleFijo:
+    """Separa los pasos de simulación de los frames dibujados
+
+    La física de los juegos avanza una cantidad fija por llamada a update,
+    ajustada para `hz` pasos por segundo. El bucle acumula el tiempo real
+    transcurrido y ejecuta tantos pasos como quepan en él: si un frame tarda
+    el doble, se simulan dos pasos y el juego no va en cámara lenta; si se
+    dibuja más rápido que `hz`, hay frames sin pasos y `alpha` indica cuánto
+    del siguiente paso ya transcurrió.
+    """
+
+    def __init__(self, hz=60, fps_maximo=0, max_pasos=5, reloj=None):
+        self.paso = 1.0 / hz
+        self.fps_maximo = fps_maximo  # 0 = dibujar sin límite
+        # Límite de pasos por frame para no entrar en espiral si la máquina
+        # no alcanza a simular en tiempo real
+        self.max_pasos = max_pasos
+        self.reloj = reloj or pygame.time.Clock()
+        self.acumulado = 0.0
+        self._anterior = None
+
+    def reiniciar(self):
+        """Descarta el tiempo acumulado (p. ej. al volver de un menú)"""
+        self.acumulado = 0.0
+        self._anterior = None
+
+    def frame(self):
+        """Espera el siguiente frame y retorna cuántos pasos simular"""
+        self.reloj.tick(self.fps_maximo)
+        ahora = time.perf_counter()
+        if self._anterior is None:
+            self._anterior = ahora - self.paso
+        transcurrido = ahora - self._anterior
+        self._anterior = ahora
+
+        self.acumulado += min(transcurrido, self.paso * self.max_pasos)
+        pasos = int(self.acumulado / self.paso)
+        self.acumulado -= pasos * self.paso
+        return pasos
+
+    @property
+    def alpha(self):
+        """Fracción del siguiente paso ya transcurrida, entre 0 y 1"""
+        return self.acumulado / self.paso
+
+
+class Interpolador:
+    """Dibuja los objetos entre su posición anterior y la actual
+
+    Antes de cada paso se guardan los atributos indicados de los objetos;
+    al dibujar se reemplazan temporalmente por el valor interpolado y luego
+    se restauran, así que ni la lógica ni los métodos draw cambian. Los
+    objetos que no tienen alguno de los atributos simplemente lo omiten, y
+    los saltos mayores a `salto_maximo` (reinicios, teletransportes) se
+    dibujan sin interpolar.
+    """
+
+    def __init__(self, *atributos, salto_maximo=100):
+        self.atributos = atributos
+        self.salto_maximo = salto_maximo
+        self._anteriores = []
+
+    def guardar(self, objetos):
+        """Registra el estado de los objetos antes de un paso"""
+        self._anteriores = [
+            (objeto, {a: getattr(objeto, a) for a in self.atributos if hasattr(objeto, a)})
+            for objeto in objetos
+        ]
+
+    def olvidar(self):
+        """Descarta el estado guardado (los objetos se dibujan tal cual)"""
+        self._anteriores = []
+
+    @contextmanager
+    def aplicar(self, alpha):
+        """Interpola los objetos guardados mientras dura el bloque"""
+        actuales = []
+        for objeto, anteriores in self._anteriores:
+            valores = {a: getattr(objeto, a) for a in anteriores}
+            if any(abs(valores[a] - v) > self.salto_maximo for a, v in anteriores.items()):
+                continue
+
+            actuales.append((objeto, valores))
+            for a, v in anteriores.items():
+                setattr(objeto, a, v + (valores[a] - v) * alpha)
+        try:
+            yield
+        finally:
+            for objeto, valores in actuales:
+                for a, v in valores.items():
+                    setattr(objeto, a, v)
@@ -0,0 +1,11 @@
+"""Servicio de puntuaciones compartido por todos los juegos
+
+Cada juego hereda de ServicioPuntuaciones en su db.py en lugar de mantener
+su propia conexión a MySQL abierta durante toda la partida.
+"""
+from .pool import PoolConexiones, ErrorConexion
+from .escritor import EscritorPuntuaciones
+from .diario import DiarioPuntuaciones
+from .cache import CacheClasificaciones
+from .servicio import ServicioPuntuaciones, fabrica_mysql
+from .sqlite import conectar_sqlite, crear_servicio_sqlite
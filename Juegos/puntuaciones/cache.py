@@ -0,0 +1,63 @@
+"""Caché en memoria de las tablas de puntuaciones"""
+import threading
+import time
+
+
+class CacheClasificaciones:
+    """Guarda resultados de las consultas de clasificación durante `ttl` segundos
+
+    Las claves son tuplas cuyo primer elemento es el nombre del juego, de
+    modo que guardar una puntuación invalida todas las tablas de ese juego.
+
+    Cada invalidación sube la generación del juego. Quien consulta anota la
+    generación antes de la consulta y la pasa a guardar(): si mientras tanto
+    se guardó una puntuación, el resultado ya es viejo y no se guarda.
+    """
+
+    def __init__(self, ttl=30.0):
+        self.ttl = ttl
+        self._entradas = {}
+        self._generaciones = {}
+        self._generacion_global = 0
+        self._candado = threading.Lock()
+
+    def obtener(self, clave):
+        """Retorna el valor guardado o None si no existe o expiró"""
+        with self._candado:
+            entrada = self._entradas.get(clave)
+            if entrada is None:
+                return None
+
+            expira, valor = entrada
+            if time.monotonic() >= expira:
+                del self._entradas[clave]
+                return None
+            return valor
+
+    def generacion(self, game_name):
+        """Generación actual de un juego; se anota antes de consultar la base"""
+        with self._candado:
+            return self._generacion_global, self._generaciones.get(game_name, 0)
+
+    def guardar(self, clave, valor, generacion=None):
+        """Guarda un valor con el tiempo de vida configurado
+
+        Si se indica la generación anotada antes de consultar y el juego se
+        invalidó desde entonces, el valor no se guarda.
+        """
+        with self._candado:
+            if generacion is not None and generacion != (
+                    self._generacion_global, self._generaciones.get(clave[0], 0)):
+                return
+            self._entradas[clave] = (time.monotonic() + self.ttl, valor)
+
+    def invalidar(self, game_name=None):
+        """Elimina las tablas de un juego, o todas si no se indica"""
+        with self._candado:
+            if game_name is None:
+                self._generacion_global += 1
+                self._entradas.clear()
+                return
+            self._generaciones[game_name] = self._generaciones.get(game_name, 0) + 1
+            for clave in [c for c in self._entradas if c[0] == game_name]:
+                del self._entradas[clave]
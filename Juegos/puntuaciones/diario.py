@@ -0,0 +1,176 @@
+"""Diario local de puntuaciones pendientes mientras la base de datos no responde"""
+import json
+import os
+import threading
+import time
+
+
+class DiarioPuntuaciones:
+    """Archivo JSON-lines de solo anexado con las puntuaciones sin guardar
+
+    Cada línea es una puntuación. Las escrituras se sincronizan a disco
+    (fsync) por grupos: cada `sincronizar_cada` entradas, cuando pasaron
+    `sincronizar_tras` segundos desde la última vez, antes de leer y al cerrar.
+    """
+
+    def __init__(self, ruta, sincronizar_cada=16, sincronizar_tras=1.0):
+        self.ruta = ruta
+        # Puntuaciones que la base de datos rechazó: se apartan para revisarlas a mano
+        base, extension = os.path.splitext(ruta)
+        self.ruta_rechazadas = f"{base}_rechazadas{extension}"
+        self.sincronizar_cada = sincronizar_cada
+        self.sincronizar_tras = sincronizar_tras
+
+        self._candado = threading.Lock()
+        self._archivo = None
+        self._sin_sincronizar = 0
+        self._ultima_sincronizacion = time.monotonic()
+
+    def agregar(self, puntuaciones):
+        """Añade puntuaciones (username, game_name, score, variante) al final del diario"""
+        lineas = self._lineas(puntuaciones)
+
+        try:
+            with self._candado:
+                if self._archivo is None:
+                    directorio = os.path.dirname(self.ruta)
+                    if directorio:
+                        os.makedirs(directorio, exist_ok=True)
+                    self._archivo = open(self.ruta, "a", encoding="utf-8")
+                    if not self._termina_en_linea(self.ruta):
+                        # Cerrar la línea incompleta de un corte para no pegarle la siguiente
+                        lineas = "\n" + lineas
+
+                self._archivo.write(lineas)
+                self._archivo.flush()
+                self._sin_sincronizar += len(puntuaciones)
+
+                transcurrido = time.monotonic() - self._ultima_sincronizacion
+                if (self._sin_sincronizar >= self.sincronizar_cada or
+                        transcurrido >= self.sincronizar_tras):
+                    self._sincronizar()
+        except OSError as e:
+            print(f"✗ Error al escribir el diario de puntuaciones: {e}")
+            return False
+
+        return True
+
+    def apartar(self, puntuaciones):
+        """Anota en ruta_rechazadas puntuaciones que la base de datos rechazó
+
+        No se reproducen solas: quedan para revisarlas, p. ej. después de
+        aplicar una migración que faltaba.
+        """
+        lineas = self._lineas(puntuaciones)
+        try:
+            with self._candado:
+                if not self._termina_en_linea(self.ruta_rechazadas):
+                    lineas = "\n" + lineas
+                with open(self.ruta_rechazadas, "a", encoding="utf-8") as archivo:
+                    archivo.write(lineas)
+        except OSError as e:
+            print(f"✗ Error al apartar puntuaciones rechazadas: {e}")
+            return False
+        return True
+
+    @staticmethod
+    def _lineas(puntuaciones):
+        """Líneas JSON de puntuaciones (username, game_name, score, variante[, created_at])"""
+        ahora = time.strftime("%Y-%m-%d %H:%M:%S")
+        return "".join(
+            json.dumps({'username': username, 'game': game_name, 'score': score,
+                        'variant': variante, 'created_at': fecha[0] if fecha else ahora},
+                       ensure_ascii=False) + "\n"
+            for username, game_name, score, variante, *fecha in puntuaciones
+        )
+
+    @staticmethod
+    def _termina_en_linea(ruta):
+        """Verifica si el archivo está vacío o su último byte es un salto de línea"""
+        try:
+            with open(ruta, "rb") as archivo:
+                archivo.seek(0, os.SEEK_END)
+                if archivo.tell() == 0:
+                    return True
+                archivo.seek(-1, os.SEEK_END)
+                return archivo.read(1) == b"\n"
+        except OSError:
+            return True
+
+    def _sincronizar(self):
+        """Fuerza la escritura a disco (requiere el candado)"""
+        if self._archivo is not None and self._sin_sincronizar:
+            os.fsync(self._archivo.fileno())
+        self._sin_sincronizar = 0
+        self._ultima_sincronizacion = time.monotonic()
+
+    def hay_pendientes(self):
+        """Verifica si el diario tiene puntuaciones sin reproducir"""
+        try:
+            return os.path.getsize(self.ruta) > 0
+        except OSError:
+            return False
+
+    def leer(self):
+        """Lee las entradas del diario
+
+        Retorna (entradas, fines, posicion) donde posicion es el byte hasta
+        el que se leyó; se pasa a descartar() una vez guardadas en la base de
+        datos. fines[i] es el byte donde termina la entrada i, para descartar
+        solo las primeras. Una línea incompleta (corte de luz durante la
+        escritura) se ignora.
+        """
+        with self._candado:
+            if self._archivo is not None:
+                self._sincronizar()
+
+            try:
+                with open(self.ruta, "rb") as archivo:
+                    contenido = archivo.read()
+            except OSError:
+                return [], [], 0
+
+        entradas = []
+        fines = []
+        fin = 0
+        for linea in contenido.splitlines(keepends=True):
+            fin += len(linea)
+            try:
+                entrada = json.loads(linea)
+                entradas.append((entrada['username'], entrada['game'], int(entrada['score']),
+                                 entrada.get('variant', ''),
+                                 entrada.get('created_at') or time.strftime("%Y-%m-%d %H:%M:%S")))
+                fines.append(fin)
+            except (ValueError, KeyError, TypeError):
+                print("⚠ Entrada dañada en el diario de puntuaciones, se ignora")
+
+        return entradas, fines, len(contenido)
+
+    def descartar(self, posicion):
+        """Elimina del diario lo leído hasta `posicion`, conservando lo añadido después"""
+        with self._candado:
+            try:
+                with open(self.ruta, "rb") as archivo:
+                    archivo.seek(posicion)
+                    resto = archivo.read()
+
+                if self._archivo is not None:
+                    self._archivo.close()
+                    self._archivo = None
+
+                temporal = self.ruta + ".tmp"
+                with open(temporal, "wb") as archivo:
+                    archivo.write(resto)
+                    archivo.flush()
+                    os.fsync(archivo.fileno())
+                os.replace(temporal, self.ruta)
+            except OSError as e:
+                print(f"✗ Error al limpiar el diario de puntuaciones: {e}")
+
+    def cerrar(self):
+        """Sincroniza y cierra el archivo del diario"""
+        with self._candado:
+            if self._archivo is not None:
+                self._sincronizar()
+                self._archivo.close()
+                self._archivo = None
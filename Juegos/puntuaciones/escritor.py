@@ -0,0 +1,164 @@
+"""Escritura diferida de puntuaciones en un hilo de fondo"""
+import queue
+import threading
+import time
+
+
+class EscritorPuntuaciones:
+    """Cola acotada que guarda las puntuaciones sin bloquear el juego
+
+    enviar() solo encola la puntuación. Un hilo de fondo agrupa lo pendiente
+    en lotes que se insertan con un único INSERT de varias filas.
+
+    guardar_lote(lote) retorna las puntuaciones que no se pudieron guardar
+    porque la base de datos no responde; las que la base rechazó o cuyo
+    commit quedó en duda ya las resolvió quien guarda y no se retornan.
+
+    Si la base de datos no responde y hay `respaldar`, esas puntuaciones se
+    anotan en el diario local y se llama a `reproducir` con espera creciente
+    hasta que la conexión vuelve. Sin diario se reintentan las mismas.
+    """
+
+    def __init__(self, guardar_lote, respaldar=None, reproducir=None, capacidad=256,
+                 tamano_lote=32, reintento=1.0, reintento_maximo=30.0):
+        self.guardar_lote = guardar_lote
+        self.respaldar = respaldar
+        self.reproducir = reproducir
+        self.tamano_lote = tamano_lote
+        self.reintento = reintento
+        self.reintento_maximo = reintento_maximo
+
+        self._cola = queue.Queue(maxsize=capacidad)
+        self._hilo = None
+        self._candado = threading.Lock()
+        self._detener = threading.Event()
+        self._pendientes = 0
+        self._vacia = threading.Condition(self._candado)
+        self._reproducir_pendiente = False
+
+    def iniciar(self, reproducir_pendiente=False):
+        """Arranca el hilo de fondo si aún no está corriendo"""
+        with self._candado:
+            self._iniciar(reproducir_pendiente)
+
+    def _iniciar(self, reproducir_pendiente=False):
+        """Arranca el hilo de fondo (requiere el candado)"""
+        if reproducir_pendiente:
+            self._reproducir_pendiente = True
+        if self._hilo is None and not self._detener.is_set():
+            self._hilo = threading.Thread(target=self._ejecutar, name="EscritorPuntuaciones",
+                                          daemon=True)
+            self._hilo.start()
+
+    def enviar(self, username, game_name, score, variante=''):
+        """Encola una puntuación; retorna False si la cola está llena"""
+        with self._candado:
+            if self._detener.is_set():
+                return False
+            self._iniciar()
+
+            try:
+                self._cola.put_nowait((username, game_name, score, variante))
+            except queue.Full:
+                print("✗ Cola de puntuaciones llena, se descarta la puntuación")
+                return False
+
+            self._pendientes += 1
+            return True
+
+    def pendientes(self):
+        """Número de puntuaciones encoladas que aún no se guardaron"""
+        with self._candado:
+            return self._pendientes
+
+    def _tomar_lote(self, timeout):
+        """Espera la primera puntuación y agrega las que ya estén en cola"""
+        try:
+            lote = [self._cola.get(timeout=timeout)]
+        except queue.Empty:
+            return []
+
+        while len(lote) < self.tamano_lote:
+            try:
+                lote.append(self._cola.get_nowait())
+            except queue.Empty:
+                break
+        return lote
+
+    def _completar(self, cantidad):
+        """Descuenta puntuaciones ya guardadas o anotadas en el diario"""
+        with self._candado:
+            self._pendientes -= cantidad
+            self._vacia.notify_all()
+
+    def _ejecutar(self):
+        """Bucle del hilo de fondo"""
+        lote = []
+        espera = self.reintento
+        proximo_intento = time.monotonic()
+
+        while True:
+            # Volcar el diario en cuanto la base de datos vuelva a responder
+            if self._reproducir_pendiente and self.reproducir is not None:
+                if time.monotonic() >= proximo_intento:
+                    if self.reproducir():
+                        self._reproducir_pendiente = False
+                        espera = self.reintento
+                    else:
+                        proximo_intento = time.monotonic() + espera
+                        espera = min(espera * 2, self.reintento_maximo)
+
+            if not lote:
+                if self._detener.is_set() and self._cola.empty():
+                    return
+                timeout = 0.5
+                if self._reproducir_pendiente:
+                    timeout = min(timeout, max(0.0, proximo_intento - time.monotonic()))
+                lote = self._tomar_lote(timeout)
+                if not lote:
+                    continue
+
+            sin_guardar = self.guardar_lote(lote)
+            if not sin_guardar:
+                self._completar(len(lote))
+                lote = []
+                # Si había algo en el diario, la conexión ya volvió
+                proximo_intento = time.monotonic()
+                if not self._reproducir_pendiente:
+                    espera = self.reintento
+            elif self.respaldar is not None and self.respaldar(sin_guardar):
+                self._completar(len(lote))
+                lote = []
+                if not self._reproducir_pendiente:
+                    self._reproducir_pendiente = True
+                    proximo_intento = time.monotonic() + espera
+            else:
+                # Sin diario: reintentar solo lo que no se guardó
+                self._completar(len(lote) - len(sin_guardar))
+                lote = sin_guardar
+                if self._detener.wait(espera):
+                    return
+                espera = min(espera * 2, self.reintento_maximo)
+
+    def vaciar(self, timeout=None):
+        """Espera a que se guarden las puntuaciones pendientes"""
+        limite = None if timeout is None else time.monotonic() + timeout
+        with self._candado:
+            while self._pendientes > 0:
+                restante = None if limite is None else limite - time.monotonic()
+                if restante is not None and restante <= 0:
+                    return False
+                self._vacia.wait(restante)
+        return True
+
+    def cerrar(self, timeout=3.0):
+        """Intenta guardar lo pendiente y detiene el hilo de fondo"""
+        with self._candado:
+            hilo = self._hilo
+
+        if hilo is not None and not self.vaciar(timeout):
+            print(f"⚠ {self.pendientes()} puntuaciones sin guardar al cerrar")
+
+        self._detener.set()
+        if hilo is not None:
+            hilo.join(timeout=1.0)
@@ -0,0 +1,139 @@
+"""Pool de conexiones compartido por todos los juegos"""
+import threading
+import time
+
+
+class ErrorConexion(Exception):
+    """Error al obtener una conexión del pool"""
+
+
+def conexion_viva(conexion):
+    """Verifica si una conexión sigue abierta (MySQL expone is_connected)"""
+    verificar = getattr(conexion, 'is_connected', None)
+    if verificar is None:
+        return True
+    try:
+        return verificar()
+    except Exception:
+        return False
+
+
+def cerrar_conexion(conexion):
+    """Cierra una conexión ignorando errores de una conexión ya caída"""
+    try:
+        conexion.close()
+    except Exception:
+        pass
+
+
+class PoolConexiones:
+    """Mantiene un número acotado de conexiones reutilizables
+
+    Las conexiones se abren bajo demanda, se validan antes de reutilizarse
+    si llevan un rato sin usarse y se cierran solas tras `inactividad`
+    segundos, así un juego abierto en el menú no retiene conexiones.
+    """
+
+    def __init__(self, fabrica, tamano=2, inactividad=60.0, validar_tras=5.0, espera=5.0):
+        self.fabrica = fabrica
+        self.tamano = tamano
+        self.inactividad = inactividad
+        self.validar_tras = validar_tras
+        self.espera = espera
+
+        self._libres = []  # (conexion, instante en que se liberó)
+        self._en_uso = 0
+        self._cerrado = False
+        self._condicion = threading.Condition()
+        self._temporizador = None
+
+    def obtener(self):
+        """Entrega una conexión válida, reutilizando una libre o creando otra"""
+        limite = time.monotonic() + self.espera
+
+        with self._condicion:
+            while True:
+                if self._cerrado:
+                    raise ErrorConexion("El pool de conexiones está cerrado")
+                if self._libres:
+                    conexion, liberada = self._libres.pop()
+                    break
+                if self._en_uso < self.tamano:
+                    conexion, liberada = None, None
+                    break
+
+                restante = limite - time.monotonic()
+                if restante <= 0:
+                    raise ErrorConexion("No hay conexiones libres en el pool")
+                self._condicion.wait(restante)
+
+            self._en_uso += 1
+
+        # Validar o abrir la conexión fuera del candado
+        try:
+            if conexion is not None and time.monotonic() - liberada > self.validar_tras:
+                if not conexion_viva(conexion):
+                    cerrar_conexion(conexion)
+                    conexion = None
+
+            if conexion is None:
+                conexion = self.fabrica()
+        except BaseException:
+            with self._condicion:
+                self._en_uso -= 1
+                self._condicion.notify()
+            raise
+
+        return conexion
+
+    def liberar(self, conexion, descartar=False):
+        """Devuelve una conexión al pool, o la cierra si está dañada"""
+        with self._condicion:
+            self._en_uso -= 1
+
+            if descartar or self._cerrado:
+                cerrar_conexion(conexion)
+            else:
+                self._libres.append((conexion, time.monotonic()))
+                self._programar_poda()
+
+            self._condicion.notify()
+
+    def podar(self):
+        """Cierra las conexiones que llevan demasiado tiempo sin usarse"""
+        with self._condicion:
+            self._temporizador = None
+            if self.inactividad is None:
+                return
+
+            ahora = time.monotonic()
+            conservar = []
+            for conexion, liberada in self._libres:
+                if ahora - liberada >= self.inactividad:
+                    cerrar_conexion(conexion)
+                else:
+                    conservar.append((conexion, liberada))
+            self._libres = conservar
+            self._programar_poda()
+
+    def _programar_poda(self):
+        """Agenda la próxima poda si hay conexiones libres (requiere el candado)"""
+        if self.inactividad is None or self._temporizador or not self._libres:
+            return
+
+        self._temporizador = threading.Timer(self.inactividad, self.podar)
+        self._temporizador.daemon = True
+        self._temporizador.start()
+
+    def cerrar(self):
+        """Cierra todas las conexiones libres y rechaza nuevas peticiones"""
+        with self._condicion:
+            self._cerrado = True
+            if self._temporizador:
+                self._temporizador.cancel()
+                self._temporizador = None
+
+            for conexion, _ in self._libres:
+                cerrar_conexion(conexion)
+            self._libres = []
+            self._condicion.notify_all()
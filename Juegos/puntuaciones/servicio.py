@@ -0,0 +1,600 @@
+"""Servicio de puntuaciones compartido por todos los juegos"""
+import sqlite3
+from .pool import PoolConexiones, ErrorConexion, conexion_viva
+from .escritor import EscritorPuntuaciones
+from .diario import DiarioPuntuaciones
+from .cache import CacheClasificaciones
+
+try:
+    import mysql.connector
+    from mysql.connector import Error as MySQLError
+except ImportError:
+    mysql = None
+    MySQLError = None
+
+
+# Por qué falló una transacción (ver ServicioPuntuaciones._intentar)
+SIN_CONEXION = 'sin_conexion'  # La base no respondió: tiene sentido reintentar más tarde
+RECHAZADO = 'rechazado'        # La base rechazó la operación (esquema, datos): fallaría igual
+INCIERTO = 'incierto'          # Se cortó durante el commit: pudo haberse guardado
+
+
+def fabrica_mysql(db_config):
+    """Retorna una función que abre conexiones MySQL con la configuración dada"""
+    def conectar():
+        if mysql is None:
+            raise ErrorConexion("mysql-connector-python no está instalado")
+        return mysql.connector.connect(**db_config)
+    return conectar
+
+
+class ServicioPuntuaciones:
+    """Operaciones de puntuaciones sobre un pool de conexiones
+
+    Los juegos heredan de esta clase en su db.py y solo ajustan sus
+    particularidades (nombre del juego, variante, orden del ranking).
+
+    La variante distingue modos, niveles o pistas de un mismo juego
+    (columna scores.variant); es una cadena vacía en juegos sin modos.
+    """
+
+    # En juegos de tiempo o movimientos gana la puntuación más baja
+    menor_es_mejor = False
+
+    # Registrar el juego en la tabla games si todavía no existe
+    crear_juegos = False
+
+    def __init__(self, db_config=None, fabrica=None, marcador='%s', tamano_pool=2,
+                 inactividad=60.0, diferir_escrituras=True, ruta_diario=None,
+                 ttl_clasificaciones=30.0):
+        self.fabrica = fabrica or fabrica_mysql(db_config or {})
+        self.marcador = marcador
+        self.pool = PoolConexiones(self._abrir_conexion, tamano=tamano_pool,
+                                   inactividad=inactividad)
+
+        # Las pantallas de récords leen de memoria; guardar invalida el juego
+        self.cache = CacheClasificaciones(ttl_clasificaciones)
+
+        # Sin conexión las puntuaciones se anotan en un diario local
+        self.diario = DiarioPuntuaciones(ruta_diario) if ruta_diario else None
+
+        # Las puntuaciones se guardan en segundo plano para no frenar el juego
+        self.escritor = None
+        if diferir_escrituras:
+            self.escritor = EscritorPuntuaciones(
+                self._guardar_lote,
+                respaldar=self.diario.agregar if self.diario else None,
+                reproducir=self._reproducir_diario if self.diario else None
+            )
+            # Recuperar lo que quedó pendiente de una ejecución anterior
+            if self.diario and self.diario.hay_pendientes():
+                self.escritor.iniciar(reproducir_pendiente=True)
+
+        self.errores = (ErrorConexion, sqlite3.Error)
+        if MySQLError is not None:
+            self.errores += (MySQLError,)
+
+        # Errores de la conexión (no de los datos ni del esquema)
+        self.errores_conexion = (ErrorConexion,)
+        if mysql is not None:
+            self.errores_conexion += (mysql.connector.InterfaceError,
+                                      mysql.connector.OperationalError)
+
+        # Los ids no cambian durante la partida: se consultan una sola vez
+        self._game_ids = {}
+        self._user_ids = {}
+
+    # ------------------------------------------------------------------
+    # Conexión
+    # ------------------------------------------------------------------
+
+    def _abrir_conexion(self):
+        """Abre una conexión nueva para el pool"""
+        return self.fabrica()
+
+    def conectar(self):
+        """Verifica que se pueda abrir una conexión con la base de datos"""
+        return self._ejecutar(lambda cursor: True, "Error al conectar a la base de datos",
+                              False, solo_lectura=True)
+
+    def cerrar(self):
+        """Guarda las puntuaciones pendientes y cierra las conexiones del pool"""
+        if self.escritor is not None:
+            self.escritor.cerrar()
+        if self.diario is not None:
+            self.diario.cerrar()
+        self.pool.cerrar()
+        print("✓ Conexión cerrada")
+
+    def _sql(self, query):
+        """Adapta los marcadores %s al estilo del driver en uso"""
+        if self.marcador == '%s':
+            return query
+        return query.replace('%s', self.marcador)
+
+    def _ejecutar(self, operacion, mensaje_error, por_defecto=None, solo_lectura=False):
+        """Ejecuta operacion(cursor) en una transacción; si falla retorna por_defecto"""
+        error, resultado = self._intentar(operacion, mensaje_error, solo_lectura)
+        return por_defecto if error else resultado
+
+    def _intentar(self, operacion, mensaje_error, solo_lectura=False):
+        """Ejecuta operacion(cursor) en una transacción con una conexión del pool
+
+        Retorna (error, resultado) con error None, SIN_CONEXION, RECHAZADO o
+        INCIERTO. Si la conexión estaba caída se descarta y se reintenta una
+        vez con una conexión nueva. Una escritura que falla durante el commit
+        no se reintenta: el servidor pudo haberla confirmado y repetirla
+        duplicaría filas.
+        """
+        for intento in range(2):
+            try:
+                conexion = self.pool.obtener()
+            except self.errores as e:
+                print(f"✗ Error al conectar a la base de datos: {e}")
+                return SIN_CONEXION, None
+
+            confirmando = False
+            try:
+                cursor = conexion.cursor()
+                try:
+                    resultado = operacion(cursor)
+                finally:
+                    cursor.close()
+                confirmando = True
+                conexion.commit()
+            except self.errores as e:
+                # Los ids cacheados en esta transacción pueden no existir tras el rollback
+                self._user_ids.clear()
+                self._game_ids.clear()
+
+                viva = conexion_viva(conexion)
+                if viva:
+                    try:
+                        conexion.rollback()
+                    except self.errores:
+                        viva = False
+                self.pool.liberar(conexion, descartar=not viva)
+
+                if not viva and intento == 0 and (solo_lectura or not confirmando):
+                    print("⚠ Reconectando a la base de datos...")
+                    continue
+
+                print(f"✗ {mensaje_error}: {e}")
+                if not viva and confirmando and not solo_lectura:
+                    return INCIERTO, None
+                if not viva or self._error_de_conexion(e):
+                    return SIN_CONEXION, None
+                return RECHAZADO, None
+
+            self.pool.liberar(conexion)
+            return None, resultado
+
+        return SIN_CONEXION, None
+
+    def _error_de_conexion(self, error):
+        """Verifica si un error se debe a la conexión y no a los datos o al esquema"""
+        if isinstance(error, self.errores_conexion):
+            return True
+        # SQLite usa OperationalError también para el esquema ("no such column")
+        mensaje = str(error)
+        return isinstance(error, sqlite3.OperationalError) and (
+            'locked' in mensaje or 'unable to open' in mensaje)
+
+    # ------------------------------------------------------------------
+    # Consultas auxiliares (operan sobre un cursor ya abierto)
+    # ------------------------------------------------------------------
+
+    def _id_usuario(self, cursor, username, crear=True):
+        """Obtiene el ID de un usuario, creándolo si se indica"""
+        user_id = self._user_ids.get(username)
+        if user_id:
+            return user_id
+
+        cursor.execute(self._sql("SELECT id FROM users WHERE username = %s"), (username,))
+        resultado = cursor.fetchone()
+
+        if resultado:
+            user_id = resultado[0]
+        elif crear:
+            cursor.execute(self._sql("INSERT INTO users (username) VALUES (%s)"), (username,))
+            user_id = cursor.lastrowid
+            print(f"✓ Nuevo usuario creado: {username}")
+        else:
+            return None
+
+        self._user_ids[username] = user_id
+        return user_id
+
+    def _id_juego(self, cursor, game_name):
+        """Obtiene el ID de un juego por su nombre"""
+        game_id = self._game_ids.get(game_name)
+        if game_id:
+            return game_id
+
+        cursor.execute(self._sql("SELECT id FROM games WHERE game_name = %s"), (game_name,))
+        resultado = cursor.fetchone()
+
+        if resultado:
+            game_id = resultado[0]
+        elif self.crear_juegos:
+            cursor.execute(self._sql("INSERT INTO games (game_name) VALUES (%s)"), (game_name,))
+            game_id = cursor.lastrowid
+        else:
+            print(f"✗ Juego '{game_name}' no encontrado en la base de datos")
+            return None
+
+        self._game_ids[game_name] = game_id
+        return game_id
+
+    def _ids_usuarios(self, cursor, usernames):
+        """Obtiene los IDs de varios usuarios con una sola consulta, creando los que falten"""
+        ids = {}
+        for username in usernames:
+            user_id = self._user_ids.get(username)
+            if user_id:
+                ids[username] = user_id
+        faltantes = [u for u in usernames if u not in ids]
+
+        if faltantes:
+            marcadores = ", ".join(["%s"] * len(faltantes))
+            cursor.execute(
+                self._sql(f"SELECT id, username FROM users WHERE username IN ({marcadores})"),
+                tuple(faltantes)
+            )
+            for user_id, username in cursor.fetchall():
+                ids[username] = user_id
+
+            for username in faltantes:
+                if username not in ids:
+                    ids[username] = self._id_usuario(cursor, username)
+
+        self._user_ids.update(ids)
+        return ids
+
+    def _guardar_lote(self, puntuaciones):
+        """Inserta varias puntuaciones con un único INSERT de varias filas
+
+        Retorna las puntuaciones que no se guardaron porque la base de datos
+        no responde, para que el escritor las reintente o las anote en el
+        diario. Si la base rechaza el lote se guardan de a una y se apartan
+        las rechazadas; las de juegos inexistentes se descartan.
+        """
+        def operacion(cursor):
+            filas = []
+            for username, game_name, score, variante in puntuaciones:
+                game_id = self._id_juego(cursor, game_name)
+                if game_id:
+                    filas.append((username, game_name, game_id, variante, score))
+
+            if not filas:
+                return filas
+
+            user_ids = self._ids_usuarios(cursor, {fila[0] for fila in filas})
+            valores = []
+            for username, _, game_id, variante, score in filas:
+                valores.extend((user_ids[username], game_id, variante, score))
+
+            marcadores = ", ".join(["(%s, %s, %s, %s)"] * len(filas))
+            query = f"INSERT INTO scores (user_id, game_id, variant, score) VALUES {marcadores}"
+            cursor.execute(self._sql(query), tuple(valores))
+            return filas
+
+        error, filas = self._intentar(operacion, "Error al guardar puntuación")
+        if error == SIN_CONEXION:
+            return list(puntuaciones)
+        if error == INCIERTO:
+            print(f"⚠ {len(puntuaciones)} puntuaciones pueden haberse guardado (se cortó "
+                  f"la conexión al confirmar), no se reintentan")
+            return []
+        if error == RECHAZADO:
+            if len(puntuaciones) == 1:
+                self._apartar(puntuaciones)
+                return []
+            # Una puntuación inválida no debe arrastrar al resto del lote
+            sin_guardar = []
+            for puntuacion in puntuaciones:
+                sin_guardar.extend(self._guardar_lote([puntuacion]))
+            return sin_guardar
+
+        for username, game_name, _, _, score in filas:
+            self.cache.invalidar(game_name)
+            print(f"✓ Puntuación guardada: {username} - {score} puntos en {game_name}")
+        return []
+
+    def _apartar(self, puntuaciones):
+        """Saca de circulación puntuaciones que la base de datos rechazó"""
+        if self.diario is not None and self.diario.apartar(puntuaciones):
+            print(f"⚠ {len(puntuaciones)} puntuaciones rechazadas por la base de datos, "
+                  f"apartadas en {self.diario.ruta_rechazadas}")
+        else:
+            print(f"✗ {len(puntuaciones)} puntuaciones rechazadas por la base de datos, "
+                  f"se descartan")
+
+    def _reproducir_diario(self):
+        """Vuelca en la base de datos las puntuaciones anotadas en el diario
+
+        Retorna True si el diario quedó vacío.
+        """
+        entradas, fines, posicion = self.diario.leer()
+        if not entradas:
+            if posicion:
+                self.diario.descartar(posicion)
+            return True
+
+        error, guardadas = self._volcar_diario(entradas)
+        if error == SIN_CONEXION:
+            return False
+        if error == RECHAZADO and len(entradas) > 1:
+            # Una entrada inválida no debe trabar el diario: se vuelcan de a una
+            guardadas = 0
+            for i, entrada in enumerate(entradas):
+                error, cantidad = self._volcar_diario([entrada])
+                if error == SIN_CONEXION:
+                    posicion = fines[i - 1] if i else 0
+                    break
+                guardadas += cantidad
+
+        if posicion:
+            self.diario.descartar(posicion)
+        for game_name in {entrada[1] for entrada in entradas}:
+            self.cache.invalidar(game_name)
+        if guardadas:
+            print(f"✓ {guardadas} puntuaciones recuperadas del diario")
+        return error != SIN_CONEXION
+
+    def _volcar_diario(self, entradas):
+        """Inserta entradas del diario en una transacción
+
+        Retorna (error, guardadas). Una sola entrada rechazada se aparta; si
+        se cortó la conexión al confirmar no se vuelve a intentar.
+        """
+        def operacion(cursor):
+            # Primero los juegos: las entradas de juegos inexistentes no crean usuarios
+            game_ids = {game_name: self._id_juego(cursor, game_name)
+                        for game_name in {entrada[1] for entrada in entradas}}
+            validas = [entrada for entrada in entradas if game_ids[entrada[1]]]
+            if not validas:
+                return 0
+
+            user_ids = self._ids_usuarios(cursor, {entrada[0] for entrada in validas})
+            filas = [(user_ids[username], game_ids[game_name], variante, score, created_at)
+                     for username, game_name, score, variante, created_at in validas]
+
+            query = """
+                INSERT INTO scores (user_id, game_id, variant, score, created_at)
+                VALUES (%s, %s, %s, %s, %s)
+            """
+            cursor.executemany(self._sql(query), filas)
+            return len(filas)
+
+        error, guardadas = self._intentar(operacion, "Error al recuperar el diario de puntuaciones")
+        if error is None:
+            descartadas = len(entradas) - guardadas
+            if descartadas:
+                print(f"⚠ {descartadas} puntuaciones del diario descartadas: su juego no existe")
+            return None, guardadas
+
+        if error == RECHAZADO and len(entradas) == 1:
+            self._apartar(entradas)
+        elif error == INCIERTO:
+            print(f"⚠ {len(entradas)} puntuaciones del diario pueden haberse guardado (se cortó "
+                  f"la conexión al confirmar), no se reintentan")
+        return error, 0
+
+    def _mejor_score(self, cursor, user_id, game_id, variante):
+        """Obtiene el mejor score de un usuario en un juego (None si no jugó)"""
+        funcion = "MIN" if self.menor_es_mejor else "MAX"
+        query = f"""
+            SELECT {funcion}(score) FROM scores
+            WHERE user_id = %s AND game_id = %s AND variant = %s
+        """
+        cursor.execute(self._sql(query), (user_id, game_id, variante))
+        return cursor.fetchone()[0]
+
+    # ------------------------------------------------------------------
+    # API pública
+    # ------------------------------------------------------------------
+
+    def obtener_o_crear_usuario(self, username):
+        """Obtiene el ID de un usuario o lo crea si no existe"""
+        return self._ejecutar(lambda cursor: self._id_usuario(cursor, username),
+                              "Error al obtener/crear usuario")
+
+    def obtener_game_id(self, game_name):
+        """Obtiene el ID de un juego por su nombre"""
+        return self._ejecutar(lambda cursor: self._id_juego(cursor, game_name),
+                              "Error al obtener game_id")
+
+    def guardar_puntuacion(self, username, game_name, score, variante=''):
+        """Guarda una puntuación en la base de datos
+
+        Con escritura diferida solo encola la puntuación y retorna de
+        inmediato; el guardado ocurre en el hilo del escritor. Si la base
+        de datos no responde, la puntuación queda en el diario local.
+        """
+        if self.escritor is not None:
+            return self.escritor.enviar(username, game_name, score, variante)
+
+        puntuacion = [(username, game_name, score, variante)]
+        sin_guardar = self._guardar_lote(puntuacion)
+        if not sin_guardar:
+            return True
+        return self.diario is not None and self.diario.agregar(sin_guardar)
+
+    def esperar_escrituras(self, timeout=0.5):
+        """Espera brevemente a que se guarden las puntuaciones encoladas
+
+        Se llama antes de mostrar una tabla de récords para que incluya la
+        partida recién terminada.
+        """
+        if self.escritor is None:
+            return True
+        return self.escritor.vaciar(timeout)
+
+    def obtener_top_puntuaciones(self, game_name, limite=10, variante=''):
+        """Obtiene las mejores puntuaciones de un juego en una variante
+
+        La consulta recorre el índice (game_id, variant, score). El resultado
+        se guarda en caché hasta que expire o se guarde una puntuación del
+        mismo juego.
+        """
+        clave = (game_name, variante, limite)
+        resultados = self.cache.obtener(clave)
+        if resultados is not None:
+            return resultados
+        generacion = self.cache.generacion(game_name)
+
+        def operacion(cursor):
+            game_id = self._id_juego(cursor, game_name)
+            if not game_id:
+                return []
+
+            orden = "ASC" if self.menor_es_mejor else "DESC"
+            query = f"""
+                SELECT u.username, s.score, s.created_at
+                FROM scores s
+                JOIN users u ON s.user_id = u.id
+                WHERE s.game_id = %s AND s.variant = %s
+                ORDER BY s.score {orden}
+                LIMIT %s
+            """
+            cursor.execute(self._sql(query), (game_id, variante, limite))
+            return cursor.fetchall()
+
+        resultados = self._ejecutar(operacion, "Error al obtener puntuaciones", solo_lectura=True)
+        if resultados is None:
+            return []
+
+        self.cache.guardar(clave, resultados, generacion)
+        return resultados
+
+    def obtener_mejores_por_variante(self, game_name):
+        """Obtiene la mejor puntuación de cada variante de un juego
+
+        Retorna {variante: score} con una sola consulta agrupada, para
+        menús que muestran el récord de todos los modos a la vez.
+        """
+        clave = (game_name, 'mejores_por_variante')
+        mejores = self.cache.obtener(clave)
+        if mejores is not None:
+            return mejores
+        generacion = self.cache.generacion(game_name)
+
+        def operacion(cursor):
+            game_id = self._id_juego(cursor, game_name)
+            if not game_id:
+                return {}
+
+            funcion = "MIN" if self.menor_es_mejor else "MAX"
+            query = f"""
+                SELECT variant, {funcion}(score)
+                FROM scores
+                WHERE game_id = %s
+                GROUP BY variant
+            """
+            cursor.execute(self._sql(query), (game_id,))
+            return dict(cursor.fetchall())
+
+        mejores = self._ejecutar(operacion, "Error al obtener mejores puntuaciones",
+                                 solo_lectura=True)
+        if mejores is None:
+            return {}
+
+        self.cache.guardar(clave, mejores, generacion)
+        return mejores
+
+    def obtener_mejor_puntuacion(self, username, game_name, variante='', por_defecto=0):
+        """Obtiene la mejor puntuación de un jugador (0 si no jugó)
+
+        Si la consulta falla retorna por_defecto; con por_defecto=None quien
+        llama distingue "todavía no jugó" de "no se pudo consultar".
+        """
+        def operacion(cursor):
+            user_id = self._id_usuario(cursor, username, crear=False)
+            game_id = self._id_juego(cursor, game_name)
+            if not user_id or not game_id:
+                return 0
+
+            return self._mejor_score(cursor, user_id, game_id, variante) or 0
+
+        return self._ejecutar(operacion, "Error al obtener mejor puntuación", por_defecto,
+                              solo_lectura=True)
+
+    def verificar_nuevo_record(self, username, game_name, score, variante=''):
+        """Verifica si el score es un nuevo récord personal"""
+        def operacion(cursor):
+            game_id = self._id_juego(cursor, game_name)
+            if not game_id:
+                return False
+
+            user_id = self._id_usuario(cursor, username, crear=False)
+            if not user_id:
+                return True  # Si es nuevo usuario, es su primer récord
+
+            mejor = self._mejor_score(cursor, user_id, game_id, variante)
+            if mejor is None:
+                return True  # Primera partida
+
+            return score < mejor if self.menor_es_mejor else score > mejor
+
+        return self._ejecutar(operacion, "Error al verificar récord", False,
+                              solo_lectura=True)
+
+    def obtener_estadisticas_jugador(self, username, game_name, variante=''):
+        """Obtiene estadísticas de un jugador en un juego específico"""
+        def operacion(cursor):
+            user_id = self._id_usuario(cursor, username, crear=False)
+            game_id = self._id_juego(cursor, game_name)
+            if not user_id or not game_id:
+                return None
+
+            query = """
+                SELECT
+                    COUNT(*) as total_partidas,
+                    MAX(score) as mejor_puntuacion,
+                    AVG(score) as puntuacion_promedio,
+                    MIN(score) as peor_puntuacion
+                FROM scores
+                WHERE user_id = %s AND game_id = %s AND variant = %s
+            """
+            cursor.execute(self._sql(query), (user_id, game_id, variante))
+            resultado = cursor.fetchone()
+
+            if resultado and resultado[0] > 0:
+                mejor, peor = resultado[1], resultado[3]
+                if self.menor_es_mejor:
+                    mejor, peor = peor, mejor
+                return {
+                    'total_partidas': resultado[0],
+                    'mejor_puntuacion': mejor,
+                    'puntuacion_promedio': round(resultado[2], 2) if resultado[2] else 0,
+                    'peor_puntuacion': peor
+                }
+            return None
+
+        return self._ejecutar(operacion, "Error al obtener estadísticas", solo_lectura=True)
+
+    def obtener_ranking_jugador(self, username, game_name, variante=''):
+        """Obtiene la posición del jugador en el ranking global"""
+        def operacion(cursor):
+            user_id = self._id_usuario(cursor, username, crear=False)
+            game_id = self._id_juego(cursor, game_name)
+            if not user_id or not game_id:
+                return None
+
+            mejor_score = self._mejor_score(cursor, user_id, game_id, variante)
+            if mejor_score is None:
+                return None
+
+            # Contar cuántos jugadores tienen mejor score
+            comparacion = "<" if self.menor_es_mejor else ">"
+            query = f"""
+                SELECT COUNT(DISTINCT user_id) + 1
+                FROM scores
+                WHERE game_id = %s AND variant = %s
+                AND score {comparacion} %s
+            """
+            cursor.execute(self._sql(query), (game_id, variante, mejor_score))
+            return cursor.fetchone()[0]
+
+        return self._ejecutar(operacion, "Error al obtener ranking", solo_lectura=True)
@@ -0,0 +1,72 @@
+"""Base de datos SQLite local con el mismo esquema que games_db.sql y sus migraciones
+
+Permite probar el servicio de puntuaciones sin un servidor MySQL.
+"""
+import sqlite3
+from .servicio import ServicioPuntuaciones
+
+ESQUEMA = """
+CREATE TABLE IF NOT EXISTS games (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    game_name VARCHAR(50) NOT NULL UNIQUE
+);
+
+CREATE TABLE IF NOT EXISTS users (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    username VARCHAR(50) NOT NULL UNIQUE,
+    created_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP
+);
+
+CREATE TABLE IF NOT EXISTS scores (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    user_id INTEGER NOT NULL REFERENCES users (id) ON DELETE CASCADE,
+    game_id INTEGER NOT NULL REFERENCES games (id) ON DELETE CASCADE,
+    variant VARCHAR(50) NOT NULL DEFAULT '',
+    score INTEGER NOT NULL,
+    created_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP
+);
+
+CREATE INDEX IF NOT EXISTS scores_user_id ON scores (user_id);
+"""
+
+# Se crea después de migrar: una base antigua aún no tiene la columna variant
+INDICES = """
+CREATE INDEX IF NOT EXISTS scores_game_variant_score ON scores (game_id, variant, score);
+DROP INDEX IF EXISTS scores_game_id;
+"""
+
+
+def conectar_sqlite(ruta):
+    """Abre una conexión SQLite y crea las tablas si no existen"""
+    conexion = sqlite3.connect(ruta, check_same_thread=False)
+    conexion.executescript(ESQUEMA)
+
+    # Equivalente a migraciones/001_variante_puntuaciones.sql
+    columnas = [fila[1] for fila in conexion.execute("PRAGMA table_info(scores)")]
+    if 'variant' not in columnas:
+        conexion.execute("ALTER TABLE scores ADD COLUMN variant VARCHAR(50) NOT NULL DEFAULT ''")
+    conexion.executescript(INDICES)
+    return conexion
+
+
+def crear_servicio_sqlite(ruta=":memory:", juegos=(), clase=ServicioPuntuaciones, **opciones):
+    """Crea un servicio de puntuaciones sobre SQLite con los juegos indicados
+
+    Una base ":memory:" vive solo mientras su conexión esté abierta, así que
+    en ese caso el pool usa una única conexión que nunca se poda.
+    """
+    en_memoria = ruta == ":memory:"
+    servicio = clase(
+        fabrica=lambda: conectar_sqlite(ruta),
+        marcador='?',
+        tamano_pool=1 if en_memoria else 2,
+        inactividad=None if en_memoria else 60.0,
+        **opciones
+    )
+
+    def registrar(cursor):
+        for game_name in juegos:
+            cursor.execute("INSERT OR IGNORE INTO games (game_name) VALUES (?)", (game_name,))
+
+    servicio._ejecutar(registrar, "Error al registrar juegos")
+    return servicio
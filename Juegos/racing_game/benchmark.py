@@ -0,0 +1,45 @@
+"""Benchmark sin ventana del bucle de Racing Game
+
+El coche del jugador lo conduce la misma IA que a los rivales; al
+terminar la carrera empieza otra.
+
+Uso: python benchmark.py [--ticks N] [--json]
+"""
+import os
+import sys
+DIRECTORIO = os.path.dirname(os.path.abspath(__file__))
+sys.path.append(os.path.dirname(DIRECTORIO))  # Para importar rendimiento
+
+from rendimiento import preparar_sin_ventana, base_en_memoria, ejecutar_benchmark, argumentos, reportar
+preparar_sin_ventana()
+
+import main as racing
+from config import *
+from ai import AIController
+
+
+def main():
+    args = argumentos("Benchmark sin ventana de Racing Game")
+    base_en_memoria(racing, juegos=[GAME_NAME])
+    juego = racing.RacingGame()
+    dt = 1000 / FPS  # El juego mide dt en milisegundos
+    piloto = None
+    
+    def entrada(tick):
+        nonlocal piloto
+        if juego.state != "race":
+            juego.start_race()
+            piloto = AIController(juego.player_car, juego.track, 0.6)
+        piloto.update(dt, [juego.player_car] + juego.ai_cars)
+    
+    def actualizar():
+        juego.update(dt)
+    
+    resultado = ejecutar_benchmark("Racing Game", actualizar, juego.draw, entrada,
+                                   args.ticks, args.calentamiento, args.memoria, args.semilla)
+    juego.db_manager.cerrar()
+    reportar(resultado, args.json)
+
+
+if __name__ == "__main__":
+    main()
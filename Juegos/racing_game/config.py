@@ -11,7 +11,8 @@ DB_CONFIG = {
 # Configuración de pantalla
 SCREEN_WIDTH = 1200
 SCREEN_HEIGHT = 800
-FPS = 60
+FPS = 60  # Pasos de simulación por segundo
+RENDER_FPS = 60  # Límite de frames dibujados (p. ej. 144 en monitores rápidos; 0 = sin límite)
 TILE_SIZE = 32
 
 # Colores
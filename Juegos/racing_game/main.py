@@ -2,6 +2,7 @@
 Juego completo de carreras con IA, física realista y múltiples pistas
 """
 import pygame
+import os
 import sys
 from config import *
 from db import DatabaseManager
@@ -11,6 +12,9 @@ from ai import AIController
 from particles import ParticleSystem
 from sounds import SoundManager
 
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))  # Para importar motor
+from motor import BucleFijo, Interpolador
+
 
 class Camera:
     """Cámara que sigue al jugador"""
@@ -44,6 +48,10 @@ class RacingGame:
         pygame.display.set_caption("Racing Game - Top-Down")
         self.clock = pygame.time.Clock()
         
+        # Simulación a paso fijo y dibujo interpolado entre pasos
+        self.bucle = BucleFijo(FPS, RENDER_FPS, reloj=self.clock)
+        self.interpolador = Interpolador('x', 'y')
+        
         # Fuentes
         self.font_large = pygame.font.Font(None, 72)
         self.font_medium = pygame.font.Font(None, 48)
@@ -470,11 +478,18 @@ class RacingGame:
         running = True
         
         while running:
-            dt = self.clock.tick(FPS)
+            pasos = self.bucle.frame()
             
             running = self.handle_events()
-            self.update(dt)
-            self.draw()
+            for _ in range(pasos):
+                if self.player_car:
+                    self.interpolador.guardar(
+                        [self.player_car, self.camera] + self.ai_cars)
+                # La física del juego trabaja en milisegundos
+                self.update(self.bucle.paso * 1000)
+            
+            with self.interpolador.aplicar(self.bucle.alpha):
+                self.draw()
             
         self.db_manager.cerrar()
         pygame.quit()
@@ -1,8 +1,31 @@
 """Sistema de sonidos para el juego de carreras"""
+import os
+import sys
 import pygame
 import numpy as np
 import math
 
+DIRECTORIO = os.path.dirname(os.path.abspath(__file__))
+sys.path.append(os.path.dirname(DIRECTORIO))  # Para importar banco_sonidos
+from banco_sonidos import cargar_sonidos
+
+# Sonidos ya generados; se rehacen si cambian las recetas o este archivo
+SOUND_BANK = os.path.join(DIRECTORIO, 'sonidos.bank')
+
+# Generador y parámetros de cada sonido
+SOUND_RECIPES = {
+    'engine_low': ['engine_sound', 0.8],  # Motor
+    'engine_mid': ['engine_sound', 1.2],
+    'engine_high': ['engine_sound', 1.6],
+    'crash': ['sequence', [200, 300, 150, 250], 0.15, 0.3, 'square'],  # Choque - sonido metálico
+    'drift': ['tone', 150, 0.3, 0.2, 'sawtooth'],  # Derrape - ruido continuo
+    'checkpoint': ['tone', 800, 0.1, 0.25],  # Checkpoint - beep
+    'lap_complete': ['sequence', [600, 700, 800], 0.15, 0.2],  # Vuelta completada - secuencia
+    'victory': ['sequence', [523, 659, 784, 1047, 1175], 0.2, 0.2],  # Victoria: Do, Mi, Sol, Do, Re
+    'button': ['tone', 440, 0.05, 0.15],  # Botón
+    'music': ['music'],  # Música de fondo
+}
+
 
 class SoundManager:
     """Maneja todos los sonidos del juego"""
@@ -14,6 +37,7 @@ class SoundManager:
         self.volume = 0.5
         self.engine_sound = None
         self.engine_channel = None
+        self.music_buffer = None
         self._generate_sounds()
         
     def _generate_tone(self, frequency, duration, volume=0.3, wave_type='sine'):
@@ -50,7 +74,7 @@ class SoundManager:
         wave = np.int16(wave * 32767)
         stereo_wave = np.column_stack((wave, wave))
         
-        return pygame.sndarray.make_sound(stereo_wave)
+        return stereo_wave
         
     def _generate_engine_sound(self, rpm_factor=1.0):
         """Genera sonido de motor continuo"""
@@ -87,52 +111,53 @@ class SoundManager:
         wave = np.int16(wave * 32767)
         stereo_wave = np.column_stack((wave, wave))
         
-        return pygame.sndarray.make_sound(stereo_wave)
+        return stereo_wave
+        
+    def _generate_sequence(self, frequencies, duration, volume, wave_type='sine'):
+        """Genera una secuencia de tonos, uno tras otro"""
+        return np.concatenate([self._generate_tone(freq, duration, volume, wave_type)
+                               for freq in frequencies])
+        
+    def _generate_music(self):
+        """Genera la música ambiental de fondo"""
+        sample_rate = 22050
+        duration = 8.0
+        n_samples = int(sample_rate * duration)
+        
+        t = np.linspace(0, duration, n_samples)
+        
+        # Acordes simples
+        chord1 = (
+            np.sin(2 * np.pi * 220 * t) * 0.15 +  # A
+            np.sin(2 * np.pi * 277 * t) * 0.12 +  # C#
+            np.sin(2 * np.pi * 330 * t) * 0.12    # E
+        )
+        
+        # Modulación lenta
+        modulation = np.sin(2 * np.pi * 0.5 * t) * 0.3 + 0.7
+        wave = chord1 * modulation
+        
+        # Fade
+        fade = int(0.5 * sample_rate)
+        wave[:fade] *= np.linspace(0, 1, fade)
+        wave[-fade:] *= np.linspace(1, 0, fade)
+        
+        wave = np.int16(wave * 32767)
+        return np.column_stack((wave, wave))
+        
+    def _synthesize(self, name, recipe):
+        """Genera las muestras de un sonido a partir de su receta"""
+        kind, *params = recipe
+        return getattr(self, f'_generate_{kind}')(*params)
         
     def _generate_sounds(self):
-        """Genera todos los efectos de sonido"""
+        """Carga los efectos de sonido del banco en disco, generándolos si hace falta"""
         try:
-            # Motor
-            self.sounds['engine_low'] = self._generate_engine_sound(0.8)
-            self.sounds['engine_mid'] = self._generate_engine_sound(1.2)
-            self.sounds['engine_high'] = self._generate_engine_sound(1.6)
-            
-            # Choque - sonido metálico
-            crash_samples = []
-            for freq in [200, 300, 150, 250]:
-                tone = self._generate_tone(freq, 0.15, 0.3, 'square')
-                samples = pygame.sndarray.samples(tone)
-                crash_samples.append(np.array(samples, copy=True))
-            combined = np.concatenate(crash_samples)
-            self.sounds['crash'] = pygame.sndarray.make_sound(combined)
-            
-            # Derrape - ruido continuo
-            self.sounds['drift'] = self._generate_tone(150, 0.3, 0.2, 'sawtooth')
-            
-            # Checkpoint - beep
-            self.sounds['checkpoint'] = self._generate_tone(800, 0.1, 0.25)
-            
-            # Vuelta completada - secuencia
-            lap_samples = []
-            for freq in [600, 700, 800]:
-                tone = self._generate_tone(freq, 0.15, 0.2)
-                samples = pygame.sndarray.samples(tone)
-                lap_samples.append(np.array(samples, copy=True))
-            combined = np.concatenate(lap_samples)
-            self.sounds['lap_complete'] = pygame.sndarray.make_sound(combined)
-            
-            # Victoria
-            victory_samples = []
-            melody = [523, 659, 784, 1047, 1175]  # Do, Mi, Sol, Do, Re
-            for freq in melody:
-                tone = self._generate_tone(freq, 0.2, 0.2)
-                samples = pygame.sndarray.samples(tone)
-                victory_samples.append(np.array(samples, copy=True))
-            combined = np.concatenate(victory_samples)
-            self.sounds['victory'] = pygame.sndarray.make_sound(combined)
-            
-            # Botón
-            self.sounds['button'] = self._generate_tone(440, 0.05, 0.15)
+            buffers = cargar_sonidos(SOUND_BANK, SOUND_RECIPES, self._synthesize,
+                                     origen=os.path.abspath(__file__))
+            self.music_buffer = buffers.pop('music')
+            for name, buffer in buffers.items():
+                self.sounds[name] = pygame.sndarray.make_sound(buffer)
             
             print("✓ Sonidos generados exitosamente")
         except Exception as e:
@@ -178,33 +203,8 @@ class SoundManager:
         """Inicia música de fondo"""
         if not self.music_playing:
             try:
-                # Crear música ambiental
-                sample_rate = 22050
-                duration = 8.0
-                n_samples = int(sample_rate * duration)
-                
-                t = np.linspace(0, duration, n_samples)
-                
-                # Acordes simples
-                chord1 = (
-                    np.sin(2 * np.pi * 220 * t) * 0.15 +  # A
-                    np.sin(2 * np.pi * 277 * t) * 0.12 +  # C#
-                    np.sin(2 * np.pi * 330 * t) * 0.12    # E
-                )
-                
-                # Modulación lenta
-                modulation = np.sin(2 * np.pi * 0.5 * t) * 0.3 + 0.7
-                wave = chord1 * modulation
-                
-                # Fade
-                fade = int(0.5 * sample_rate)
-                wave[:fade] *= np.linspace(0, 1, fade)
-                wave[-fade:] *= np.linspace(1, 0, fade)
-                
-                wave = np.int16(wave * 32767)
-                stereo_wave = np.column_stack((wave, wave))
-                
-                music = pygame.sndarray.make_sound(stereo_wave)
+                # Música ambiental, ya generada en el banco
+                music = pygame.sndarray.make_sound(self.music_buffer)
                 music.set_volume(self.volume * 0.3)
                 music.play(loops=-1)
                 self.music_playing = True
@@ -0,0 +1,7 @@
+"""Herramientas para medir el rendimiento de los juegos sin ventana
+
+Cada juego tiene un benchmark.py que crea el juego con el driver de vídeo
+"dummy" de SDL, lo maneja con entrada programada y mide su bucle.
+"""
+from .sin_ventana import preparar_sin_ventana, base_en_memoria
+from .medidor import ejecutar_benchmark, argumentos, reportar
@@ -0,0 +1,125 @@
+"""Medición del bucle de un juego: ticks/s, tiempos por frame y memoria"""
+import argparse
+import json
+import random
+import time
+import tracemalloc
+
+
+def argumentos(descripcion, configurar=None):
+    """Lee las opciones comunes de los benchmarks
+
+    `configurar(parser)` puede agregar opciones propias del juego.
+    """
+    parser = argparse.ArgumentParser(description=descripcion)
+    parser.add_argument("--ticks", type=int, default=600,
+                        help="ticks medidos (por defecto 600)")
+    parser.add_argument("--calentamiento", type=int, default=60,
+                        help="ticks previos sin medir (por defecto 60)")
+    parser.add_argument("--memoria", type=int, default=200,
+                        help="ticks medidos con tracemalloc (0 para omitir)")
+    parser.add_argument("--semilla", type=int, default=1,
+                        help="semilla de random para resultados reproducibles")
+    parser.add_argument("--json", action="store_true",
+                        help="imprimir el resultado como una línea JSON")
+    if configurar is not None:
+        configurar(parser)
+    return parser.parse_args()
+
+
+def percentil(valores, p):
+    """Percentil p (0-100) de una lista ya ordenada"""
+    if not valores:
+        return 0.0
+    return valores[min(len(valores) - 1, int(round(p / 100 * (len(valores) - 1))))]
+
+
+def ejecutar_benchmark(nombre, actualizar, renderizar, entrada=None, ticks=600,
+                       calentamiento=60, memoria=200, semilla=1):
+    """Ejecuta el bucle del juego `ticks` veces y retorna las métricas
+
+    En cada tick se llama entrada(tick), actualizar() y renderizar().
+    Los tiempos se miden sin tracemalloc; la memoria se mide después en
+    `memoria` ticks adicionales con tracemalloc activo:
+      - kb_por_frame: pico de memoria asignada durante el frame
+      - bloques_retenidos_por_frame: bloques que siguen vivos al terminarlo
+    """
+    random.seed(semilla)
+    tick = 0
+
+    def paso():
+        nonlocal tick
+        if entrada is not None:
+            entrada(tick)
+        tick += 1
+
+    for _ in range(calentamiento):
+        paso()
+        actualizar()
+        renderizar()
+
+    tiempos_actualizar = []
+    tiempos_renderizar = []
+    inicio = time.perf_counter()
+    for _ in range(ticks):
+        paso()
+        t0 = time.perf_counter()
+        actualizar()
+        t1 = time.perf_counter()
+        renderizar()
+        t2 = time.perf_counter()
+        tiempos_actualizar.append((t1 - t0) * 1000)
+        tiempos_renderizar.append((t2 - t1) * 1000)
+    total = time.perf_counter() - inicio
+
+    kb_por_frame = []
+    bloques_retenidos = []
+    if memoria > 0:
+        tracemalloc.start()
+        for _ in range(memoria):
+            paso()
+            antes = tracemalloc.get_traced_memory()[0]
+            bloques_antes = len(tracemalloc.take_snapshot().traces)
+            tracemalloc.reset_peak()
+            actualizar()
+            renderizar()
+            actual, pico = tracemalloc.get_traced_memory()
+            kb_por_frame.append((pico - antes) / 1024)
+            bloques_retenidos.append(len(tracemalloc.take_snapshot().traces) - bloques_antes)
+        tracemalloc.stop()
+
+    tiempos_actualizar.sort()
+    tiempos_renderizar.sort()
+    return {
+        'juego': nombre,
+        'ticks': ticks,
+        'ticks_por_segundo': round(ticks / total, 1) if total else 0.0,
+        'actualizar_p50_ms': round(percentil(tiempos_actualizar, 50), 4),
+        'actualizar_p99_ms': round(percentil(tiempos_actualizar, 99), 4),
+        'renderizar_p50_ms': round(percentil(tiempos_renderizar, 50), 4),
+        'renderizar_p99_ms': round(percentil(tiempos_renderizar, 99), 4),
+        'kb_por_frame': round(sum(kb_por_frame) / len(kb_por_frame), 2) if kb_por_frame else None,
+        'bloques_retenidos_por_frame': (round(sum(bloques_retenidos) / len(bloques_retenidos), 2)
+                                        if bloques_retenidos else None),
+    }
+
+
+def reportar(resultado, como_json=False):
+    """Imprime el resultado como tabla o como una línea JSON"""
+    if como_json:
+        print(json.dumps(resultado, ensure_ascii=False))
+        return
+
+    print("=" * 60)
+    print(f"⏱️  BENCHMARK SIN VENTANA: {resultado['juego']}")
+    print("=" * 60)
+    print(f"Ticks medidos:        {resultado['ticks']}")
+    print(f"Ticks por segundo:    {resultado['ticks_por_segundo']}")
+    print(f"Actualizar p50 / p99: {resultado['actualizar_p50_ms']:.3f} / "
+          f"{resultado['actualizar_p99_ms']:.3f} ms")
+    print(f"Renderizar p50 / p99: {resultado['renderizar_p50_ms']:.3f} / "
+          f"{resultado['renderizar_p99_ms']:.3f} ms")
+    if resultado['kb_por_frame'] is not None:
+        print(f"Memoria por frame:    {resultado['kb_por_frame']} KB asignados, "
+              f"{resultado['bloques_retenidos_por_frame']} bloques retenidos")
+    print("=" * 60)
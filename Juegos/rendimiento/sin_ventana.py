@@ -0,0 +1,33 @@
+"""Ejecución de los juegos sin ventana ni audio"""
+import os
+
+
+def preparar_sin_ventana():
+    """Configura SDL para no abrir ventana ni dispositivo de audio
+
+    Debe llamarse antes de importar el juego. Las pausas de pantalla
+    (pygame.time.delay/wait, p. ej. "nivel completado") no esperan, para
+    que no cuenten como tiempo de actualización.
+    """
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+    os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+
+    import pygame
+    pygame.time.delay = lambda milisegundos: 0
+    pygame.time.wait = lambda milisegundos: 0
+
+
+def base_en_memoria(modulo, juegos=()):
+    """Hace que el juego use una base SQLite en memoria en lugar de MySQL
+
+    `modulo` es el módulo principal del juego, que importó DatabaseManager
+    de su db.py. Así las partidas del benchmark no llegan a la base real
+    ni al diario local.
+    """
+    from puntuaciones import crear_servicio_sqlite
+
+    clase = modulo.DatabaseManager
+    modulo.DatabaseManager = lambda: crear_servicio_sqlite(
+        juegos=juegos, clase=clase, ruta_diario=None
+    )
@@ -0,0 +1,41 @@
+"""Benchmark sin ventana del bucle de Sonic
+
+Sonic corre siempre a la derecha y salta a intervalos regulares o cuando
+se frena; al morir empieza otra partida.
+
+Uso: python benchmark.py [--ticks N] [--json]
+"""
+import os
+import sys
+DIRECTORIO = os.path.dirname(os.path.abspath(__file__))
+sys.path.append(os.path.dirname(DIRECTORIO))  # Para importar rendimiento
+
+from rendimiento import preparar_sin_ventana, base_en_memoria, ejecutar_benchmark, argumentos, reportar
+preparar_sin_ventana()
+
+import sonic_game
+
+
+def main():
+    args = argumentos("Benchmark sin ventana de Sonic")
+    base_en_memoria(sonic_game, juegos=["Sonic"])
+    juego = sonic_game.Juego()
+    juego.nueva_partida()
+    
+    def entrada(tick):
+        juego.sonic.mover_derecha()
+        if tick % 45 == 0 or abs(juego.sonic.velocidad_x) < 1:
+            juego.sonic.saltar()
+    
+    def actualizar():
+        if not juego.actualizar_logica():
+            juego.nueva_partida()
+    
+    resultado = ejecutar_benchmark("Sonic", actualizar, juego.renderizar, entrada,
+                                   args.ticks, args.calentamiento, args.memoria, args.semilla)
+    juego.db.cerrar()
+    reportar(resultado, args.json)
+
+
+if __name__ == "__main__":
+    main()
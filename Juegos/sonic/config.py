@@ -18,7 +18,8 @@ GRIS = (128, 128, 128)
 CYAN = (0, 255, 255)
 
 # Configuración del juego
-FPS = 60
+FPS = 60  # Pasos de simulación por segundo
+FPS_DIBUJO = 60  # Límite de frames dibujados (p. ej. 144 en monitores rápidos; 0 = sin límite)
 
 # Física del jugador
 GRAVEDAD = 0.8
@@ -1,5 +1,6 @@
 """Juego Sonic - Archivo principal con lógica de juego y ejecución"""
 import pygame
+import os
 import sys
 from config import *
 from sonic import Sonic
@@ -7,22 +8,10 @@ from nivel import Nivel
 from camara import Camara
 from renderizador import Renderizador
 from sprite_manager import SpriteManager
+from db import DatabaseManager
 
-# Intentar importar DatabaseManager
-try:
-    from db import DatabaseManager
-    DB_DISPONIBLE = True
-except ImportError:
-    DB_DISPONIBLE = False
-    print("⚠ Base de datos no disponible.")
-    
-    class DatabaseManager:
-        def __init__(self):
-            pass
-        def guardar_puntuacion(self, *args):
-            return False
-        def cerrar(self):
-            pass
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))  # Para importar motor
+from motor import BucleFijo, Interpolador
 
 
 class Juego:
@@ -33,9 +22,12 @@ class Juego:
         self.ventana = pygame.display.set_mode((ANCHO, ALTO))
         pygame.display.set_caption("Sonic The Hedgehog")
         self.clock = pygame.time.Clock()
+        # Simulación a paso fijo y dibujo interpolado entre pasos
+        self.bucle = BucleFijo(FPS, FPS_DIBUJO, reloj=self.clock)
+        self.interpolador = Interpolador('x', 'y', 'offset_x')
         self.sprite_manager = SpriteManager()
         self.renderizador = Renderizador(self.ventana, self.sprite_manager)
-        self.db = DatabaseManager() if DB_DISPONIBLE else None
+        self.db = DatabaseManager()
         self.jugando = True
     
     def pantalla_inicio(self):
@@ -75,13 +67,6 @@ class Juego:
                 if evento.key == pygame.K_ESCAPE:
                     return False
         
-        # Movimiento continuo
-        teclas = pygame.key.get_pressed()
-        if teclas[pygame.K_LEFT]:
-            self.sonic.mover_izquierda()
-        if teclas[pygame.K_RIGHT]:
-            self.sonic.mover_derecha()
-        
         return True
     
     def actualizar_logica(self):
@@ -92,6 +77,13 @@ class Juego:
             self.tiempo += 1
             self.frame_count = 0
         
+        # Movimiento continuo (la aceleración es por paso, no por frame dibujado)
+        teclas = pygame.key.get_pressed()
+        if teclas[pygame.K_LEFT]:
+            self.sonic.mover_izquierda()
+        if teclas[pygame.K_RIGHT]:
+            self.sonic.mover_derecha()
+        
         # Actualizar Sonic
         self.sonic.actualizar(self.nivel.plataformas)
         
@@ -203,14 +195,10 @@ class Juego:
         )
         self.renderizador.actualizar()
         
-        # Intentar guardar puntuación si la DB está disponible
-        if DB_DISPONIBLE and self.db:
-            nombre = self.pedir_nombre()
-            if nombre:
-                self.renderizador.dibujar_pantalla_guardando()
-                self.renderizador.actualizar()
-                self.db.guardar_puntuacion(nombre, self.anillos_recolectados, self.tiempo)
-                pygame.time.delay(1000)
+        # Guardar puntuación (sin conexión queda en el diario local)
+        nombre = self.pedir_nombre()
+        if nombre:
+            self.db.guardar_puntuacion(nombre, self.anillos_recolectados, self.tiempo)
         
         pygame.time.delay(3000)
     
@@ -225,8 +213,10 @@ class Juego:
             
             # Bucle de juego
             jugando_nivel = True
+            self.bucle.reiniciar()
+            self.interpolador.olvidar()
             while jugando_nivel:
-                self.clock.tick(FPS)
+                pasos = self.bucle.frame()
                 
                 # Manejar eventos
                 if not self.manejar_eventos():
@@ -234,19 +224,25 @@ class Juego:
                     self.jugando = False
                     break
                 
-                # Actualizar lógica
-                if not self.actualizar_logica():
-                    jugando_nivel = False
+                # Actualizar lógica a paso fijo
+                for _ in range(pasos):
+                    self.interpolador.guardar(
+                        [self.sonic, self.camara] + self.nivel.obtener_enemigos_vivos())
+                    if not self.actualizar_logica():
+                        jugando_nivel = False
+                        break
+                
+                if not jugando_nivel:
                     self.game_over()
                     self.jugando = False
                     break
                 
                 # Renderizar
-                self.renderizar()
+                with self.interpolador.aplicar(self.bucle.alpha):
+                    self.renderizar()
         
         # Cerrar
-        if self.db:
-            self.db.cerrar()
+        self.db.cerrar()
         pygame.quit()
         sys.exit()
 
@@ -0,0 +1,49 @@
+"""Benchmark sin ventana del bucle de Space Invaders
+
+La nave se coloca bajo el alien vivo más cercano y dispara sin parar;
+al perder empieza otra partida.
+
+Uso: python benchmark.py [--ticks N] [--json]
+"""
+import os
+import sys
+DIRECTORIO = os.path.dirname(os.path.abspath(__file__))
+sys.path.append(os.path.dirname(DIRECTORIO))  # Para importar rendimiento
+
+from rendimiento import preparar_sin_ventana, base_en_memoria, ejecutar_benchmark, argumentos, reportar
+preparar_sin_ventana()
+
+import space_invaders
+
+
+def main():
+    args = argumentos("Benchmark sin ventana de Space Invaders")
+    base_en_memoria(space_invaders, juegos=["Space Invaders"])
+    juego = space_invaders.Juego()
+    juego.nueva_partida()
+    
+    def entrada(tick):
+        jugador = juego.jugador
+        centro = jugador.x + jugador.ancho // 2
+        vivos = juego.aliens.obtener_aliens_vivos()
+        if vivos:
+            alien = min(vivos, key=lambda a: abs(a.x + a.ancho // 2 - centro))
+            objetivo = alien.x + alien.ancho // 2
+            if objetivo < centro - jugador.velocidad:
+                jugador.mover_izquierda()
+            elif objetivo > centro + jugador.velocidad:
+                jugador.mover_derecha()
+        juego.disparar()
+    
+    def actualizar():
+        if not juego.actualizar_logica() or juego.vidas <= 0:
+            juego.nueva_partida()
+    
+    resultado = ejecutar_benchmark("Space Invaders", actualizar, juego.renderizar, entrada,
+                                   args.ticks, args.calentamiento, args.memoria, args.semilla)
+    juego.db.cerrar()
+    reportar(resultado, args.json)
+
+
+if __name__ == "__main__":
+    main()
@@ -10,22 +10,7 @@ from alien import GrupoAliens
 from disparo import Disparo
 from barrera import Barrera
 from renderizador import Renderizador
-
-# Intentar importar DatabaseManager
-try:
-    from db import DatabaseManager
-    DB_DISPONIBLE = True
-except ImportError:
-    DB_DISPONIBLE = False
-    print("⚠ Base de datos no disponible. El juego funcionará sin guardar puntuaciones.")
-    
-    class DatabaseManager:
-        def __init__(self):
-            pass
-        def guardar_puntuacion(self, *args):
-            return False
-        def cerrar(self):
-            pass
+from db import DatabaseManager
 
 
 class Juego:
@@ -37,7 +22,7 @@ class Juego:
         pygame.display.set_caption("Space Invaders")
         self.clock = pygame.time.Clock()
         self.renderizador = Renderizador(self.ventana)
-        self.db = DatabaseManager() if DB_DISPONIBLE else None
+        self.db = DatabaseManager()
         self.jugando = True
     
     def pantalla_inicio(self):
@@ -220,15 +205,11 @@ class Juego:
     
     def game_over(self):
         """Maneja la pantalla de game over y guarda puntuación si corresponde"""
-        # Si hay puntuación y DB disponible, pedir nombre y guardar
-        if self.puntuacion > 0 and DB_DISPONIBLE and self.db:
+        # Si hay puntuación, pedir nombre y guardar (sin conexión queda en el diario local)
+        if self.puntuacion > 0:
             nombre = self.pedir_nombre()
             
             if nombre:
-                self.renderizador.dibujar_pantalla_guardando()
-                self.renderizador.actualizar()
-                pygame.time.delay(500)
-                
                 self.db.guardar_puntuacion(nombre, "Space Invaders", self.puntuacion)
         
         # Mostrar pantalla de game over
@@ -281,8 +262,7 @@ class Juego:
                 self.jugando = self.game_over()
         
         # Cerrar conexión a la base de datos
-        if self.db:
-            self.db.cerrar()
+        self.db.cerrar()
         pygame.quit()
 
 
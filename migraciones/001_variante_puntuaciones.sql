@@ -0,0 +1,69 @@
+-- Migración 001: modo/nivel/pista de cada puntuación en su propia columna
+--
+-- Snake, Memory Game y Racing Game guardaban el modo dentro del nombre de
+-- usuario ("ZZZ-Velocidad", "Ana-Nivel2", "Ana-track1") y filtraban con
+-- LIKE '%-Modo', lo que recorría scores y users completos y creaba un
+-- usuario por cada combinación de iniciales y modo.
+--
+-- Esta migración:
+--   1. Añade scores.variant (cadena vacía en juegos sin modos).
+--   2. Rellena variant con el sufijo del nombre de usuario.
+--   3. Reasigna esas puntuaciones al usuario sin sufijo.
+--   4. Crea el índice (game_id, variant, score) para los top-N.
+--
+-- Aplicar después de importar games_db.sql:
+--   mysql -u root games_db < migraciones/001_variante_puntuaciones.sql
+--
+-- Usa la sintaxis IF [NOT] EXISTS de MariaDB, así que puede ejecutarse de
+-- nuevo sin efecto.
+
+SET NAMES utf8mb4;
+
+CREATE TABLE IF NOT EXISTS `schema_version` (
+  `version` int(11) NOT NULL,
+  `applied_at` timestamp NOT NULL DEFAULT current_timestamp(),
+  PRIMARY KEY (`version`)
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_general_ci;
+
+-- 1. Columna nueva
+ALTER TABLE `scores`
+  ADD COLUMN IF NOT EXISTS `variant` varchar(50) NOT NULL DEFAULT '' AFTER `game_id`;
+
+START TRANSACTION;
+
+-- 2. Rellenar con el sufijo tras el último guion (solo juegos con modos)
+UPDATE `scores` s
+JOIN `users` u ON u.`id` = s.`user_id`
+JOIN `games` g ON g.`id` = s.`game_id`
+SET s.`variant` = SUBSTRING_INDEX(u.`username`, '-', -1)
+WHERE g.`game_name` IN ('Snake', 'Memory Game', 'Racing Game')
+  AND u.`username` LIKE '%-%'
+  AND s.`variant` = '';
+
+-- 3. Usuario sin sufijo para cada "Nombre-Modo" y mover sus puntuaciones
+INSERT IGNORE INTO `users` (`username`)
+SELECT DISTINCT LEFT(u.`username`, CHAR_LENGTH(u.`username`) - CHAR_LENGTH(s.`variant`) - 1)
+FROM `scores` s
+JOIN `users` u ON u.`id` = s.`user_id`
+WHERE s.`variant` <> ''
+  AND u.`username` LIKE CONCAT('%-', s.`variant`);
+
+UPDATE `scores` s
+JOIN `users` u ON u.`id` = s.`user_id`
+JOIN `users` b
+  ON b.`username` = LEFT(u.`username`, CHAR_LENGTH(u.`username`) - CHAR_LENGTH(s.`variant`) - 1)
+SET s.`user_id` = b.`id`
+WHERE s.`variant` <> ''
+  AND u.`username` LIKE CONCAT('%-', s.`variant`);
+
+COMMIT;
+
+-- 4. Los top-N filtran por juego y variante y ordenan por score.
+--    El índice compuesto también sirve a la clave foránea de game_id.
+ALTER TABLE `scores`
+  ADD KEY IF NOT EXISTS `game_variant_score` (`game_id`, `variant`, `score`);
+
+ALTER TABLE `scores`
+  DROP KEY IF EXISTS `game_id`;
+
+INSERT IGNORE INTO `schema_version` (`version`) VALUES (1);